@@ -1,2 +1,91 @@
-from .core import *  # noqa: F403
-from .criteria import *  # noqa: F403
+import importlib as _importlib
+
+from . import criteria as _criteria
+
+# Avoid importing ``typing`` just for this flag; it is removed from the
+# namespace again below.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .core import *  # noqa: F403
+    from .budget import CriteriaTimeout, evaluation_budget  # noqa: F401
+    from .criteria import *  # noqa: F403
+    from .compiler import CompiledCriteria, compile  # noqa: F401
+    from .criteria_set import CriteriaSet  # noqa: F401
+    from .intervals import IntervalIndex, RangeWarning  # noqa: F401
+    from .json_cache import JsonCache, use_json_cache  # noqa: F401
+    from .optimizer import OptimizeResult, optimize  # noqa: F401
+    from .prefix_index import PrefixIndex  # noqa: F401
+    from .regex_set import RegexSet  # noqa: F401
+    from .substring_index import SubstringIndex  # noqa: F401
+
+del TYPE_CHECKING
+
+# The public namespace is served lazily: modules are only imported when one of
+# their names is first accessed.
+_LAZY_EXPORTS = {
+    ".core": (
+        "AndCriteria",
+        "Consumer",
+        "Criteria",
+        "InvertedCriteria",
+        "OrCriteria",
+        "XorCriteria",
+        "all_of",
+        "any_of",
+        "ensure_criteria",
+        "is_eq",
+    ),
+    **{
+        f".criteria{module}": names for module, names in _criteria._LAZY_EXPORTS.items()
+    },
+    ".budget": ("CriteriaTimeout", "evaluation_budget"),
+    ".compiler": ("CompiledCriteria", "compile"),
+    ".criteria_set": ("CriteriaSet",),
+    ".intervals": ("IntervalIndex", "RangeWarning"),
+    ".json_cache": ("JsonCache", "use_json_cache"),
+    ".optimizer": ("OptimizeResult", "optimize"),
+    ".prefix_index": ("PrefixIndex",),
+    ".regex_set": ("RegexSet",),
+    ".substring_index": ("SubstringIndex",),
+}
+
+_SUBMODULES = (
+    "budget",
+    "compiler",
+    "core",
+    "criteria_set",
+    "intervals",
+    "json_cache",
+    "optimizer",
+    "parallel",
+    "prefix_index",
+    "regex_safety",
+    "regex_set",
+    "serialize",
+    "substring_index",
+    "vectorize",
+)
+
+_MODULE_BY_NAME = {
+    name: module for module, names in _LAZY_EXPORTS.items() for name in names
+}
+
+# ``compile`` stays reachable as ``assertive.compile`` but is left out of star
+# imports, where it would shadow the builtin.
+__all__ = [name for name in _MODULE_BY_NAME if name != "compile"]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return _importlib.import_module(f".{name}", __name__)
+    module = _MODULE_BY_NAME.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,123 @@
+import contextlib
+import contextvars
+import threading
+import time
+from typing import Optional
+
+# Number of budgets active in any thread. ``run_match`` only looks up the
+# current budget while this is non-zero, so evaluation without a budget pays
+# for a single attribute lookup.
+ACTIVE = 0
+_active_lock = threading.Lock()
+
+
+class CriteriaTimeout(Exception):
+    """
+    Raised when evaluating a criteria exceeds its ``evaluation_budget``.
+
+    Attributes:
+        criteria: The criteria that was running when the budget ran out.
+        reason: Which limit was exceeded.
+    """
+
+    def __init__(self, criteria, reason: str):
+        super().__init__(
+            f"{criteria.__class__.__name__} exceeded the evaluation budget: {reason}"
+        )
+        self.criteria = criteria
+        self.reason = reason
+
+
+class _Budget:
+    __slots__ = ("parent", "seconds", "deadline", "steps", "remaining")
+
+    def __init__(
+        self,
+        parent: Optional["_Budget"],
+        seconds: Optional[float],
+        steps: Optional[int],
+    ):
+        self.parent = parent
+        self.seconds = seconds
+        self.deadline = None if seconds is None else time.monotonic() + seconds
+        self.steps = steps
+        self.remaining = steps
+
+    def charge(self, criteria, steps: int) -> None:
+        budget = self
+        while budget is not None:
+            if budget.remaining is not None:
+                budget.remaining -= steps
+                if budget.remaining < 0:
+                    raise CriteriaTimeout(criteria, f"more than {budget.steps} steps")
+            if budget.deadline is not None and time.monotonic() > budget.deadline:
+                raise CriteriaTimeout(criteria, f"more than {budget.seconds}s")
+            budget = budget.parent
+
+
+_BUDGET: contextvars.ContextVar[Optional[_Budget]] = contextvars.ContextVar(
+    "evaluation_budget", default=None
+)
+
+
+def checkpoint(criteria, steps: int = 1) -> None:
+    """
+    Charge ``steps`` to the current budget, if any.
+
+    Criteria with long running loops call this periodically, so a single
+    expensive subject cannot run past the budget.
+
+    Args:
+        criteria: The criteria doing the work, reported in ``CriteriaTimeout``.
+        steps: Amount of work done since the last checkpoint.
+
+    Raises:
+        CriteriaTimeout: If the budget is exhausted.
+    """
+    budget = _BUDGET.get()
+    if budget is not None:
+        budget.charge(criteria, steps)
+
+
+@contextlib.contextmanager
+def evaluation_budget(seconds: Optional[float] = None, steps: Optional[int] = None):
+    """
+    Limit how long criteria evaluated in this context may run.
+
+    Every criteria evaluated through ``run_match`` or ``run_negated_match``
+    counts as one step, and criteria with long loops (``is_prime``,
+    ``is_a_power_of``) count their iterations as well. Once either limit is
+    exceeded ``CriteriaTimeout`` is raised, naming the criteria that was
+    running.
+
+    The budget is checked between steps: a single call into C code, such as
+    one ``re`` match or ``json.loads``, cannot be interrupted.
+
+    Budgets nest; an inner budget never extends an outer one.
+
+    Args:
+        seconds: Wall clock limit.
+        steps: Step limit.
+
+    Example:
+        ```python
+        for record in records:
+            try:
+                with evaluation_budget(seconds=0.1):
+                    matched = rules.run_match(record)
+            except CriteriaTimeout as timeout:
+                log.warning("skipped record: %s", timeout)
+                matched = False
+        ```
+    """
+    global ACTIVE
+
+    token = _BUDGET.set(_Budget(_BUDGET.get(), seconds, steps))
+    with _active_lock:
+        ACTIVE += 1
+    try:
+        yield
+    finally:
+        with _active_lock:
+            ACTIVE -= 1
+        _BUDGET.reset(token)
@@ -0,0 +1,665 @@
+import itertools
+import re
+from collections.abc import Mapping
+from typing import Any, Callable
+
+from assertive import budget as _budget
+from assertive.core import (
+    AndCriteria,
+    Criteria,
+    InvertedCriteria,
+    OrCriteria,
+    XorCriteria,
+    _is_stream,
+    _reads_elements,
+    is_eq,
+)
+from assertive.criteria.basic import (
+    as_string_matches,
+    is_between,
+    is_gt,
+    is_gte,
+    is_lt,
+    is_lte,
+    is_neq,
+    is_none,
+    is_not_none,
+    is_same_instance_as,
+)
+from assertive.criteria.list import (
+    contains,
+    contains_exactly,
+    has_length,
+    is_empty,
+)
+from assertive.criteria.mapping import (
+    contains_exact_keys,
+    contains_keys,
+    has_exact_key_values,
+    has_key_values,
+)
+from assertive.criteria.mock import was_awaited, was_called
+from assertive.criteria.numeric import (
+    approximately_zero,
+    as_absolute_matches,
+    is_approximately_equal,
+    is_even,
+    is_multiple_of,
+    is_negative,
+    is_non_negative,
+    is_non_positive,
+    is_odd,
+    is_positive,
+    zero,
+)
+from assertive.criteria.string import (
+    _SEARCHED_OCCURRENCES,
+    _parse_json,
+    as_json_matches,
+    contains_substring,
+    ends_with,
+    ignore_case,
+    regex,
+    starts_with,
+)
+from assertive.criteria.utils import AnyCriteria, PredicateCriteria, WrappedCriteria
+from assertive.intervals import IntervalCriteria, IntervalSetCriteria
+from assertive.prefix_index import PrefixIndex
+from assertive.regex_set import RegexSet
+
+Emitter = Callable[[Any, "_CompileContext", str], str]
+
+_EMITTERS: dict[type, Emitter] = {}
+_NEGATED_EMITTERS: dict[type, Emitter] = {}
+
+_INLINE_LITERAL_TYPES = (bool, int, str, type(None))
+
+# Runs of at least this many ``starts_with``/``ends_with`` or ``regex``
+# operands in an ``|`` are matched with a ``PrefixIndex`` or ``RegexSet``
+# instead of one call per operand.
+_INDEX_MIN_RULES = 8
+
+
+def _type_error(subject, message):
+    raise TypeError(f"{subject} {message}")
+
+
+_GLOBALS = {
+    "_type_error": _type_error,
+    "_Mapping": Mapping,
+    "_json_loads": _parse_json,
+    "_is_stream": _is_stream,
+}
+
+
+class _CompileContext:
+    """
+    Book-keeping for a single compilation: hoisted constants and fresh names.
+    """
+
+    def __init__(self):
+        self.constants: dict[str, Any] = {}
+        self._counter = 0
+
+    def const(self, value) -> str:
+        """
+        Hoist ``value`` out of the generated function, inlining simple literals.
+        """
+        if type(value) in _INLINE_LITERAL_TYPES:
+            return repr(value)
+        return self.hoist(value)
+
+    def hoist(self, value) -> str:
+        """
+        Hoist ``value`` out of the generated function as a closure variable.
+        """
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def var(self) -> str:
+        self._counter += 1
+        return f"_v{self._counter}"
+
+    def bind(self, expression: str, body: Callable[[str], str]) -> str:
+        """
+        Evaluate ``expression`` once and build ``body`` against the result.
+
+        When the body only refers to the value once, the expression is
+        inlined; otherwise it is bound to a local with an assignment expression.
+        """
+        name = self.var()
+        source = body(name)
+        pattern = re.compile(rf"\b{name}\b")
+        if len(pattern.findall(source)) == 1:
+            return pattern.sub(lambda _: f"({expression})", source)
+        return f"(({name} := {expression}), {source})[1]"
+
+
+def _emitter(*classes: type, negated: bool = False):
+    registry = _NEGATED_EMITTERS if negated else _EMITTERS
+
+    def decorator(function: Emitter) -> Emitter:
+        for cls in classes:
+            registry[cls] = function
+        return function
+
+    return decorator
+
+
+def _same_behaviour(subclass: type, cls: type) -> bool:
+    return all(
+        getattr(subclass, name) is getattr(cls, name)
+        for name in ("_before_run", "_match", "_negated_match")
+    )
+
+
+def _lookup(registry: dict[type, Emitter], criteria: Criteria) -> Emitter | None:
+    # Subclasses only reuse an emitter when they do not change how matching
+    # works, e.g. ``has_key_and_value`` reuses ``has_key_values``.
+    for cls in type(criteria).__mro__:
+        if cls in registry:
+            if _same_behaviour(type(criteria), cls):
+                return registry[cls]
+            return None
+    return None
+
+
+def _emit(criteria: Criteria, ctx: _CompileContext, subject: str) -> str:
+    emitter = _lookup(_EMITTERS, criteria)
+    if emitter is None:
+        return f"{ctx.hoist(criteria)}.run_match({subject})"
+    return emitter(criteria, ctx, subject)
+
+
+def _emit_negated(criteria: Criteria, ctx: _CompileContext, subject: str) -> str:
+    emitter = _lookup(_NEGATED_EMITTERS, criteria)
+    if emitter is not None:
+        return emitter(criteria, ctx, subject)
+    if _lookup(_EMITTERS, criteria) is None:
+        return f"{ctx.hoist(criteria)}.run_negated_match({subject})"
+    return f"(not {_emit(criteria, ctx, subject)})"
+
+
+# core
+
+
+def _unless_stream(criteria: Criteria, ctx, subject: str, inline: str) -> str:
+    # One-shot iterators are handed to the criteria itself, which reads them
+    # in a single pass.
+    return f"({ctx.hoist(criteria)}.run_match({subject}) if _is_stream({subject}) else {inline})"
+
+
+@_emitter(AndCriteria)
+def _emit_and(criteria: AndCriteria, ctx, subject):
+    if not criteria.items:
+        return "True"
+    inline = "(" + " and ".join(_emit(c, ctx, subject) for c in criteria.items) + ")"
+    if _reads_elements(criteria):
+        return _unless_stream(criteria, ctx, subject, inline)
+    return inline
+
+
+def _or_index(criteria: Criteria):
+    kind = type(criteria)
+    if (kind is starts_with and isinstance(criteria.prefix, str)) or (
+        kind is ends_with and isinstance(criteria.suffix, str)
+    ):
+        return PrefixIndex
+    if kind is regex:
+        return RegexSet
+    return None
+
+
+def _emit_run(index_class, run: list[Criteria], ctx, subject) -> list[str]:
+    if index_class is None or len(run) < _INDEX_MIN_RULES:
+        return [_emit(c, ctx, subject) for c in run]
+    index = index_class(dict(enumerate(run)))
+    return [f"{ctx.hoist(index)}.any_match({subject})"]
+
+
+@_emitter(OrCriteria)
+def _emit_or(criteria: OrCriteria, ctx, subject):
+    if not criteria.items:
+        return "False"
+
+    # Neighbouring operands that can share an index are grouped so long runs
+    # of them are matched with a single trie walk or combined pattern.
+    parts = []
+    for index_class, run in itertools.groupby(criteria.items, key=_or_index):
+        parts.extend(_emit_run(index_class, list(run), ctx, subject))
+    inline = "(" + " or ".join(parts) + ")"
+    if _reads_elements(criteria):
+        return _unless_stream(criteria, ctx, subject, inline)
+    return inline
+
+
+@_emitter(XorCriteria)
+def _emit_xor(criteria: XorCriteria, ctx, subject):
+    left = _emit(criteria.left, ctx, subject)
+    right = _emit(criteria.right, ctx, subject)
+    inline = f"({left} ^ {right})"
+    if _reads_elements(criteria):
+        return _unless_stream(criteria, ctx, subject, inline)
+    return inline
+
+
+@_emitter(InvertedCriteria)
+def _emit_inverted(criteria: InvertedCriteria, ctx, subject):
+    return _emit_negated(criteria.value, ctx, subject)
+
+
+@_emitter(InvertedCriteria, negated=True)
+def _emit_inverted_negated(criteria: InvertedCriteria, ctx, subject):
+    return _emit(criteria.value, ctx, subject)
+
+
+def _comparison(operator: str) -> Emitter:
+    def emit(criteria, ctx, subject):
+        return f"({subject} {operator} {ctx.const(criteria.value)})"
+
+    return emit
+
+
+_emitter(is_eq)(_comparison("=="))
+_emitter(is_neq)(_comparison("!="))
+_emitter(is_gt)(_comparison(">"))
+_emitter(is_gte)(_comparison(">="))
+_emitter(is_lt)(_comparison("<"))
+_emitter(is_lte)(_comparison("<="))
+
+
+@_emitter(is_same_instance_as)
+def _emit_is_same_instance_as(criteria: is_same_instance_as, ctx, subject):
+    return f"({subject} is {ctx.hoist(criteria.value)})"
+
+
+# basic
+
+
+@_emitter(is_between)
+def _emit_between(criteria: is_between, ctx, subject):
+    lower = ctx.const(criteria.lower)
+    upper = ctx.const(criteria.upper)
+    if criteria.is_inclusive:
+        return f"({subject} >= {lower} and {subject} <= {upper})"
+    return f"({subject} > {lower} and {subject} < {upper})"
+
+
+@_emitter(IntervalCriteria)
+def _emit_interval(criteria: IntervalCriteria, ctx, subject):
+    interval = criteria.interval
+    checks = []
+    if interval.lower is not None:
+        operator = ">=" if interval.lower_closed else ">"
+        checks.append(f"{subject} {operator} {ctx.const(interval.lower)}")
+    if interval.upper is not None:
+        operator = "<=" if interval.upper_closed else "<"
+        checks.append(f"{subject} {operator} {ctx.const(interval.upper)}")
+    return f"({' and '.join(checks) or 'True'})"
+
+
+@_emitter(IntervalSetCriteria)
+def _emit_interval_set(criteria: IntervalSetCriteria, ctx, subject):
+    return f"{ctx.hoist(criteria)}._match({subject})"
+
+
+@_emitter(as_string_matches)
+def _emit_as_string_matches(criteria: as_string_matches, ctx, subject):
+    return ctx.bind(f"str({subject})", lambda v: _emit(criteria.criteria, ctx, v))
+
+
+@_emitter(is_none)
+def _emit_is_none(criteria, ctx, subject):
+    return f"({subject} is None)"
+
+
+@_emitter(is_not_none)
+def _emit_is_not_none(criteria, ctx, subject):
+    return f"({subject} is not None)"
+
+
+# numeric
+
+
+@_emitter(is_multiple_of)
+def _emit_is_multiple_of(criteria: is_multiple_of, ctx, subject):
+    return f"(not {subject} == 0 and {ctx.const(criteria.value)} % {subject} == 0)"
+
+
+@_emitter(is_even)
+def _emit_is_even(criteria, ctx, subject):
+    return f"({subject} % 2 == 0)"
+
+
+@_emitter(is_odd)
+def _emit_is_odd(criteria, ctx, subject):
+    return f"({subject} % 2 == 1)"
+
+
+@_emitter(as_absolute_matches)
+def _emit_as_absolute_matches(criteria: as_absolute_matches, ctx, subject):
+    return ctx.bind(f"abs({subject})", lambda v: _emit(criteria.inner_criteria, ctx, v))
+
+
+@_emitter(is_approximately_equal)
+def _emit_is_approximately_equal(criteria: is_approximately_equal, ctx, subject):
+    value = ctx.const(criteria.value)
+    return f"(abs({subject} - {value}) < {ctx.const(criteria.epsilon)})"
+
+
+@_emitter(approximately_zero)
+def _emit_approximately_zero(criteria: approximately_zero, ctx, subject):
+    return f"(abs({subject}) < {ctx.const(criteria.epsilon)})"
+
+
+def _sign(operator: str) -> Emitter:
+    def emit(criteria, ctx, subject):
+        return f"({subject} {operator} 0)"
+
+    return emit
+
+
+_emitter(is_positive)(_sign(">"))
+_emitter(is_non_negative)(_sign(">="))
+_emitter(is_negative)(_sign("<"))
+_emitter(is_non_positive)(_sign("<="))
+_emitter(zero)(_sign("=="))
+
+
+# mapping
+
+
+def _require_mapping(subject: str) -> str:
+    return f"(isinstance({subject}, _Mapping) or _type_error({subject}, 'needs to be mapping'))"
+
+
+def _emit_key_values(criteria: has_key_values, ctx, subject) -> list[str]:
+    parts = []
+    for key, value_criteria in criteria.key_values.items():
+        name = ctx.const(key)
+        parts.append(f"{name} in {subject}")
+        parts.append(
+            ctx.bind(f"{subject}[{name}]", lambda v: _emit(value_criteria, ctx, v))
+        )
+    return parts
+
+
+@_emitter(has_key_values)
+def _emit_has_key_values(criteria: has_key_values, ctx, subject):
+    parts = [_require_mapping(subject), *_emit_key_values(criteria, ctx, subject)]
+    return "(" + " and ".join(parts) + ")"
+
+
+@_emitter(has_exact_key_values)
+def _emit_has_exact_key_values(criteria: has_exact_key_values, ctx, subject):
+    parts = [
+        _require_mapping(subject),
+        f"len({subject}.keys()) == {len(criteria.key_values)}",
+        *_emit_key_values(criteria, ctx, subject),
+    ]
+    return "(" + " and ".join(parts) + ")"
+
+
+def _emit_key_criteria(criteria: contains_keys, ctx, subject) -> list[str]:
+    parts = []
+    for key_criteria in criteria.key_criteria:
+        key = ctx.var()
+        parts.append(
+            f"any({_emit(key_criteria, ctx, key)} for {key} in {subject}.keys())"
+        )
+    return parts
+
+
+@_emitter(contains_keys)
+def _emit_contains_keys(criteria: contains_keys, ctx, subject):
+    parts = [_require_mapping(subject), *_emit_key_criteria(criteria, ctx, subject)]
+    return "(" + " and ".join(parts) + ")"
+
+
+@_emitter(contains_exact_keys)
+def _emit_contains_exact_keys(criteria: contains_exact_keys, ctx, subject):
+    parts = [
+        _require_mapping(subject),
+        f"len({subject}.keys()) == {len(criteria.key_criteria)}",
+        *_emit_key_criteria(criteria, ctx, subject),
+    ]
+    return "(" + " and ".join(parts) + ")"
+
+
+# list
+
+
+def _require_length(subject: str) -> str:
+    return f"(hasattr({subject}, '__len__') or _type_error({subject}, 'needs to be an Iterable'))"
+
+
+@_emitter(has_length)
+def _emit_has_length(criteria: has_length, ctx, subject):
+    length = ctx.bind(f"len({subject})", lambda v: _emit(criteria.value, ctx, v))
+    inline = f"({_require_length(subject)} and {length})"
+    return _unless_stream(criteria, ctx, subject, inline)
+
+
+@_emitter(is_empty)
+def _emit_is_empty(criteria, ctx, subject):
+    inline = f"({_require_length(subject)} and len({subject}) == 0)"
+    return _unless_stream(criteria, ctx, subject, inline)
+
+
+@_emitter(contains)
+def _emit_contains(criteria: contains, ctx, subject):
+    parts = [_require_length(subject)]
+    if criteria._literals:
+        parts.append(f"{ctx.hoist(criteria)}._contains_literals({subject})")
+    for index in criteria._searched:
+        item = criteria.items[index]
+        element = ctx.var()
+        parts.append(f"any({_emit(item, ctx, element)} for {element} in {subject})")
+    inline = "(" + " and ".join(parts) + ")"
+    return _unless_stream(criteria, ctx, subject, inline)
+
+
+@_emitter(contains_exactly)
+def _emit_contains_exactly(criteria: contains_exactly, ctx, subject):
+    def body(items: str) -> str:
+        # Elements are checked in order up to the shorter of the two, and the
+        # lengths compared last, as ``zip(..., strict=True)`` does, so that an
+        # item raising on its element surfaces first.
+        parts = [
+            f"(len({items}) > {index} and {_emit(item, ctx, f'{items}[{index}]')})"
+            for index, item in enumerate(criteria.items)
+        ]
+        parts.append(f"len({items}) == {len(criteria.items)}")
+        return " and ".join(parts)
+
+    # Materialise once so that sized iterables that can only be read once are
+    # consumed once, just like the ``zip(..., strict=True)`` in
+    # ``contains_exactly._match``.
+    items = ctx.var()
+    inline = (
+        f"({_require_length(subject)} and "
+        f"(({items} := tuple({subject})), {body(items)})[1])"
+    )
+    return _unless_stream(criteria, ctx, subject, inline)
+
+
+# string
+
+
+def _require_str(subject: str) -> str:
+    return f"(isinstance({subject}, str) or _type_error({subject}, 'needs to be a string'))"
+
+
+@_emitter(regex)
+def _emit_regex(criteria: regex, ctx, subject):
+    method = ctx.hoist(getattr(criteria.compiled, criteria.mode))
+    return f"({_require_str(subject)} and {method}({subject}) is not None)"
+
+
+@_emitter(starts_with)
+def _emit_starts_with(criteria: starts_with, ctx, subject):
+    prefix = ctx.const(criteria.prefix)
+    return f"({_require_str(subject)} and {subject}.startswith({prefix}))"
+
+
+@_emitter(ends_with)
+def _emit_ends_with(criteria: ends_with, ctx, subject):
+    suffix = ctx.const(criteria.suffix)
+    return f"({_require_str(subject)} and {subject}.endswith({suffix}))"
+
+
+@_emitter(contains_substring)
+def _emit_contains_substring(criteria: contains_substring, ctx, subject):
+    bounds = [bound for bound in criteria.decision_bounds() if bound is not None]
+    if criteria.substring and bounds and min(bounds) <= _SEARCHED_OCCURRENCES:
+        # Searching stops once the count is decided.
+        return f"({_require_str(subject)} and {ctx.hoist(criteria)}._match({subject}))"
+    substring = ctx.const(criteria.substring)
+    count = ctx.bind(
+        f"{subject}.count({substring})",
+        lambda v: _emit(criteria.times_criteria, ctx, v),
+    )
+    return f"({_require_str(subject)} and {count})"
+
+
+@_emitter(ignore_case)
+def _emit_ignore_case(criteria: ignore_case, ctx, subject):
+    value = ctx.const(criteria.value.lower())
+    return f"({_require_str(subject)} and {subject}.lower() == {value})"
+
+
+@_emitter(as_json_matches)
+def _emit_as_json_matches(criteria: as_json_matches, ctx, subject):
+    check = (
+        f"(isinstance({subject}, (str, bytes, bytearray, memoryview)) "
+        f"or _type_error({subject}, 'needs to be a string or bytes'))"
+    )
+    if criteria.partial and criteria._read_keys() is not None:
+        # Only the keys the inner criteria reads are parsed.
+        return f"({check} and {ctx.hoist(criteria)}._match({subject}))"
+    parsed = ctx.bind(
+        f"_json_loads({subject})", lambda v: _emit(criteria.inner_criteria, ctx, v)
+    )
+    return f"({check} and {parsed})"
+
+
+# utils
+
+
+@_emitter(AnyCriteria)
+@_emitter(AnyCriteria, negated=True)
+def _emit_any(criteria, ctx, subject):
+    return "True"
+
+
+@_emitter(PredicateCriteria)
+def _emit_predicate(criteria: PredicateCriteria, ctx, subject):
+    return f"{ctx.const(criteria.predicate)}({subject})"
+
+
+@_emitter(WrappedCriteria)
+def _emit_wrapped(criteria: WrappedCriteria, ctx, subject):
+    return _emit(criteria.inner_criteria, ctx, subject)
+
+
+@_emitter(WrappedCriteria, negated=True)
+def _emit_wrapped_negated(criteria: WrappedCriteria, ctx, subject):
+    return _emit_negated(criteria.inner_criteria, ctx, subject)
+
+
+# mock
+
+
+@_emitter(was_called)
+def _emit_was_called(criteria: was_called, ctx, subject):
+    return ctx.bind(
+        f"{subject}.call_count", lambda v: _emit(criteria.times_criteria, ctx, v)
+    )
+
+
+@_emitter(was_awaited)
+def _emit_was_awaited(criteria: was_awaited, ctx, subject):
+    return ctx.bind(
+        f"{subject}.await_count", lambda v: _emit(criteria.times_criteria, ctx, v)
+    )
+
+
+class CompiledCriteria(Criteria):
+    """
+    Criteria backed by a generated Python function.
+
+    Produced by ``compile``. Matching gives the same result as ``run_match``
+    on the original tree. Calling the object directly (``compiled(subject)``)
+    skips the ``run_match`` indirection and is the fastest way to evaluate it.
+
+    The generated function does not charge steps to an ``evaluation_budget``.
+    While a budget is active, the original tree is evaluated instead, so that
+    every node is counted and checked.
+
+    Attributes:
+        criteria: The criteria tree that was compiled.
+        source: Generated source code, useful when debugging.
+    """
+
+    __slots__ = ("criteria", "function", "source")
+
+    def __init__(self, criteria: Criteria, function: Callable[[Any], bool], source):
+        self.criteria = criteria
+        self.function = function
+        self.source = source
+
+    def __call__(self, subject) -> bool:
+        if _budget.ACTIVE and _budget._BUDGET.get() is not None:
+            return self.criteria.run_match(subject)
+        return self.function(subject)
+
+    def _match(self, subject) -> bool:
+        if _budget.ACTIVE and _budget._BUDGET.get() is not None:
+            return self.criteria.run_match(subject)
+        return self.function(subject)
+
+
+def compile(criteria: Criteria) -> CompiledCriteria:
+    """
+    Compile a criteria tree into a single generated Python function.
+
+    Built-in criteria are inlined as native comparisons with their constants
+    hoisted out of the function, and ``&``/``|`` become Python's
+    short-circuiting ``and``/``or``. Criteria the compiler does not know
+    about (for example your own subclasses) are called through ``run_match``.
+
+    The tree is snapshotted: changes made to it after compiling (such as
+    calling ``once()`` on a mock criteria) are not picked up.
+
+    Args:
+        criteria: Criteria tree to compile.
+
+    Returns:
+        CompiledCriteria: A criteria that can be called with a subject.
+
+    Example:
+        ```python
+        matcher = compile(has_key_values({"status": is_between(200, 299)}))
+
+        assert matcher({"status": 201})       # passes
+        assert {"status": 201} == matcher     # passes
+        assert not matcher({"status": 500})   # passes
+        ```
+    """
+    if isinstance(criteria, CompiledCriteria):
+        return criteria
+
+    ctx = _CompileContext()
+    expression = _emit(criteria, ctx, "s")
+    parameters = ", ".join(ctx.constants)
+    source = (
+        f"def _factory({parameters}):\n"
+        f"    def compiled_match(s):\n"
+        f"        return {expression}\n"
+        f"    return compiled_match\n"
+    )
+    namespace = dict(_GLOBALS)
+    exec(source, namespace)  # noqa: S102
+    function = namespace["_factory"](**ctx.constants)
+    return CompiledCriteria(criteria, function, source)
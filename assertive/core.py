@@ -1,5 +1,9 @@
+import functools
+import itertools
 from abc import ABC, abstractmethod
-from typing import Any, final
+from typing import Any, Iterable, Iterator, Optional, final
+
+from assertive import budget as _budget
 
 
 def ensure_criteria(value: Any) -> "Criteria":
@@ -8,6 +12,28 @@ def ensure_criteria(value: Any) -> "Criteria":
     return is_eq(value)
 
 
+@functools.cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name not in ("__dict__", "__weakref__"))
+    return tuple(names)
+
+
+# Types whose ``==`` agrees with their hash, so equal values can be found with a
+# set or dict lookup. Values such as ``unittest.mock.ANY`` compare equal to
+# things they do not share a hash with.
+_PLAIN_EQUALITY_TYPES = frozenset({bool, bytes, complex, float, int, str, type(None)})
+
+
+def _has_plain_equality(value) -> bool:
+    kind = type(value)
+    return kind in _PLAIN_EQUALITY_TYPES or kind.__eq__ is object.__eq__
+
+
 class Criteria(ABC):
     """
     Base class for defining criteria used in assertions.
@@ -15,12 +41,23 @@ class Criteria(ABC):
     Subclasses of `Criteria` should override the `_match` method to determine if the subject matches the criteria.
     """
 
+    __slots__ = ()
+
     def to_serialized(self) -> dict:
         """
         Serializes the criteria into a dictionary representation.
         This method should be overridden by subclasses to provide custom serialization.
+
+        By default every attribute declared in ``__slots__`` (and any instance
+        ``__dict__`` entries of subclasses that do not declare slots) is included.
         """
-        return self.__dict__  # pyright: ignore[reportReturnType]
+        serialized = {
+            name: getattr(self, name)
+            for name in _slot_names(type(self))
+            if hasattr(self, name)
+        }
+        serialized.update(getattr(self, "__dict__", {}))
+        return serialized
 
     @classmethod
     def from_serialized(cls, serialized: dict) -> "Criteria":
@@ -30,16 +67,137 @@ class Criteria(ABC):
         """
         return cls(**serialized)
 
+    def compile(self):
+        """
+        Compile this criteria tree into a single generated Python function.
+
+        See ``assertive.compiler.compile`` for details.
+
+        Returns:
+            CompiledCriteria: A criteria that can be called with a subject.
+        """
+        from assertive.compiler import compile
+
+        return compile(self)
+
+    def match_many(self, values):
+        """
+        Evaluate this criteria against every element of an array.
+
+        Requires the optional ``numpy`` dependency. See
+        ``assertive.vectorize.match_many`` for details.
+
+        Returns:
+            numpy.ndarray: Boolean mask with the same shape as ``values``.
+        """
+        from assertive.vectorize import match_many
+
+        return match_many(self, values)
+
+    def filter(self, iterable: Iterable) -> Iterator:
+        """
+        Lazily yield the items of ``iterable`` that match this criteria.
+
+        Example:
+            ```python
+            list(is_even().filter(range(6))) # [0, 2, 4]
+            ```
+        """
+        return filter(self.run_match, iterable)
+
+    def partition(self, iterable: Iterable) -> tuple[Iterator, Iterator]:
+        """
+        Lazily split ``iterable`` into matching and non-matching items.
+
+        Each item is evaluated once. Both iterators share one pass over the
+        input, so items are only buffered while one side is consumed ahead of
+        the other.
+
+        Example:
+            ```python
+            evens, odds = is_even().partition(range(6))
+            list(evens) # [0, 2, 4]
+            list(odds)  # [1, 3, 5]
+            ```
+        """
+        first, second = itertools.tee((self.run_match(item), item) for item in iterable)
+        matching = (item for matched, item in first if matched)
+        non_matching = (item for matched, item in second if not matched)
+        return matching, non_matching
+
+    def count_matches(self, iterable: Iterable, stop_at: Optional[int] = None) -> int:
+        """
+        Count the items of ``iterable`` that match this criteria.
+
+        Args:
+            iterable: Items to test.
+            stop_at: Stop consuming the input once this many matches were seen.
+
+        Example:
+            ```python
+            is_even().count_matches(range(10))            # 5
+            is_even().count_matches(range(10), stop_at=2) # 2
+            ```
+        """
+        matches = filter(self.run_match, iterable)
+        if stop_at is not None:
+            matches = itertools.islice(matches, stop_at)
+        count = 0
+        for _ in matches:
+            count += 1
+        return count
+
+    def first_match(self, iterable: Iterable, default: Any = None) -> Any:
+        """
+        Return the first item of ``iterable`` that matches, or ``default``.
+
+        Example:
+            ```python
+            is_gt(2).first_match([1, 2, 3, 4]) # 3
+            is_gt(9).first_match([1, 2, 3, 4]) # None
+            ```
+        """
+        return next(filter(self.run_match, iterable), default)
+
+    def all_match(self, iterable: Iterable) -> bool:
+        """
+        Return ``True`` if every item matches, stopping at the first mismatch.
+        """
+        return all(map(self.run_match, iterable))
+
+    def any_match(self, iterable: Iterable) -> bool:
+        """
+        Return ``True`` if any item matches, stopping at the first match.
+        """
+        return any(map(self.run_match, iterable))
+
     def _before_run(self, subject):
         pass
 
+    def _consumer(self, subject) -> "Consumer":
+        """
+        Return a ``Consumer`` that evaluates this criteria against the elements
+        of the one-shot iterable ``subject``, one at a time.
+
+        Criteria that read the elements of their subject implement this so
+        that one-shot iterators can be matched, and so that ``AndCriteria``
+        and ``OrCriteria`` can feed every operand from a single pass. Other
+        criteria, including subclasses that override ``_match`` without
+        overriding this, are evaluated against a list of the elements instead.
+        """
+        return _MaterialisingConsumer(self)
+
     @final
     def run_match(self, subject) -> bool:
+        if _budget.ACTIVE:
+            _budget.checkpoint(self)
         self._before_run(subject)
         return self._match(subject)
 
     @final
     def run_negated_match(self, subject) -> bool:
+        if _budget.ACTIVE:
+            _budget.checkpoint(self)
         self._before_run(subject)
         return self._negated_match(subject)
 
@@ -71,10 +229,10 @@ class Criteria(ABC):
         return not self.run_match(subject)
 
     def __and__(self, other):
-        return AndCriteria([self, ensure_criteria(other)])
+        return all_of(self, other)
 
     def __or__(self, other):
-        return OrCriteria([self, ensure_criteria(other)])
+        return any_of(self, other)
 
     def __xor__(self, other):
         return XorCriteria(self, ensure_criteria(other))
@@ -89,35 +247,299 @@ class Criteria(ABC):
         return self.run_negated_match(other)
 
 
+class Consumer(ABC):
+    """
+    Incremental evaluation of a criteria over the elements of an iterable.
+
+    ``feed`` is called with each element in turn and returns the result as
+    soon as it is known, or ``None`` while more elements are needed.
+    ``finish`` returns the result once the iterable is exhausted. A consumer
+    is used for a single iterable.
+    """
+
+    __slots__ = ()
+
+    def feed(self, element) -> Optional[bool]:
+        return None
+
+    @abstractmethod
+    def finish(self) -> bool: ...
+
+    def run(self, iterable: Iterable) -> bool:
+        """
+        Feed the elements of ``iterable`` until the result is known.
+
+        The iterable is not read past the element that decides the result.
+        """
+        feed = self.feed
+        for element in iterable:
+            result = feed(element)
+            if result is not None:
+                return result
+        return self.finish()
+
+
+class _MaterialisingConsumer(Consumer):
+    __slots__ = ("criteria", "elements")
+
+    def __init__(self, criteria: Criteria):
+        self.criteria = criteria
+        self.elements = []
+
+    def feed(self, element):
+        self.elements.append(element)
+        return None
+
+    def finish(self):
+        return self.criteria.run_match(self.elements)
+
+
+def _is_stream(subject) -> bool:
+    # Iterables without a length, such as generators, files and cursors, can
+    # only be read once.
+    return not hasattr(subject, "__len__") and hasattr(subject, "__iter__")
+
+
+class _AllConsumer(Consumer):
+    __slots__ = ("pending",)
+
+    def __init__(self, consumers: list[Consumer]):
+        self.pending = consumers
+
+    def feed(self, element):
+        decided = None
+        for consumer in self.pending:
+            result = consumer.feed(element)
+            if result is not None:
+                if not result:
+                    return False
+                decided = [*(decided or ()), consumer]
+        if decided is None:
+            return None
+        self.pending = [c for c in self.pending if c not in decided]
+        return None if self.pending else True
+
+    def finish(self):
+        return all(consumer.finish() for consumer in self.pending)
+
+
+class _AnyConsumer(Consumer):
+    __slots__ = ("pending",)
+
+    def __init__(self, consumers: list[Consumer]):
+        self.pending = consumers
+
+    def feed(self, element):
+        decided = None
+        for consumer in self.pending:
+            result = consumer.feed(element)
+            if result is not None:
+                if result:
+                    return True
+                decided = [*(decided or ()), consumer]
+        if decided is None:
+            return None
+        self.pending = [c for c in self.pending if c not in decided]
+        return None if self.pending else False
+
+    def finish(self):
+        return any(consumer.finish() for consumer in self.pending)
+
+
+class _XorConsumer(Consumer):
+    __slots__ = ("left", "right", "results")
+
+    def __init__(self, left: Consumer, right: Consumer):
+        self.left = left
+        self.right = right
+        self.results: list[Optional[bool]] = [None, None]
+
+    def feed(self, element):
+        results = self.results
+        if results[0] is None:
+            results[0] = self.left.feed(element)
+        if results[1] is None:
+            results[1] = self.right.feed(element)
+        if results[0] is None or results[1] is None:
+            return None
+        return results[0] ^ results[1]
+
+    def finish(self):
+        left, right = self.results
+        if left is None:
+            left = self.left.finish()
+        if right is None:
+            right = self.right.finish()
+        return left ^ right
+
+
+class _NotConsumer(Consumer):
+    __slots__ = ("consumer",)
+
+    def __init__(self, consumer: Consumer):
+        self.consumer = consumer
+
+    def feed(self, element):
+        result = self.consumer.feed(element)
+        return None if result is None else not result
+
+    def finish(self):
+        return not self.consumer.finish()
+
+
+@functools.cache
+def _has_consumer(cls: type) -> bool:
+    # A subclass that changes how matching works cannot use the consumer it
+    # inherits.
+    owner = next(klass for klass in cls.__mro__ if "_consumer" in klass.__dict__)
+    return owner is not Criteria and all(
+        getattr(cls, name) is getattr(owner, name)
+        for name in ("_match", "_negated_match")
+    )
+
+
+def _reads_elements(criteria: Criteria) -> bool:
+    """
+    Whether ``criteria`` reads the elements of a one-shot iterable through a
+    dedicated ``Consumer``.
+    """
+    if not _has_consumer(type(criteria)):
+        return False
+    if isinstance(criteria, (AndCriteria, OrCriteria)):
+        return any(map(_reads_elements, criteria.items))
+    if isinstance(criteria, XorCriteria):
+        return _reads_elements(criteria.left) or _reads_elements(criteria.right)
+    if isinstance(criteria, InvertedCriteria):
+        return _reads_elements(criteria.value)
+    return True
+
+
+def _stream_consumer(criteria: Criteria, subject) -> Consumer:
+    # The consumer of an operand, charged and checked as ``run_match`` would.
+    if not _reads_elements(criteria):
+        return _MaterialisingConsumer(criteria)
+    if _budget.ACTIVE:
+        _budget.checkpoint(criteria)
+    criteria._before_run(subject)
+    return criteria._consumer(subject)
+
+
+def _flatten(cls: type, criteria: tuple) -> list[Criteria]:
+    items = []
+    for item in criteria:
+        item = ensure_criteria(item)
+        if type(item) is cls:
+            items.extend(item.items)
+        else:
+            items.append(item)
+    return items
+
+
+def all_of(*criteria) -> "AndCriteria":
+    """
+    Match when every criteria matches.
+
+    Nested ``AndCriteria`` operands are merged into a single flat node, so
+    building a long conjunction is linear and matching it does not recurse
+    once per operand. ``a & b & c`` is equivalent to ``all_of(a, b, c)``.
+
+    Args:
+        *criteria: Values or criteria that must all match.
+
+    Example:
+        ```python
+        assert 5 == all_of(is_gt(1), is_lt(10), is_odd()) # passes
+        assert 4 == all_of(is_gt(1), is_lt(10), is_odd()) # fails
+        ```
+    """
+    return AndCriteria(_flatten(AndCriteria, criteria))
+
+
+def any_of(*criteria) -> "OrCriteria":
+    """
+    Match when at least one criteria matches.
+
+    Nested ``OrCriteria`` operands are merged into a single flat node.
+    ``a | b | c`` is equivalent to ``any_of(a, b, c)``.
+
+    Args:
+        *criteria: Values or criteria of which at least one must match.
+
+    Example:
+        ```python
+        assert 5 == any_of(1, 5, is_gt(10)) # passes
+        assert 4 == any_of(1, 5, is_gt(10)) # fails
+        ```
+    """
+    return OrCriteria(_flatten(OrCriteria, criteria))
+
+
 class AndCriteria(Criteria):
+    __slots__ = ("items",)
+
+    @classmethod
+    def from_serialized(cls, serialized: dict) -> "Criteria":
+        return all_of(*serialized["items"])
+
     def __init__(self, items: list[Criteria]):
         self.items = items
 
+    def _consumer(self, subject):
+        return _AllConsumer([_stream_consumer(c, subject) for c in self.items])
+
     def _match(self, subject) -> bool:
+        if _is_stream(subject) and _reads_elements(self):
+            # Every operand is fed from a single pass over the elements.
+            return self._consumer(subject).run(subject)
         return all(criteria.run_match(subject) for criteria in self.items)
 
 
 class OrCriteria(Criteria):
+    __slots__ = ("items",)
+
+    @classmethod
+    def from_serialized(cls, serialized: dict) -> "Criteria":
+        return any_of(*serialized["items"])
+
     def __init__(self, items: list[Criteria]):
         self.items = items
 
+    def _consumer(self, subject):
+        return _AnyConsumer([_stream_consumer(c, subject) for c in self.items])
+
     def _match(self, subject) -> bool:
+        if _is_stream(subject) and _reads_elements(self):
+            return self._consumer(subject).run(subject)
         return any(items.run_match(subject) for items in self.items)
 
 
 class XorCriteria(Criteria):
+    __slots__ = ("left", "right")
+
     def __init__(self, left: Criteria, right: Criteria):
         self.left = left
         self.right = right
 
+    def _consumer(self, subject):
+        return _XorConsumer(
+            _stream_consumer(self.left, subject), _stream_consumer(self.right, subject)
+        )
+
     def _match(self, subject) -> bool:
+        if _is_stream(subject) and _reads_elements(self):
+            return self._consumer(subject).run(subject)
         return self.left.run_match(subject) ^ self.right.run_match(subject)
 
 
 class InvertedCriteria(Criteria):
+    __slots__ = ("value",)
+
     def __init__(self, value: Criteria):
         self.value = value
 
+    def _consumer(self, subject):
+        return _NotConsumer(_stream_consumer(self.value, subject))
+
     def _match(self, subject) -> bool:
         return self.value.run_negated_match(subject)
 
@@ -126,6 +548,8 @@ class InvertedCriteria(Criteria):
 
 
 class is_eq(Criteria):
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -1,9 +1,144 @@
-from .basic import *  # noqa: F403
-from .utils import *  # noqa: F403
-from .object import *  # noqa: F403
-from .string import *  # noqa: F403
-from .list import *  # noqa: F403
-from .mock import *  # noqa: F403
-from .exception import *  # noqa: F403
-from .numeric import *  # noqa: F403
-from .mapping import *  # noqa: F403
+import importlib as _importlib
+
+# Avoid importing ``typing`` just for this flag; it is removed from the
+# namespace again below.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .basic import *  # noqa: F403
+    from .utils import *  # noqa: F403
+    from .object import *  # noqa: F403
+    from .string import *  # noqa: F403
+    from .list import *  # noqa: F403
+    from .mock import *  # noqa: F403
+    from .exception import *  # noqa: F403
+    from .numeric import *  # noqa: F403
+    from .mapping import *  # noqa: F403
+
+del TYPE_CHECKING
+
+# Criteria modules are imported on first use so that ``import assertive`` does
+# not pay for ``unittest.mock``, ``json``, ``re`` and friends up front.
+_LAZY_EXPORTS = {
+    ".basic": (
+        "as_string_matches",
+        "is_between",
+        "is_eq",
+        "is_gt",
+        "is_gte",
+        "is_lt",
+        "is_lte",
+        "is_neq",
+        "is_none",
+        "is_not_none",
+        "is_same_instance_as",
+    ),
+    ".utils": (
+        "ANY",
+        "AnyCriteria",
+        "PredicateCriteria",
+        "TimesMixin",
+        "WrappedCriteria",
+    ),
+    ".object": (
+        "class_match",
+        "has_attributes",
+        "is_exact_type",
+        "is_type",
+        "strict_class_match",
+    ),
+    ".string": (
+        "StringCriteria",
+        "as_json_matches",
+        "contains_substring",
+        "ends_with",
+        "ignore_case",
+        "regex",
+        "starts_with",
+    ),
+    ".list": (
+        "IterableCriteria",
+        "any_gap",
+        "contains",
+        "contains_exactly",
+        "contains_in_any_order",
+        "has_length",
+        "is_empty",
+        "many",
+        "matches_sequence",
+        "one",
+        "optional",
+    ),
+    ".mock": (
+        "was_awaited",
+        "was_awaited_exactly_with",
+        "was_awaited_once",
+        "was_awaited_once_exactly_with",
+        "was_awaited_once_with",
+        "was_awaited_with",
+        "was_called",
+        "was_called_exactly_with",
+        "was_called_once",
+        "was_called_once_exactly_with",
+        "was_called_once_with",
+        "was_called_with",
+        "was_not_awaited",
+        "was_not_awaited_exactly_with",
+        "was_not_awaited_with",
+        "was_not_called",
+        "was_not_called_exactly_with",
+        "was_not_called_with",
+    ),
+    ".exception": (
+        "ExceptionCriteria",
+        "raises",
+        "raises_exact_exception",
+        "raises_exception",
+    ),
+    ".numeric": (
+        "approximately_zero",
+        "as_absolute_matches",
+        "is_a_perfect_square",
+        "is_a_power_of",
+        "is_approximately_equal",
+        "is_coprime_with",
+        "is_even",
+        "is_multiple_of",
+        "is_negative",
+        "is_non_negative",
+        "is_non_positive",
+        "is_odd",
+        "is_positive",
+        "is_prime",
+        "zero",
+    ),
+    ".mapping": (
+        "MappingCriteria",
+        "contains_exact_keys",
+        "contains_keys",
+        "has_exact_key_values",
+        "has_key_and_value",
+        "has_key_values",
+    ),
+}
+
+_MODULE_BY_NAME = {
+    name: module for module, names in _LAZY_EXPORTS.items() for name in names
+}
+
+__all__ = list(_MODULE_BY_NAME)
+
+
+def __getattr__(name):
+    if f".{name}" in _LAZY_EXPORTS:
+        return _importlib.import_module(f".{name}", __name__)
+    module = _MODULE_BY_NAME.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -27,6 +27,8 @@ class is_neq(Criteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -48,6 +50,8 @@ class is_gt(Criteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -70,6 +74,8 @@ class is_gte(Criteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -91,6 +97,8 @@ class is_lt(Criteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -113,6 +121,8 @@ class is_lte(Criteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -139,6 +149,8 @@ class is_between(Criteria):
         ```
     """
 
+    __slots__ = ("lower", "upper", "is_inclusive")
+
     @classmethod
     def from_serialized(cls, serialized: Mapping) -> Criteria:
         criteria = cls(
@@ -201,6 +213,8 @@ class is_same_instance_as(Criteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -226,6 +240,8 @@ class as_string_matches(Criteria):
         ```
     """
 
+    __slots__ = ("criteria",)
+
     def __init__(self, criteria: Union[Criteria, str]):
         self.criteria = ensure_criteria(criteria)
 
@@ -247,6 +263,8 @@ class is_none(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         return subject is None
 
@@ -265,5 +283,7 @@ class is_not_none(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         return subject is not None
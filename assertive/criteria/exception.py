@@ -1,5 +1,5 @@
 from types import TracebackType
-from typing import Callable, Optional, Union
+from typing import Optional, Union
 
 from assertive.core import Criteria, ensure_criteria
 from assertive.criteria.basic import as_string_matches
@@ -18,23 +18,44 @@ class ExceptionCriteria(Criteria):
     Subclasses provide the actual exception matching rules.
     """
 
-    def __init__(self):
-        self.exception = None
-        self.raised = False
+    __slots__ = ()
 
     def _before_run(self, subject):
+        if not callable(subject) and not isinstance(subject, Exception):
+            raise TypeError(f"{subject} needs to be an Exception or Callable")
+
+    def _capture(self, subject) -> Optional[Exception]:
+        """
+        Return the exception for this evaluation without storing it.
+
+        Callables are invoked and whatever they raise is returned, or ``None``
+        if they return normally. Exception instances are returned as-is.
+        Keeping the exception local to the evaluation is what allows one
+        criteria instance to be shared between threads.
+        """
         if callable(subject):
             try:
                 subject()
             except Exception as ex:
-                self.exception = ex
-                self.raised = True
-            return
+                return ex
+            return None
+        return subject
 
-        if not isinstance(subject, Exception):
-            raise TypeError(f"{subject} needs to be an Exception or Callable")
-        self.raised = True
-        self.exception = subject
+    def _match(self, subject) -> bool:
+        return self._match_exception(self._capture(subject))
+
+    def _match_exception(self, exception: Optional[Exception]) -> bool:
+        """
+        Determine if the captured exception matches this criteria.
+        Should be overridden by child classes.
+
+        Args:
+            exception: The captured exception, or ``None`` if nothing was raised.
+
+        Returns:
+            bool: True if the exception matches, False otherwise.
+        """
+        return exception is not None
 
     def __enter__(self):
         return self
@@ -47,7 +68,7 @@ class ExceptionCriteria(Criteria):
     ):
         if not self.run_match(exc_val):
             raise AssertionError(
-                f"Expected exception of type {self.exception.__class__.__name__}, but got {exc_val}"
+                f"Expected exception of type {exc_val.__class__.__name__}, but got {exc_val}"
             )
         return True
 
@@ -62,7 +83,7 @@ class ExceptionCriteria(Criteria):
     ):
         if not self.run_match(exc_val):
             raise AssertionError(
-                f"Expected exception of type {self.exception.__class__.__name__}, but got {exc_val}"
+                f"Expected exception of type {exc_val.__class__.__name__}, but got {exc_val}"
             )
         return True
 
@@ -75,14 +96,15 @@ class raises(ExceptionCriteria):
         criteria: Criteria evaluated against the captured exception instance.
     """
 
+    __slots__ = ("criteria",)
+
     def __init__(self, criteria: Criteria):
-        super().__init__()
         self.criteria = criteria
 
-    def _match(self, subject: Callable) -> bool:
-        if self.raised:
-            return self.criteria.run_match(self.exception)
-        return False
+    def _match_exception(self, exception: Optional[Exception]) -> bool:
+        if exception is None:
+            return False
+        return self.criteria.run_match(exception)
 
 
 class raises_exception(raises):
@@ -119,6 +141,8 @@ class raises_exception(raises):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self, type: type[Exception], string_criteria: Union[str, Criteria] = ANY
     ):
@@ -160,6 +184,8 @@ class raises_exact_exception(raises):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self, type: type[Exception], string_critera: Union[str, Criteria] = ANY
     ):
@@ -1,18 +1,41 @@
+import collections
+import functools
 from typing import Union
 
-from assertive.core import Criteria, ensure_criteria
+from assertive.core import (
+    Consumer,
+    Criteria,
+    _has_plain_equality,
+    _is_stream,
+    ensure_criteria,
+    is_eq,
+)
+from assertive.intervals import count_bounds
+
+# Subjects whose ``in`` is a hash lookup.
+_HASHED_COLLECTIONS = (set, frozenset, dict, type({}.keys()))
+
+# Up to this many literals are looked up by scanning a list or tuple subject,
+# which is faster than building a set of its elements first.
+_SCANNED_LITERALS = 4
 
 
 class IterableCriteria(Criteria):
     """
     Base class for criteria that operate on iterable-like subjects.
 
-    Subclasses require the subject to expose ``__len__``. A ``TypeError``
-    is raised when that contract is not met.
+    Subclasses require the subject to expose ``__len__`` or ``__iter__``. A
+    ``TypeError`` is raised when that contract is not met.
+
+    Iterables without a length, such as generators, files and database
+    cursors, are read once, one element at a time, through the criteria's
+    ``Consumer``, and reading stops as soon as the result is known.
     """
 
+    __slots__ = ()
+
     def _before_run(self, subject):
-        if not hasattr(subject, "__len__"):
+        if not hasattr(subject, "__len__") and not hasattr(subject, "__iter__"):
             raise TypeError(f"{subject} needs to be an Iterable")
 
 
@@ -23,6 +46,10 @@ class has_length(IterableCriteria):
     ``value`` can be a concrete integer or another criteria for advanced
     length checks.
 
+    Iterators are counted without being stored. When ``value`` is an integer
+    or a range criteria such as ``is_lt(n)``, counting stops as soon as the
+    length is known to match or not.
+
     Args:
         value: Expected length or criteria evaluated against ``len(subject)``.
 
@@ -34,14 +61,41 @@ class has_length(IterableCriteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Union[int, Criteria]):
         self.value = ensure_criteria(value)
 
+    def _consumer(self, subject):
+        return _LengthConsumer(self.value)
+
     def _match(self, subject):
+        if _is_stream(subject):
+            return self._consumer(subject).run(subject)
         count = len(subject)
         return self.value.run_match(count)
 
 
+class _LengthConsumer(Consumer):
+    __slots__ = ("value", "count", "matching", "failing")
+
+    def __init__(self, value: Criteria):
+        self.value = value
+        self.count = 0
+        self.matching, self.failing = count_bounds(value)
+
+    def feed(self, element):
+        self.count += 1
+        if self.matching is not None and self.count >= self.matching:
+            return True
+        if self.failing is not None and self.count >= self.failing:
+            return False
+        return None
+
+    def finish(self):
+        return self.value.run_match(self.count)
+
+
 class is_empty(IterableCriteria):
     """
     Match empty iterables (length ``0``).
@@ -54,11 +108,28 @@ class is_empty(IterableCriteria):
         ```
     """
 
+    __slots__ = ()
+
+    def _consumer(self, subject):
+        return _EmptyConsumer()
+
     def _match(self, subject):
+        if _is_stream(subject):
+            return self._consumer(subject).run(subject)
         count = len(subject)
         return count == 0
 
 
+class _EmptyConsumer(Consumer):
+    __slots__ = ()
+
+    def feed(self, element):
+        return False
+
+    def finish(self):
+        return True
+
+
 class contains(IterableCriteria):
     """
     Match when each expected item is found somewhere in the subject.
@@ -66,6 +137,13 @@ class contains(IterableCriteria):
     Items are treated as criteria. This means you can mix exact values
     and nested criteria objects.
 
+    Exact strings, numbers and ``None`` are looked up together, in a set of
+    the subject's elements built once per match (or directly in ``set``,
+    ``frozenset``, ``dict`` and ``dict.keys()`` subjects), so they cost
+    ``O(len(subject))`` in total rather than each. Elements that a lookup
+    cannot find, such as ``mock.ANY``, are compared with ``==`` when a value
+    is missing. Other items stop at the first element they match.
+
     Args:
         *items: Expected values/criteria that must each match at least one element.
 
@@ -77,6 +155,8 @@ class contains(IterableCriteria):
         ```
     """
 
+    __slots__ = ("items", "_literals", "_searched")
+
     @classmethod
     def from_serialized(cls, serialized):
         items = serialized["items"]
@@ -84,15 +164,93 @@ class contains(IterableCriteria):
 
     def __init__(self, *items):
         self.items = [ensure_criteria(item) for item in items]
+        literals = {}
+        searched = []
+        for index, item in enumerate(self.items):
+            if _is_literal(item):
+                literals[item.value] = None
+            else:
+                searched.append(index)
+        self._literals = tuple(literals)
+        self._searched = tuple(searched)
+
+    def to_serialized(self) -> dict:
+        return {"items": self.items}
+
+    def _contains_literals(self, subject) -> bool:
+        literals = self._literals
+        if type(subject) in (list, tuple) and len(literals) <= _SCANNED_LITERALS:
+            return all(literal in subject for literal in literals)
+
+        try:
+            if isinstance(subject, _HASHED_COLLECTIONS):
+                elements = subject
+            else:
+                elements = set(subject)
+        except TypeError:
+            elements = {element for element in subject if _looked_up(element)}
+        missing = [literal for literal in literals if literal not in elements]
+        if not missing:
+            return True
+        others = [element for element in subject if not _looked_up(element)]
+        return all(any(e == literal for e in others) for literal in missing)
+
+    def _consumer(self, subject):
+        return _ContainsConsumer(self)
 
     def _match(self, subject):
-        for item in self.items:
-            matches = [item.run_match(s) for s in subject]
-            if not any(matches):
+        if _is_stream(subject):
+            return self._consumer(subject).run(subject)
+        if self._literals and not self._contains_literals(subject):
+            return False
+        for index in self._searched:
+            item = self.items[index]
+            if not any(item.run_match(s) for s in subject):
                 return False
         return True
 
 
+class _ContainsConsumer(Consumer):
+    __slots__ = ("literals", "searched")
+
+    def __init__(self, criteria: contains):
+        self.literals = set(criteria._literals)
+        self.searched = [criteria.items[index] for index in criteria._searched]
+
+    def feed(self, element):
+        literals = self.literals
+        if literals:
+            if _looked_up(element):
+                literals.discard(element)
+            else:
+                literals.difference_update([v for v in literals if element == v])
+        if self.searched:
+            self.searched = [
+                item for item in self.searched if not item.run_match(element)
+            ]
+        if literals or self.searched:
+            return None
+        return True
+
+    def finish(self):
+        return not self.literals and not self.searched
+
+
+def _looked_up(value) -> bool:
+    # Whether a set or dict lookup of ``value`` finds every literal it equals.
+    # Unhashable values and values such as ``mock.ANY`` have to be compared
+    # with ``==`` instead.
+    return _has_plain_equality(value) and type(value).__hash__ is not None
+
+
+def _is_literal(criteria: Criteria) -> bool:
+    # Whether ``criteria`` matches exactly the elements a set lookup of its
+    # value finds: a plain value equal to itself (so not NaN).
+    if type(criteria) is not is_eq:
+        return False
+    return _looked_up(criteria.value) and criteria.value == criteria.value
+
+
 class contains_exactly(IterableCriteria):
     """
     Match when the subject has exactly the expected items in the same order.
@@ -110,6 +268,8 @@ class contains_exactly(IterableCriteria):
         ```
     """
 
+    __slots__ = ("items",)
+
     @classmethod
     def from_serialized(cls, serialized):
         items = serialized["items"]
@@ -118,7 +278,12 @@ class contains_exactly(IterableCriteria):
     def __init__(self, *items):
         self.items = [ensure_criteria(item) for item in items]
 
+    def _consumer(self, subject):
+        return _ExactConsumer(self.items)
+
     def _match(self, subject):
+        if _is_stream(subject):
+            return self._consumer(subject).run(subject)
         try:
             return all(
                 item.run_match(sub_item)
@@ -126,3 +291,412 @@ class contains_exactly(IterableCriteria):
             )
         except ValueError:
             return False
+
+
+class _ExactConsumer(Consumer):
+    __slots__ = ("items", "index")
+
+    def __init__(self, items: list[Criteria]):
+        self.items = items
+        self.index = 0
+
+    def feed(self, element):
+        index = self.index
+        if index == len(self.items) or not self.items[index].run_match(element):
+            return False
+        self.index = index + 1
+        return None
+
+    def finish(self):
+        return self.index == len(self.items)
+
+
+class contains_in_any_order(IterableCriteria):
+    """
+    Match when each expected item matches a different element of the subject.
+
+    Unlike ``contains``, one element cannot satisfy two expected items, and
+    unlike ``contains_exactly`` the order does not matter. Extra elements are
+    allowed; combine with ``has_length`` to forbid them.
+
+    Exact strings, numbers and ``None`` are counted with a
+    ``collections.Counter``. Other
+    items are assigned to elements with Hopcroft-Karp maximum bipartite
+    matching, which takes polynomial time rather than trying every
+    permutation. Every such item is evaluated against every element once,
+    so the elements of an iterator are stored in a list first.
+
+    Args:
+        *items: Expected values/criteria, each matching a distinct element.
+
+    Example:
+        ```python
+        assert [3, 1, 2] == contains_in_any_order(1, 2, 3)         # passes
+        assert [1, 2] == contains_in_any_order(is_gt(0), 2)        # passes
+        assert [2, 9] == contains_in_any_order(is_gt(0), 2, 9)     # fails
+        assert [1, 2] == contains_in_any_order(is_gt(1), 2)        # fails
+        ```
+    """
+
+    __slots__ = ("items", "_literals", "_searched")
+
+    @classmethod
+    def from_serialized(cls, serialized):
+        items = serialized["items"]
+        return cls(*items)
+
+    def __init__(self, *items):
+        self.items = [ensure_criteria(item) for item in items]
+        literals = collections.Counter()
+        searched = []
+        for index, item in enumerate(self.items):
+            if _is_literal(item):
+                literals[item.value] += 1
+            else:
+                searched.append(index)
+        self._literals = tuple(literals.items())
+        self._searched = tuple(searched)
+
+    def to_serialized(self) -> dict:
+        return {"items": self.items}
+
+    def _match(self, subject):
+        elements = list(subject)
+        if len(elements) < len(self.items):
+            return False
+
+        # Indexes of the elements equal to each literal.
+        literals = dict(self._literals)
+        equal = {value: [] for value in literals}
+        # Elements compared with ``==`` that equal several literals.
+        shared = set()
+        for index, element in enumerate(elements):
+            if _looked_up(element):
+                group = equal.get(element)
+                if group is not None:
+                    group.append(index)
+                continue
+            groups = [g for value, g in equal.items() if element == value]
+            for group in groups:
+                group.append(index)
+            if len(groups) > 1:
+                shared.add(index)
+        for value, count in literals.items():
+            if len(equal[value]) < count:
+                return False
+
+        adjacency = []
+        for position in self._searched:
+            item = self.items[position]
+            matches = [
+                i for i, element in enumerate(elements) if item.run_match(element)
+            ]
+            if not matches:
+                return False
+            adjacency.append(matches)
+
+        # A literal whose elements no other item can match only needs enough
+        # of them; the others take part in the matching, once per expected
+        # occurrence.
+        contested = {index for matches in adjacency for index in matches} | shared
+        for value, count in literals.items():
+            indexes = equal[value]
+            if contested.intersection(indexes):
+                adjacency.extend([indexes] * count)
+
+        return _maximum_matching(adjacency, len(elements)) == len(adjacency)
+
+
+def _maximum_matching(adjacency: list[list[int]], right_size: int) -> int:
+    """
+    Size of a maximum matching of a bipartite graph, with Hopcroft-Karp.
+
+    ``adjacency[u]`` lists the right vertices left vertex ``u`` connects to.
+    """
+    match_left = [-1] * len(adjacency)
+    match_right = [-1] * right_size
+    size = 0
+    # Greedy start, most constrained vertices first, which often leaves few
+    # or no augmenting paths to search for.
+    for u in sorted(range(len(adjacency)), key=lambda u: len(adjacency[u])):
+        for v in adjacency[u]:
+            if match_right[v] == -1:
+                match_left[u] = v
+                match_right[v] = u
+                size += 1
+                break
+
+    while size < len(adjacency):
+        # Layer the graph by shortest alternating paths from free vertices.
+        distance = [-1] * len(adjacency)
+        queue = [u for u, v in enumerate(match_left) if v == -1]
+        for u in queue:
+            distance[u] = 0
+        # Layers beyond the first free right vertex hold no shortest path.
+        limit = None
+        for u in queue:
+            if limit is not None and distance[u] >= limit:
+                break
+            for v in adjacency[u]:
+                w = match_right[v]
+                if w == -1:
+                    limit = distance[u] + 1
+                elif distance[w] == -1:
+                    distance[w] = distance[u] + 1
+                    queue.append(w)
+        if limit is None:
+            break
+
+        # Augment along vertex disjoint shortest paths, depth first.
+        position = [0] * len(adjacency)
+        for root in range(len(adjacency)):
+            if match_left[root] != -1:
+                continue
+            path = [root]
+            while path:
+                u = path[-1]
+                neighbours = adjacency[u]
+                if position[u] == len(neighbours):
+                    distance[u] = -1
+                    path.pop()
+                    if path:
+                        position[path[-1]] += 1
+                    continue
+                w = match_right[neighbours[position[u]]]
+                if w == -1:
+                    # Flip the matching along the path.
+                    for node in path:
+                        right = adjacency[node][position[node]]
+                        match_left[node] = right
+                        match_right[right] = node
+                    size += 1
+                    break
+                if distance[w] == distance[u] + 1:
+                    path.append(w)
+                else:
+                    position[u] += 1
+    return size
+
+
+class one(Criteria):
+    """
+    A ``matches_sequence`` slot for exactly one element matching ``criteria``.
+
+    Plain values and criteria passed to ``matches_sequence`` are wrapped in
+    ``one`` automatically.
+
+    Args:
+        criteria: Value or criteria the element must match.
+    """
+
+    __slots__ = ("criteria",)
+
+    def __init__(self, criteria):
+        self.criteria = ensure_criteria(criteria)
+
+    def _match(self, subject):
+        return self.criteria.run_match(subject)
+
+
+class many(one):
+    """
+    A ``matches_sequence`` slot for any number of consecutive elements, zero
+    included, each matching ``criteria``.
+
+    Args:
+        criteria: Value or criteria every element must match.
+    """
+
+    __slots__ = ()
+
+
+class optional(one):
+    """
+    A ``matches_sequence`` slot for zero or one element matching ``criteria``.
+
+    Args:
+        criteria: Value or criteria the element must match, if present.
+    """
+
+    __slots__ = ()
+
+
+class any_gap(Criteria):
+    """
+    A ``matches_sequence`` slot for any number of elements, whatever they are.
+    """
+
+    __slots__ = ()
+
+    def _match(self, subject):
+        return True
+
+
+# Kinds of sequence slots.
+_ONE, _MANY, _OPTIONAL, _GAP = range(4)
+
+# An automaton remembers the transitions out of at most this many sets of
+# states, and starts over once it has seen more.
+_CACHED_STATES = 1024
+
+
+class _SequenceAutomaton:
+    """
+    The automaton of a sequence pattern, shared by every pattern with the
+    same kinds of slots.
+
+    State ``i`` is before slot ``i`` and the last state accepts. Sets of
+    states are bit masks, and the transitions out of each set are cached as
+    they are reached, building a deterministic automaton lazily.
+    """
+
+    __slots__ = ("kinds", "closures", "accepting", "settled", "_states")
+
+    def __init__(self, kinds: tuple[int, ...]):
+        self.kinds = kinds
+        # The states reachable from each state without reading an element.
+        closures = [1 << len(kinds)]
+        for index in reversed(range(len(kinds))):
+            closure = 1 << index
+            if kinds[index] != _ONE:
+                closure |= closures[-1]
+            closures.append(closure)
+        self.closures = tuple(reversed(closures))
+        self.accepting = 1 << len(kinds)
+        # States that accept whatever follows: gaps that reach the end.
+        self.settled = 0
+        for index, kind in enumerate(kinds):
+            if kind == _GAP and self.closures[index] & self.accepting:
+                self.settled |= 1 << index
+        self._states: dict[int, tuple] = {}
+
+    def state(self, states: int) -> tuple:
+        """
+        The slots to test when reading an element from ``states``, the states
+        reached whatever the tests say, and the transitions seen so far.
+        """
+        cached = self._states.get(states)
+        if cached is not None:
+            return cached
+        tests = []
+        reached = 0
+        for index, kind in enumerate(self.kinds):
+            if states >> index & 1:
+                if kind == _GAP:
+                    reached |= self.closures[index]
+                else:
+                    tests.append(index)
+        if len(self._states) >= _CACHED_STATES:
+            self._states.clear()
+        cached = self._states[states] = (tuple(tests), reached, {})
+        return cached
+
+    def step(self, states: int, passed: int) -> int:
+        """
+        The states reached from ``states`` when the slots in ``passed`` match.
+        """
+        tests, reached, transitions = self.state(states)
+        following = transitions.get(passed)
+        if following is None:
+            following = reached
+            for index in tests:
+                if passed >> index & 1:
+                    if self.kinds[index] == _MANY:
+                        following |= self.closures[index]
+                    else:
+                        following |= self.closures[index + 1]
+            transitions[passed] = following
+        return following
+
+
+@functools.lru_cache(maxsize=256)
+def _automaton_for(kinds: tuple[int, ...]) -> _SequenceAutomaton:
+    return _SequenceAutomaton(kinds)
+
+
+def _slot_kind(item: Criteria) -> int:
+    if isinstance(item, any_gap):
+        return _GAP
+    if isinstance(item, many):
+        return _MANY
+    if isinstance(item, optional):
+        return _OPTIONAL
+    return _ONE
+
+
+class matches_sequence(IterableCriteria):
+    """
+    Match when the elements of the subject, in order, follow a pattern.
+
+    Each slot of the pattern is ``one``, ``many``, ``optional`` or
+    ``any_gap``, and plain values or criteria stand for ``one``. The whole
+    subject must follow the pattern, so ``matches_sequence(a, b, c)`` is
+    ``contains_exactly(a, b, c)``; start or end the pattern with
+    ``any_gap()`` to allow other elements around it.
+
+    The pattern runs as a nondeterministic automaton, whose sets of current
+    states are cached as a deterministic automaton as they are reached.
+    Every element is read once and each slot is tested at most once per
+    element, so matching takes linear time without backtracking. Reading
+    stops as soon as the result is known, which also suits iterators.
+
+    Args:
+        *items: Pattern slots, in order.
+
+    Example:
+        ```python
+        events = ["login", "read", "read", "logout"]
+        assert events == matches_sequence("login", many("read"), "logout")      # passes
+        assert events == matches_sequence(any_gap(), "logout")                  # passes
+        assert events == matches_sequence("login", optional("read"), "logout")  # fails
+
+        assert mock.mock_calls == matches_sequence(call.open(), any_gap(), call.close())
+        ```
+    """
+
+    __slots__ = ("items", "_automaton")
+
+    @classmethod
+    def from_serialized(cls, serialized):
+        items = serialized["items"]
+        return cls(*items)
+
+    def __init__(self, *items):
+        self.items = [
+            item if isinstance(item, (one, any_gap)) else one(item) for item in items
+        ]
+        self._automaton = _automaton_for(tuple(map(_slot_kind, self.items)))
+
+    def to_serialized(self) -> dict:
+        return {"items": self.items}
+
+    def _consumer(self, subject):
+        return _SequenceConsumer(self.items, self._automaton)
+
+    def _match(self, subject):
+        return self._consumer(subject).run(subject)
+
+
+class _SequenceConsumer(Consumer):
+    __slots__ = ("items", "automaton", "states")
+
+    def __init__(self, items: list[Criteria], automaton: _SequenceAutomaton):
+        self.items = items
+        self.automaton = automaton
+        self.states = automaton.closures[0]
+
+    def feed(self, element):
+        automaton = self.automaton
+        if self.states & automaton.settled:
+            return True
+        passed = 0
+        for index in automaton.state(self.states)[0]:
+            if self.items[index].run_match(element):
+                passed |= 1 << index
+        self.states = automaton.step(self.states, passed)
+        if not self.states:
+            return False
+        return True if self.states & automaton.settled else None
+
+    def finish(self):
+        return bool(self.states & self.automaton.accepting)
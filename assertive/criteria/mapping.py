@@ -11,6 +11,8 @@ class MappingCriteria(Criteria):
     Subclasses require the subject to implement ``collections.abc.Mapping``.
     """
 
+    __slots__ = ()
+
     def _before_run(self, subject):
         if not isinstance(subject, Mapping):
             raise TypeError(f"{subject} needs to be mapping")
@@ -34,6 +36,8 @@ class has_key_values(MappingCriteria):
         ```
     """
 
+    __slots__ = ("key_values",)
+
     def __init__(self, key_values: Mapping):
         self.key_values = {k: ensure_criteria(v) for k, v in key_values.items()}
 
@@ -65,6 +69,8 @@ class has_key_and_value(has_key_values):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, key: Any, value: Any):
         super().__init__({key: value})
 
@@ -87,6 +93,8 @@ class has_exact_key_values(has_key_values):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, key_values):
         self.key_values = {k: ensure_criteria(v) for k, v in key_values.items()}
 
@@ -114,6 +122,8 @@ class contains_keys(MappingCriteria):
         ```
     """
 
+    __slots__ = ("key_criteria",)
+
     def __init__(self, *keys):
         self.key_criteria = [(ensure_criteria(k)) for k in keys]
 
@@ -140,6 +150,8 @@ class contains_exact_keys(contains_keys):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject: Mapping):
         if len(subject.keys()) != len(self.key_criteria):
             return False
@@ -34,6 +34,8 @@ class was_called_with(TimesMixin, Criteria):
         ```
     """
 
+    __slots__ = ("expected_args", "expected_kwargs")
+
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.expected_args = tuple(ensure_criteria(arg) for arg in args)
@@ -41,16 +43,8 @@ class was_called_with(TimesMixin, Criteria):
             key: ensure_criteria(value) for key, value in kwargs.items()
         }
 
-    def _get_matching_calls(self, mock_obj: Mock):
-        return [
-            call_args
-            for call_args in mock_obj.call_args_list
-            if self._match_single_call(call_args)
-        ]
-
     def _match(self, subject):
-        matching_calls = self._get_matching_calls(subject)
-        return self.times_criteria.run_match(len(matching_calls))
+        return self._count_matches(map(self._match_single_call, subject.call_args_list))
 
     def _match_single_call(self, call_args):
         actual_args, actual_kwargs = call_args
@@ -95,6 +89,8 @@ class was_called_exactly_with(TimesMixin, Criteria):
         ```
     """
 
+    __slots__ = ("expected_args", "expected_kwargs")
+
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.expected_args = tuple(ensure_criteria(arg) for arg in args)
@@ -102,16 +98,8 @@ class was_called_exactly_with(TimesMixin, Criteria):
             key: ensure_criteria(value) for key, value in kwargs.items()
         }
 
-    def _get_matching_calls(self, mock_obj: Mock):
-        return [
-            call_args
-            for call_args in mock_obj.call_args_list
-            if self._match_single_call(call_args)
-        ]
-
     def _match(self, subject):
-        matching_calls = self._get_matching_calls(subject)
-        return self.times_criteria.run_match(len(matching_calls))
+        return self._count_matches(map(self._match_single_call, subject.call_args_list))
 
     def _match_single_call(self, call_args):
         actual_args, actual_kwargs = call_args
@@ -156,6 +144,8 @@ class was_called(TimesMixin, Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -181,6 +171,8 @@ class was_called_once(WrappedCriteria):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(was_called().once())
 
@@ -202,6 +194,8 @@ class was_called_once_with(WrappedCriteria):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(was_called_with(*args, **kwargs).once())
 
@@ -224,6 +218,8 @@ class was_called_once_exactly_with(WrappedCriteria):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(was_called_exactly_with(*args, **kwargs).once())
 
@@ -244,6 +240,8 @@ class was_not_called(WrappedCriteria):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(was_called().never())
 
@@ -266,6 +264,8 @@ class was_not_called_with(WrappedCriteria):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(was_called_with(*args, **kwargs).never())
 
@@ -288,6 +288,8 @@ class was_not_called_exactly_with(WrappedCriteria):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(was_called_exactly_with(*args, **kwargs).never())
 
@@ -314,6 +316,8 @@ class was_awaited_with(TimesMixin, Criteria):
         ```
     """
 
+    __slots__ = ("expected_args", "expected_kwargs")
+
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.expected_args = tuple(ensure_criteria(arg) for arg in args)
@@ -321,16 +325,10 @@ class was_awaited_with(TimesMixin, Criteria):
             key: ensure_criteria(value) for key, value in kwargs.items()
         }
 
-    def _get_matching_calls(self, mock_obj: AsyncMock):
-        return [
-            call_args
-            for call_args in mock_obj.await_args_list
-            if self._match_single_call(call_args)
-        ]
-
     def _match(self, subject):
-        matching_calls = self._get_matching_calls(subject)
-        return self.times_criteria.run_match(len(matching_calls))
+        return self._count_matches(
+            map(self._match_single_call, subject.await_args_list)
+        )
 
     def _match_single_call(self, call_args):
         actual_args, actual_kwargs = call_args
@@ -360,6 +358,8 @@ class was_awaited_exactly_with(TimesMixin, Criteria):
         **kwargs: Exact expected keyword await arguments.
     """
 
+    __slots__ = ("expected_args", "expected_kwargs")
+
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.expected_args = tuple(ensure_criteria(arg) for arg in args)
@@ -367,16 +367,10 @@ class was_awaited_exactly_with(TimesMixin, Criteria):
             key: ensure_criteria(value) for key, value in kwargs.items()
         }
 
-    def _get_matching_calls(self, mock_obj: AsyncMock):
-        return [
-            call_args
-            for call_args in mock_obj.await_args_list
-            if self._match_single_call(call_args)
-        ]
-
     def _match(self, subject):
-        matching_calls = self._get_matching_calls(subject)
-        return self.times_criteria.run_match(len(matching_calls))
+        return self._count_matches(
+            map(self._match_single_call, subject.await_args_list)
+        )
 
     def _match_single_call(self, call_args):
         actual_args, actual_kwargs = call_args
@@ -406,6 +400,8 @@ class was_awaited(TimesMixin, Criteria):
     to express exact or minimum await counts.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -418,6 +414,8 @@ class was_awaited_once(WrappedCriteria):
     Convenience wrapper for ``was_awaited().once()``.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(was_awaited().once())
 
@@ -431,6 +429,8 @@ class was_awaited_once_with(WrappedCriteria):
         **kwargs: Expected keyword await arguments (subset matching).
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(was_awaited_with(*args, **kwargs).once())
 
@@ -444,6 +444,8 @@ class was_awaited_once_exactly_with(WrappedCriteria):
         **kwargs: Exact expected keyword await arguments.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(was_awaited_exactly_with(*args, **kwargs).once())
 
@@ -453,6 +455,8 @@ class was_not_awaited(WrappedCriteria):
     Convenience wrapper for ``was_awaited().never()``.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(was_awaited().never())
 
@@ -466,6 +470,8 @@ class was_not_awaited_with(WrappedCriteria):
         **kwargs: Keyword await arguments that must not occur.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(was_awaited_with(*args, **kwargs).never())
 
@@ -479,5 +485,7 @@ class was_not_awaited_exactly_with(WrappedCriteria):
         **kwargs: Exact keyword await arguments that must not occur.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(was_awaited_exactly_with(*args, **kwargs).never())
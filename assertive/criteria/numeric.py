@@ -1,8 +1,12 @@
 import math
 from typing import Mapping, Union
 
+from assertive.budget import checkpoint
 from assertive.core import Criteria, ensure_criteria
 
+# Iterations between checks of the evaluation budget in long running loops.
+_CHECKPOINT_INTERVAL = 4096
+
 
 class is_multiple_of(Criteria):
     """
@@ -21,6 +25,8 @@ class is_multiple_of(Criteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         self.value = value
 
@@ -41,6 +47,8 @@ class is_even(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         return subject % 2 == 0
 
@@ -56,6 +64,8 @@ class is_odd(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         return subject % 2 == 1
 
@@ -77,6 +87,8 @@ class as_absolute_matches(Criteria):
         ```
     """
 
+    __slots__ = ("inner_criteria",)
+
     def __init__(self, inner_criteria: Union[int, float, complex, Criteria]):
         self.inner_criteria = ensure_criteria(inner_criteria)
 
@@ -99,6 +111,8 @@ class is_approximately_equal(Criteria):
         ```
     """
 
+    __slots__ = ("value", "epsilon")
+
     @classmethod
     def from_serialized(cls, serialized: Mapping) -> Criteria:
         value = serialized["value"]
@@ -131,6 +145,8 @@ class is_positive(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         return subject > 0
 
@@ -147,6 +163,8 @@ class is_non_negative(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         return subject >= 0
 
@@ -163,6 +181,8 @@ class is_negative(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         return subject < 0
 
@@ -179,6 +199,8 @@ class is_non_positive(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         return subject <= 0
 
@@ -195,6 +217,8 @@ class zero(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         return subject == 0
 
@@ -211,6 +235,8 @@ class approximately_zero(Criteria):
         ```
     """
 
+    __slots__ = ("epsilon",)
+
     @classmethod
     def from_serialized(cls, serialized: Mapping) -> Criteria:
         criteria = cls()
@@ -240,6 +266,8 @@ class is_a_perfect_square(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         root = int(subject**0.5)
         return root * root == subject
@@ -260,15 +288,23 @@ class is_a_power_of(Criteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
     def _match(self, subject) -> bool:
-        if self.value == 1:
-            return subject == 1
+        if self.value in (0, 1, -1):
+            # Powers of these bases repeat, the loop below would never end.
+            return subject in {self.value**n for n in range(3)}
         power = 1
+        iterations = 0
         while power < subject:
             power *= self.value
+            iterations += 1
+            if iterations == _CHECKPOINT_INTERVAL:
+                checkpoint(self, iterations)
+                iterations = 0
         return power == subject
 
 
@@ -286,12 +322,22 @@ class is_prime(Criteria):
         ```
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         if subject < 2:
             return False
-        for i in range(2, int(subject**0.5) + 1):
-            if subject % i == 0:
-                return False
+        if isinstance(subject, int):
+            # Exact, and does not overflow for integers beyond float range.
+            limit = math.isqrt(subject) + 1
+        else:
+            limit = int(subject**0.5) + 1
+        for start in range(2, limit, _CHECKPOINT_INTERVAL):
+            end = min(start + _CHECKPOINT_INTERVAL, limit)
+            for i in range(start, end):
+                if subject % i == 0:
+                    return False
+            checkpoint(self, end - start)
         return True
 
 
@@ -312,6 +358,8 @@ class is_coprime_with(Criteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
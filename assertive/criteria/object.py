@@ -27,6 +27,8 @@ class has_attributes(Criteria):
         ```
     """
 
+    __slots__ = ("attributes",)
+
     def __init__(self, **attributes):
         self.attributes = {k: ensure_criteria(v) for k, v in attributes.items()}
 
@@ -67,6 +69,8 @@ class is_type(Criteria):
         ```
     """
 
+    __slots__ = ("expected",)
+
     def __init__(self, expected: type):
         self.expected = expected
 
@@ -100,6 +104,8 @@ class is_exact_type(Criteria):
         ```
     """
 
+    __slots__ = ("expected",)
+
     def __init__(self, expected: type):
         self.expected = expected
 
@@ -134,6 +140,8 @@ class class_match(WrappedCriteria):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, cls: type, **attributes):
         super().__init__(is_type(cls) & has_attributes(**attributes))
 
@@ -166,5 +174,7 @@ class strict_class_match(WrappedCriteria):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, cls: type, **attributes):
         super().__init__(is_exact_type(cls) & has_attributes(**attributes))
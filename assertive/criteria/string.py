@@ -1,8 +1,16 @@
+import functools
 import re
-from typing import Any
-
-from assertive.core import Criteria, ensure_criteria
+from typing import Any, NamedTuple, Optional
+
+from assertive.core import Criteria, ensure_criteria, is_eq
+from assertive.criteria.mapping import (
+    has_exact_key_values,
+    has_key_and_value,
+    has_key_values,
+)
 from assertive.criteria.utils import TimesMixin
+from assertive.json_cache import _CACHE as _JSON_CACHE
+from assertive.regex_safety import _check_construction
 import json
 
 
@@ -14,34 +22,86 @@ class StringCriteria(Criteria):
     tested subject is not a string.
     """
 
+    __slots__ = ()
+
     def _before_run(self, subject):
         if not isinstance(subject, str):
             raise TypeError(f"{subject} needs to be a string")
 
 
+_REGEX_MODES = ("match", "search", "fullmatch")
+
+
 class regex(StringCriteria):
     """
     Match strings using a regular expression pattern.
 
-    Matching uses ``re.match``, so the pattern is applied from the start
-    of the string.
+    By default matching uses ``re.match``, so the pattern is applied from the
+    start of the string. Use ``mode="search"`` to find the pattern anywhere in
+    the string, or ``mode="fullmatch"`` to require the whole string to match.
+
+    The pattern is compiled once, on first use, and kept on the criteria, so
+    large numbers of distinct patterns do not churn the ``re`` module cache.
 
     Args:
-        pattern: Regular expression pattern.
+        pattern: Regular expression pattern, as a string or compiled pattern.
+        mode: One of ``"match"``, ``"search"`` or ``"fullmatch"``.
+        flags: ``re`` flags, e.g. ``re.IGNORECASE``.
+
+    Patterns can be checked for catastrophic backtracking when created, see
+    ``assertive.regex_safety.enforce_regex_safety``.
+
+    Raises:
+        ValueError: If ``mode`` is not a supported mode.
 
     Example:
         ```python
-        assert "abc" == regex(r"abc")      # passes
-        assert "abc" == regex(r"abc|def")  # passes
-        assert "abc" == regex(r"def")      # fails
+        assert "abc" == regex(r"abc")                   # passes
+        assert "abc" == regex(r"abc|def")               # passes
+        assert "abc" == regex(r"def")                   # fails
+        assert "xabc" == regex(r"abc", mode="search")   # passes
+        assert "abcd" == regex(r"abc", mode="fullmatch")  # fails
+        assert "ABC" == regex(r"abc", flags=re.IGNORECASE)  # passes
         ```
     """
 
-    def __init__(self, pattern):
+    __slots__ = ("pattern", "mode", "flags", "_compiled")
+
+    def __init__(self, pattern, mode: str = "match", flags: int = 0):
+        if mode not in _REGEX_MODES:
+            raise ValueError(
+                f"{mode!r} is not a regex mode, use one of {', '.join(_REGEX_MODES)}"
+            )
+        if isinstance(pattern, re.Pattern):
+            self._compiled = pattern
+            flags = pattern.flags
+            pattern = pattern.pattern
         self.pattern = pattern
+        self.mode = mode
+        self.flags = int(flags)
+        _check_construction(pattern, self.flags)
+
+    def to_serialized(self) -> dict:
+        serialized = {"pattern": self.pattern}
+        if self.mode != "match":
+            serialized["mode"] = self.mode
+        if self.flags:
+            serialized["flags"] = self.flags
+        return serialized
+
+    @property
+    def compiled(self) -> re.Pattern:
+        """
+        The compiled pattern.
+        """
+        try:
+            return self._compiled
+        except AttributeError:
+            self._compiled = re.compile(self.pattern, self.flags)
+            return self._compiled
 
     def _match(self, subject) -> bool:
-        return bool(re.match(self.pattern, subject))
+        return getattr(self.compiled, self.mode)(subject) is not None
 
 
 class starts_with(StringCriteria):
@@ -59,6 +119,8 @@ class starts_with(StringCriteria):
         ```
     """
 
+    __slots__ = ("prefix",)
+
     def __init__(self, prefix):
         self.prefix = prefix
 
@@ -81,6 +143,8 @@ class ends_with(StringCriteria):
         ```
     """
 
+    __slots__ = ("suffix",)
+
     def __init__(self, suffix):
         self.suffix = suffix
 
@@ -88,13 +152,20 @@ class ends_with(StringCriteria):
         return subject.endswith(self.suffix)
 
 
+# Occurrences are searched one at a time, stopping once the count is decided,
+# only when that takes fewer searches than this. Otherwise ``str.count``
+# counts them all faster.
+_SEARCHED_OCCURRENCES = 16
+
+
 class contains_substring(TimesMixin, StringCriteria):
     """
     Match strings by counting occurrences of a substring.
 
     This criteria integrates with ``TimesMixin``. By default it expects
     at least one occurrence, and you can refine that with ``once()``,
-    ``twice()``, ``times(n)``, or any numeric criteria.
+    ``twice()``, ``times(n)``, or any numeric criteria. Searching stops
+    once the count is decided, e.g. at the first occurrence by default.
 
     Args:
         substring: Substring to count within the subject.
@@ -106,14 +177,27 @@ class contains_substring(TimesMixin, StringCriteria):
         ```
     """
 
+    __slots__ = ("substring",)
+
     def __init__(self, substring: str):
         super().__init__()
         self.substring = substring
 
     def _match(self, subject: str) -> bool:
+        bounds = [bound for bound in self.decision_bounds() if bound is not None]
+        if self.substring and bounds and min(bounds) <= _SEARCHED_OCCURRENCES:
+            return self._count_matches(_occurrences(subject, self.substring))
         return self.times_criteria.run_match(subject.count(self.substring))
 
 
+def _occurrences(subject: str, substring: str):
+    # Yield once per non-overlapping occurrence, as ``str.count`` counts them.
+    start = subject.find(substring)
+    while start != -1:
+        yield True
+        start = subject.find(substring, start + len(substring))
+
+
 class ignore_case(StringCriteria):
     """
     Match strings case-insensitively against ``value``.
@@ -129,6 +213,8 @@ class ignore_case(StringCriteria):
         ```
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str):
         self.value = value
 
@@ -136,24 +222,212 @@ class ignore_case(StringCriteria):
         return subject.lower() == self.value.lower()
 
 
+class _JsonTokens(NamedTuple):
+    object_start: re.Pattern
+    key: re.Pattern
+    separator: re.Pattern
+    string: re.Pattern
+    scalar: re.Pattern
+    opening: re.Pattern
+    bracket: re.Pattern
+
+
+_JSON_STRING = r'"([^"\\]*(?:\\.[^"\\]*)*)"'
+
+# Just enough of the JSON grammar to find the members of an object and skip
+# over their values. A UTF-8 byte order mark is allowed in bytes, as in
+# ``json.loads``.
+_JSON_PATTERNS = _JsonTokens(
+    object_start=r"[ \t\n\r]*\{[ \t\n\r]*(\})?",
+    key=_JSON_STRING + r"[ \t\n\r]*:[ \t\n\r]*",
+    separator=r"[ \t\n\r]*(?:(,)[ \t\n\r]*|\})",
+    string=_JSON_STRING,
+    scalar=r'[^ \t\n\r,:\[\]{}"]+',
+    opening=r"[\[{]",
+    # Everything up to and including the next bracket outside of a string.
+    bracket=r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*(?:([\[{])|[\]}])',
+)
+
+
+@functools.cache
+def _json_tokens(kind: type) -> _JsonTokens:
+    if kind is str:
+        return _JsonTokens(*(re.compile(pattern) for pattern in _JSON_PATTERNS))
+    patterns = [pattern.encode() for pattern in _JSON_PATTERNS]
+    patterns[0] = rb"(?:\xef\xbb\xbf)?" + patterns[0]
+    return _JsonTokens(*(re.compile(pattern) for pattern in patterns))
+
+
+def _load_json(subject):
+    if isinstance(subject, memoryview):
+        subject = subject.tobytes()
+    return json.loads(subject)
+
+
+def _parse_json(subject):
+    # Whole documents go through the active ``use_json_cache``, if any.
+    cache = _JSON_CACHE.get()
+    if cache is not None:
+        return cache.parse(subject)
+    return _load_json(subject)
+
+
+def _skip_json_value(tokens: _JsonTokens, subject, pos: int) -> Optional[int]:
+    # End of the value starting at ``pos``, or ``None`` if it is malformed.
+    match = tokens.string.match(subject, pos) or tokens.scalar.match(subject, pos)
+    if match is not None:
+        return match.end()
+    if tokens.opening.match(subject, pos) is None:
+        return None
+    depth = 1
+    pos += 1
+    while depth:
+        match = tokens.bracket.match(subject, pos)
+        if match is None:
+            return None
+        depth += 1 if match.lastindex else -1
+        pos = match.end()
+    return pos
+
+
+def _json_key(match: re.Match) -> str:
+    raw = match.group(1)
+    if isinstance(raw, str):
+        return raw if "\\" not in raw else json.loads(match.group(0).rstrip(": \t\n\r"))
+    if b"\\" not in raw:
+        return raw.decode()
+    return json.loads(match.group(0).rstrip(b": \t\n\r"))
+
+
+def _match_json_keys(subject, key_values: dict, exact: bool) -> Optional[bool]:
+    """
+    Match the members of the JSON object in ``subject`` against
+    ``key_values``, parsing only the values of those keys.
+
+    Returns ``None`` when the subject cannot be read this way, for example
+    when it is not an object, has duplicate keys or is malformed, and has to
+    be parsed in full instead.
+    """
+    tokens = _json_tokens(str if isinstance(subject, str) else bytes)
+    match = tokens.object_start.match(subject)
+    if match is None:
+        return None
+    if match.lastindex:
+        return not key_values
+    remaining = dict(key_values)
+    if not remaining and not exact:
+        return True
+
+    pos = match.end()
+    while True:
+        match = tokens.key.match(subject, pos)
+        if match is None:
+            return None
+        pos = match.end()
+        try:
+            key = _json_key(match)
+        except ValueError:
+            return None
+        criteria = remaining.pop(key, None)
+        if criteria is None and key in key_values:
+            return None
+        if criteria is None and exact:
+            return False
+
+        end = _skip_json_value(tokens, subject, pos)
+        if end is None:
+            return None
+        if criteria is not None:
+            try:
+                value = _load_json(subject[pos:end])
+            except ValueError:
+                return None
+            if not criteria.run_match(value):
+                return False
+            if not remaining and not exact:
+                return True
+
+        match = tokens.separator.match(subject, end)
+        if match is None:
+            return None
+        pos = match.end()
+        if not match.lastindex:
+            break
+    return not remaining
+
+
 class as_json_matches(StringCriteria):
     """
     Parse the subject as JSON and match the parsed value with nested criteria.
 
+    The subject can be a string, or UTF-8 encoded ``bytes``, ``bytearray`` or
+    ``memoryview``.
+
+    With ``partial=True``, when the inner criteria only looks at some keys of
+    an object (``has_key_values``, ``has_key_and_value``,
+    ``has_exact_key_values`` or a plain ``dict``), only the values of those
+    keys are parsed. Other values are skipped without building any objects,
+    and reading stops as soon as the result is known, so a large document is
+    usually not read in full. Values are checked in document order. This is
+    opt-in because the parts of the document that are skipped are not
+    validated and keys are assumed to be unique: a malformed document or a
+    later duplicate key can give a result where ``json.loads`` would raise or
+    keep the last value.
+
+    Criteria testing the same payload can share a single parse through
+    ``assertive.json_cache.use_json_cache``.
+
     Args:
         inner_criteria: Value or criteria applied to ``json.loads(subject)``.
+        partial: Only parse the keys the inner criteria needs, when possible,
+            without validating the rest of the document.
 
     Example:
         ```python
         assert '{"key": "value"}' == as_json_matches({"key": "value"}) # passes
         assert '{"n": 5}' == as_json_matches({"n": is_gt(0)})          # passes
         assert '{"key": "value"}' == as_json_matches({"key": "x"})     # fails
+        assert b'{"status": 200, "body": [...]}' == as_json_matches(
+            has_key_values({"status": 200}), partial=True
+        )  # passes, reads only "status"
         ```
     """
 
-    def __init__(self, inner_criteria: Criteria | Any):
+    __slots__ = ("inner_criteria", "partial")
+
+    def __init__(self, inner_criteria: Criteria | Any, partial: bool = False):
         self.inner_criteria = ensure_criteria(inner_criteria)
+        self.partial = partial
+
+    def _read_keys(self) -> Optional[tuple[dict, bool]]:
+        # Keys the inner criteria reads and whether it rejects any other key.
+        # Worked out on every use rather than stored, so that it follows
+        # ``inner_criteria`` when the optimizer replaces it.
+        inner = self.inner_criteria
+        kind = type(inner)
+        if kind in (has_key_values, has_key_and_value):
+            return inner.key_values, False
+        if kind is has_exact_key_values:
+            return inner.key_values, True
+        if kind is is_eq and type(inner.value) is dict:
+            return {k: ensure_criteria(v) for k, v in inner.value.items()}, True
+        return None
+
+    def to_serialized(self) -> dict:
+        serialized = {"inner_criteria": self.inner_criteria}
+        if self.partial:
+            serialized["partial"] = True
+        return serialized
 
-    def _match(self, subject: str) -> bool:
-        parsed_json = json.loads(subject)
+    def _before_run(self, subject):
+        if not isinstance(subject, (str, bytes, bytearray, memoryview)):
+            raise TypeError(f"{subject} needs to be a string or bytes")
+
+    def _match(self, subject) -> bool:
+        keys = self._read_keys() if self.partial else None
+        if keys is not None and _JSON_CACHE.get() is None:
+            result = _match_json_keys(subject, *keys)
+            if result is not None:
+                return result
+        parsed_json = _parse_json(subject)
         return self.inner_criteria.run_match(parsed_json)
@@ -1,6 +1,7 @@
-from typing import Any, Callable, Union
+from typing import Any, Callable, Iterable, Optional, Union
 
 from assertive.core import Criteria, ensure_criteria
+from assertive.intervals import count_bounds
 
 from .basic import is_gte
 
@@ -13,6 +14,8 @@ class AnyCriteria(Criteria):
     and want the rest to pass unconditionally.
     """
 
+    __slots__ = ()
+
     def _match(self, subject) -> bool:
         return True
 
@@ -32,6 +35,8 @@ class PredicateCriteria(Criteria):
         description: Human-readable label describing the predicate.
     """
 
+    __slots__ = ("predicate", "_description")
+
     def __init__(self, predicate: Callable[[Any], bool], description: str):
         self.predicate = predicate
         self._description = description
@@ -48,6 +53,8 @@ class WrappedCriteria(Criteria):
     composed expressions.
     """
 
+    __slots__ = ("inner_criteria",)
+
     def __init__(self, inner_criteria: Criteria):
         self.inner_criteria = inner_criteria
 
@@ -61,8 +68,14 @@ class WrappedCriteria(Criteria):
 class TimesMixin:
     """
     Mixin class that provides methods for specifying the number of times an action should occur.
+
+    Occurrences are counted with ``_count_matches``, which stops as soon as
+    ``times_criteria`` is decided, e.g. at the second occurrence for
+    ``once()``.
     """
 
+    __slots__ = ("times_criteria",)
+
     def __init__(self):
         self.times_criteria = is_gte(1)
 
@@ -117,3 +130,37 @@ class TimesMixin:
             self: The current instance of the class, allowing for method chaining.
         """
         return self.times(is_gte(number))
+
+    def decision_bounds(self) -> tuple[Optional[int], Optional[int]]:
+        """
+        Return the counts from which ``times_criteria`` is decided.
+
+        The first is the count from which every larger count matches, as for
+        ``at_least_times``, and the second the count from which none does, as
+        for ``once()`` or ``never()``. Either is ``None`` when counting has to
+        go to the end, e.g. for criteria that are not integers or ranges.
+        """
+        return count_bounds(self.times_criteria)
+
+    def _count_matches(self, occurrences: Iterable[Any]) -> bool:
+        """
+        Match the number of truthy ``occurrences`` against ``times_criteria``,
+        reading no further than needed.
+        """
+        matching, failing = self.decision_bounds()
+        if matching is not None and matching <= 0:
+            return True
+        if failing is not None and failing <= 0:
+            return False
+        if matching is None and failing is None:
+            return self.times_criteria.run_match(sum(map(bool, occurrences)))
+
+        count = 0
+        for occurred in occurrences:
+            if occurred:
+                count += 1
+                if count == matching:
+                    return True
+                if count == failing:
+                    return False
+        return self.times_criteria.run_match(count)
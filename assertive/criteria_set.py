@@ -0,0 +1,258 @@
+import itertools
+from collections.abc import Hashable, Iterator, Mapping
+from typing import Any
+
+from assertive.compiler import compile
+from assertive.core import (
+    AndCriteria,
+    Criteria,
+    OrCriteria,
+    _has_plain_equality,
+    ensure_criteria,
+    is_eq,
+)
+from assertive.criteria.mapping import has_exact_key_values, has_key_values
+from assertive.criteria.string import regex
+from assertive.criteria.utils import WrappedCriteria
+from assertive.regex_set import RegexSet
+
+Path = tuple
+Constraint = tuple[Path, Hashable]
+
+_MISSING = object()
+
+
+def _is_indexable(value) -> bool:
+    if not _has_plain_equality(value):
+        return False
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _equality_constraints(criteria: Criteria, path: Path = ()) -> Iterator[Constraint]:
+    """
+    Yield ``(key_path, value)`` pairs that must hold for ``criteria`` to match.
+    """
+    kind = type(criteria)
+    if kind is is_eq:
+        if _is_indexable(criteria.value):
+            yield path, criteria.value
+    elif kind is AndCriteria:
+        for item in criteria.items:
+            yield from _equality_constraints(item, path)
+    elif isinstance(criteria, WrappedCriteria) and (
+        kind._match is WrappedCriteria._match
+    ):
+        yield from _equality_constraints(criteria.inner_criteria, path)
+    elif isinstance(criteria, has_key_values) and (
+        kind._match in (has_key_values._match, has_exact_key_values._match)
+    ):
+        for key, value_criteria in criteria.key_values.items():
+            yield from _equality_constraints(value_criteria, (*path, key))
+
+
+def _resolve(subject, path: Path):
+    for key in path:
+        if not isinstance(subject, Mapping) or key not in subject:
+            return _MISSING
+        subject = subject[key]
+    return subject
+
+
+class _Rule:
+    def __init__(self, name, order: int, criteria: Criteria, constraint):
+        self.name = name
+        self.order = order
+        self.criteria = criteria
+        self.function = compile(criteria)
+        self.constraint = constraint
+
+
+def _rejects_type(criteria: Criteria, subject) -> bool:
+    # Whether ``criteria`` refuses the type of ``subject`` before matching, as
+    # string criteria do for mappings. Errors raised while matching, such as
+    # from a predicate, are not caught.
+    kind = type(criteria)
+    if kind is AndCriteria:
+        return any(_rejects_type(item, subject) for item in criteria.items)
+    if kind is OrCriteria:
+        return all(_rejects_type(item, subject) for item in criteria.items)
+    try:
+        criteria._before_run(subject)
+    except TypeError:
+        return True
+    return False
+
+
+def _matches(rule: _Rule, subject) -> bool:
+    return not _rejects_type(rule.criteria, subject) and rule.function(subject)
+
+
+class CriteriaSet:
+    """
+    A named collection of criteria that finds every rule matching a subject.
+
+    Rules that require an exact string, number or ``None`` somewhere in the
+    subject, such as ``has_key_values({"type": "order"})``, are hash-indexed
+    by key path and value. ``matching`` then only evaluates the rules whose indexed value is
+    present in the subject, plus the rules that could not be indexed, instead
+    of every rule in the set.
+
+    A rule whose indexed key path is missing from the subject (or runs
+    through a value that is not a mapping) is skipped without being evaluated.
+
+    ``regex`` rules are matched together through a ``RegexSet``, which
+    tests many patterns with a single combined pattern.
+
+    Args:
+        rules: Optional mapping of rule names to values or criteria.
+
+    Example:
+        ```python
+        rules = CriteriaSet(
+            {
+                "orders": has_key_values({"type": "order"}),
+                "big": has_key_values({"type": "order", "total": is_gt(100)}),
+                "refunds": has_key_values({"type": "refund"}),
+            }
+        )
+
+        assert rules.matching({"type": "order", "total": 150}) == ["orders", "big"]
+        ```
+    """
+
+    def __init__(self, rules: Mapping[Hashable, Any] | None = None):
+        self._rules: dict[Hashable, _Rule] = {}
+        self._index: dict[Path, dict[Hashable, set[Hashable]]] = {}
+        self._unindexed: set[Hashable] = set()
+        self._regexes = RegexSet()
+        self._order = itertools.count()
+        for name, criteria in (rules or {}).items():
+            self.add(name, criteria)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, name) -> bool:
+        return name in self._rules
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._rules)
+
+    def __getitem__(self, name) -> Criteria:
+        return self._rules[name].criteria
+
+    def add(self, name: Hashable, criteria: Any) -> None:
+        """
+        Add a rule to the set, replacing any existing rule with the same name.
+
+        Args:
+            name: Identifier returned by ``matching`` when the rule matches.
+            criteria: Value or criteria for the rule.
+        """
+        if name in self._rules:
+            self.remove(name)
+
+        criteria = ensure_criteria(criteria)
+        constraint = self._choose_constraint(criteria)
+        self._rules[name] = _Rule(name, next(self._order), criteria, constraint)
+
+        if type(criteria) is regex:
+            self._regexes.add(name, criteria)
+            return
+
+        if constraint is None:
+            self._unindexed.add(name)
+            return
+
+        path, value = constraint
+        self._index.setdefault(path, {}).setdefault(value, set()).add(name)
+
+    def remove(self, name: Hashable) -> None:
+        """
+        Remove a rule from the set.
+
+        Raises:
+            KeyError: If no rule with that name exists.
+        """
+        rule = self._rules.pop(name)
+        if name in self._regexes:
+            self._regexes.remove(name)
+            return
+
+        if rule.constraint is None:
+            self._unindexed.discard(name)
+            return
+
+        path, value = rule.constraint
+        values = self._index[path]
+        names = values[value]
+        names.discard(name)
+        if not names:
+            del values[value]
+        if not values:
+            del self._index[path]
+
+    def _choose_constraint(self, criteria: Criteria):
+        # Prefer the most selective constraint: the bucket with the fewest
+        # rules already in it.
+        best = None
+        best_size = None
+        for path, value in _equality_constraints(criteria):
+            size = len(self._index.get(path, {}).get(value, ()))
+            if best_size is None or size < best_size:
+                best, best_size = (path, value), size
+        return best
+
+    def candidates(self, subject) -> set[Hashable]:
+        """
+        Return the names of the rules that could match ``subject``.
+
+        This is a superset of ``matching(subject)``; no rule is evaluated.
+        """
+        names = set(self._unindexed)
+        names.update(self._regexes)
+        for path, values in self._index.items():
+            value = _resolve(subject, path)
+            if value is _MISSING:
+                continue
+            if _is_indexable(value):
+                names.update(values.get(value, ()))
+            else:
+                # Values that cannot be looked up, or that may equal values
+                # with another hash, have to be compared with every rule
+                # indexed on this path.
+                for bucket in values.values():
+                    names.update(bucket)
+        return names
+
+    def matching(self, subject) -> list[Hashable]:
+        """
+        Return the names of all rules that match ``subject``.
+
+        Names are returned in the order the rules were added. A rule that
+        does not accept the type of the subject, such as a ``regex`` rule
+        given a mapping, does not match. Errors raised while a rule is
+        matched are not caught.
+
+        Args:
+            subject: Value to test against the rules.
+
+        Returns:
+            list: Names of the matching rules.
+        """
+        names = self.candidates(subject)
+        matched = [
+            self._rules[name]
+            for name in names
+            if name not in self._regexes and _matches(self._rules[name], subject)
+        ]
+        if self._regexes and isinstance(subject, str):
+            matched.extend(
+                self._rules[name] for name in self._regexes.matching(subject)
+            )
+        matched.sort(key=lambda rule: rule.order)
+        return [rule.name for rule in matched]
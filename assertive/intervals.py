@@ -0,0 +1,540 @@
+import bisect
+import itertools
+import math
+import warnings
+from collections.abc import Hashable, Iterator, Mapping
+from operator import itemgetter
+from typing import Any, NamedTuple, Optional, Sequence
+
+from assertive.core import Criteria, is_eq
+from assertive.criteria.basic import is_between, is_gt, is_gte, is_lt, is_lte
+from assertive.criteria.numeric import (
+    is_negative,
+    is_non_negative,
+    is_non_positive,
+    is_positive,
+    zero,
+)
+
+
+class RangeWarning(UserWarning):
+    """
+    Issued when folding comparisons yields a range that is empty or unbounded.
+    """
+
+
+class Interval(NamedTuple):
+    """
+    A range of values. ``None`` bounds are unbounded.
+    """
+
+    lower: Any = None
+    upper: Any = None
+    lower_closed: bool = False
+    upper_closed: bool = False
+
+    def is_empty(self) -> bool:
+        if self.lower is None or self.upper is None:
+            return False
+        if self.lower == self.upper:
+            return not (self.lower_closed and self.upper_closed)
+        return self.lower > self.upper
+
+    def is_unbounded(self) -> bool:
+        return self.lower is None and self.upper is None
+
+    def contains(self, subject) -> bool:
+        lower, upper = self.lower, self.upper
+        if lower is not None:
+            if self.lower_closed:
+                if not subject >= lower:
+                    return False
+            elif not subject > lower:
+                return False
+        if upper is not None:
+            if self.upper_closed:
+                return subject <= upper
+            return subject < upper
+        return True
+
+    def intersect(self, other: "Interval") -> "Interval":
+        lower, lower_closed = self.lower, self.lower_closed
+        if other.lower is not None and (
+            lower is None
+            or other.lower > lower
+            or (other.lower == lower and not other.lower_closed)
+        ):
+            lower, lower_closed = other.lower, other.lower_closed
+
+        upper, upper_closed = self.upper, self.upper_closed
+        if other.upper is not None and (
+            upper is None
+            or other.upper < upper
+            or (other.upper == upper and not other.upper_closed)
+        ):
+            upper, upper_closed = other.upper, other.upper_closed
+
+        return Interval(lower, upper, lower_closed, upper_closed)
+
+
+def _touches(left: Interval, right: Interval) -> bool:
+    # ``left`` starts no later than ``right``; do they overlap or meet?
+    if left.upper is None or right.lower is None:
+        return True
+    if left.upper > right.lower:
+        return True
+    if left.upper == right.lower:
+        return left.upper_closed or right.lower_closed
+    return False
+
+
+def _sort_key(interval: Interval):
+    return (interval.lower is not None, interval.lower, not interval.lower_closed)
+
+
+def union(intervals: Sequence[Interval]) -> list[Interval]:
+    """
+    Merge intervals into a sorted list of disjoint, non-empty intervals.
+    """
+    merged: list[Interval] = []
+    for interval in sorted((i for i in intervals if not i.is_empty()), key=_sort_key):
+        if merged and _touches(merged[-1], interval):
+            last = merged[-1]
+            if last.upper is None or interval.upper is None:
+                upper, upper_closed = None, False
+            elif interval.upper > last.upper:
+                upper, upper_closed = interval.upper, interval.upper_closed
+            elif interval.upper == last.upper:
+                upper = last.upper
+                upper_closed = last.upper_closed or interval.upper_closed
+            else:
+                upper, upper_closed = last.upper, last.upper_closed
+            merged[-1] = Interval(last.lower, upper, last.lower_closed, upper_closed)
+        else:
+            merged.append(interval)
+    return merged
+
+
+def intersection(left: Sequence[Interval], right: Sequence[Interval]) -> list[Interval]:
+    """
+    Intersect two sets of intervals.
+    """
+    return union([a.intersect(b) for a in left for b in right])
+
+
+def to_intervals(criteria: Criteria) -> Optional[list[Interval]]:
+    """
+    Return the intervals a range criteria accepts, or ``None`` for other criteria.
+    """
+    kind = type(criteria)
+    if kind is is_gt:
+        return [Interval(lower=criteria.value)]
+    if kind is is_gte:
+        return [Interval(lower=criteria.value, lower_closed=True)]
+    if kind is is_lt:
+        return [Interval(upper=criteria.value)]
+    if kind is is_lte:
+        return [Interval(upper=criteria.value, upper_closed=True)]
+    if kind is is_between:
+        closed = criteria.is_inclusive
+        return [Interval(criteria.lower, criteria.upper, closed, closed)]
+    if kind is is_positive:
+        return [Interval(lower=0)]
+    if kind is is_non_negative:
+        return [Interval(lower=0, lower_closed=True)]
+    if kind is is_negative:
+        return [Interval(upper=0)]
+    if kind is is_non_positive:
+        return [Interval(upper=0, upper_closed=True)]
+    if kind is zero:
+        return [Interval(0, 0, True, True)]
+    if kind is IntervalCriteria:
+        return [criteria.interval]
+    if kind is IntervalSetCriteria:
+        return list(criteria.intervals)
+    return None
+
+
+def count_bounds(criteria: Criteria) -> tuple[Optional[int], Optional[int]]:
+    """
+    Return the counts from which a count criteria is decided.
+
+    The first is the smallest count from which ``criteria`` matches every
+    larger count, and the second the smallest count from which it matches
+    none, so that counting can stop once either is reached. Either is
+    ``None`` when there is no such count or it cannot be told, as for
+    criteria that are not integers or ranges.
+
+    Example:
+        ```python
+        assert count_bounds(is_eq(2)) == (None, 3)
+        assert count_bounds(is_gte(2)) == (2, None)
+        assert count_bounds(is_between(1, 4)) == (None, 5)
+        ```
+    """
+    if type(criteria) is is_eq:
+        intervals = [Interval(criteria.value, criteria.value, True, True)]
+    else:
+        intervals = to_intervals(criteria)
+        if intervals is None:
+            return None, None
+    matching = None
+    failing = 0
+    try:
+        for lower, upper, lower_closed, upper_closed in intervals:
+            if upper is None:
+                if lower is None:
+                    start = 0
+                elif lower_closed:
+                    start = math.ceil(lower)
+                else:
+                    start = math.floor(lower) + 1
+                matching = start if matching is None else min(matching, start)
+                failing = None
+            elif failing is not None:
+                end = math.floor(upper) + 1 if upper_closed else math.ceil(upper)
+                failing = max(failing, end)
+    except (TypeError, ValueError, OverflowError):
+        return None, None
+    return matching, failing
+
+
+class IntervalCriteria(Criteria):
+    """
+    Match values inside a single interval.
+
+    Produced by folding ``&`` chains of range criteria, e.g.
+    ``is_gt(0) & is_lt(10) & is_gte(2)`` becomes the interval ``[2, 10)``.
+
+    Args:
+        interval: Accepted range of values.
+    """
+
+    __slots__ = ("interval",)
+
+    def __init__(self, interval: Interval):
+        self.interval = interval
+
+    def _match(self, subject) -> bool:
+        return self.interval.contains(subject)
+
+
+class IntervalSetCriteria(Criteria):
+    """
+    Match values inside any of a set of intervals.
+
+    Produced by folding ``|`` chains of range criteria. The intervals are
+    kept sorted and disjoint, so a subject is located with a binary search
+    instead of testing every interval.
+
+    Args:
+        intervals: Accepted ranges of values.
+    """
+
+    __slots__ = ("intervals", "_lowers", "_offset")
+
+    def __init__(self, intervals: Sequence[Interval]):
+        self.intervals = union(intervals)
+        self._offset = 1 if self.intervals and self.intervals[0].lower is None else 0
+        self._lowers = [interval.lower for interval in self.intervals[self._offset :]]
+
+    def to_serialized(self) -> dict:
+        return {"intervals": self.intervals}
+
+    def _match(self, subject) -> bool:
+        intervals = self.intervals
+        index = bisect.bisect_right(self._lowers, subject) + self._offset - 1
+        # The interval starting at or before the subject is the only one that
+        # can contain it, unless its lower bound is open and equal to the
+        # subject, in which case the previous interval may end there.
+        for candidate in (index, index - 1):
+            if candidate >= 0 and intervals[candidate].contains(subject):
+                return True
+        return False
+
+
+def _folded(intervals: list[Interval]) -> Criteria:
+    if len(intervals) == 1:
+        return IntervalCriteria(intervals[0])
+    return IntervalSetCriteria(intervals)
+
+
+def _fold_run(run: list[Criteria], ranges: list[list[Interval]], combine) -> list:
+    try:
+        intervals = ranges[0]
+        for other in ranges[1:]:
+            intervals = combine(intervals, other)
+    except TypeError:
+        # Bounds of different types cannot be ordered, leave them alone.
+        return run
+
+    # An empty or unbounded range would accept or reject every subject,
+    # including ones the operands reject or raise ``TypeError`` on, such as
+    # NaN, ``None`` or strings. The operands are kept as they are.
+    if not intervals:
+        warnings.warn("Combined range can never match", RangeWarning)
+        return run
+    if len(intervals) == 1 and intervals[0].is_unbounded():
+        warnings.warn("Combined range matches every comparable value", RangeWarning)
+        return run
+    return [_folded(intervals)]
+
+
+def _foldable_intervals(criteria: Criteria) -> Optional[list[Interval]]:
+    # Only criteria that already order their subject with ``<`` and ``>`` are
+    # folded. ``zero`` tests with ``==``, so it rejects subjects such as
+    # ``None`` or strings that an interval would raise ``TypeError`` on.
+    if type(criteria) is zero:
+        return None
+    return to_intervals(criteria)
+
+
+def _fold(items: list[Criteria], combine) -> list[Criteria]:
+    # Only neighbouring operands are folded, so every other operand is still
+    # evaluated in the same order, with the same short-circuiting.
+    folded: list[Criteria] = []
+    run: list[Criteria] = []
+    ranges: list[list[Interval]] = []
+    for item in [*items, None]:
+        intervals = None if item is None else _foldable_intervals(item)
+        if intervals is not None:
+            run.append(item)
+            ranges.append(intervals)
+            continue
+        if len(run) > 1:
+            folded.extend(_fold_run(run, ranges, combine))
+        else:
+            folded.extend(run)
+        run, ranges = [], []
+        if item is not None:
+            folded.append(item)
+
+    if len(folded) == len(items):
+        return items
+    return folded
+
+
+def fold_and(items: list[Criteria]) -> list[Criteria]:
+    """
+    Collapse neighbouring range criteria among ``&`` operands into one interval.
+
+    Issues a ``RangeWarning`` when a combined range is empty, and leaves
+    those operands as they are.
+    """
+    return _fold(items, intersection)
+
+
+def fold_or(items: list[Criteria]) -> list[Criteria]:
+    """
+    Collapse neighbouring range criteria among ``|`` operands into a sorted
+    set of disjoint intervals.
+
+    Issues a ``RangeWarning`` when combined ranges cover every value, and
+    leaves those operands as they are.
+    """
+    return _fold(items, lambda left, right: union([*left, *right]))
+
+
+def _bounds(interval: Interval) -> tuple[Any, Any]:
+    # Bounds as closed keys: an open lower bound ``v`` starts just after ``v``
+    # and an open upper bound ends just before it. A subject ``x`` is at
+    # ``(x, 0)``, so containment is ``start <= (x, 0) <= end``.
+    start = None
+    end = None
+    if interval.lower is not None:
+        start = (interval.lower, 0 if interval.lower_closed else 1)
+    if interval.upper is not None:
+        end = (interval.upper, 0 if interval.upper_closed else -1)
+    return start, end
+
+
+class _Node:
+    __slots__ = ("center", "starts", "by_start", "ends", "by_end", "left", "right")
+
+    def __init__(self, entries: list[tuple[Any, Any, Hashable]]):
+        # ``entries`` are ``(start, end, name)`` sorted by start.
+        self.center = entries[len(entries) // 2][0]
+        here, left, right = [], [], []
+        for entry in entries:
+            if entry[1] < self.center:
+                left.append(entry)
+            elif entry[0] > self.center:
+                right.append(entry)
+            else:
+                here.append(entry)
+
+        self.starts = [start for start, _, _ in here]
+        self.by_start = [name for _, _, name in here]
+        here.sort(key=lambda entry: entry[1], reverse=True)
+        self.ends = [end for _, end, _ in here]
+        self.by_end = [name for _, _, name in here]
+        self.left = _Node(left) if left else None
+        self.right = _Node(right) if right else None
+
+
+class IntervalIndex:
+    """
+    A named collection of range criteria that finds every rule containing a value.
+
+    Rules are ``is_between``, ``is_gt``, ``is_gte``, ``is_lt``, ``is_lte``,
+    ``is_positive``, ``is_negative``, ``zero`` and friends, or intervals
+    produced by ``optimize``. They are kept in an interval tree, so
+    ``matching`` runs in ``O(log n + k)`` for ``n`` rules and ``k`` matches
+    instead of evaluating every rule. Inclusive and exclusive bounds are
+    respected.
+
+    The tree is rebuilt on the first lookup after rules are added or removed.
+
+    Args:
+        rules: Optional mapping of rule names to range criteria.
+
+    Example:
+        ```python
+        index = IntervalIndex(
+            {
+                "small": is_between(0, 10),
+                "medium": is_between(10, 100).exclusive(),
+                "large": is_gte(100),
+            }
+        )
+
+        assert index.matching(10) == {"small"}
+        assert index.matching(100) == {"large"}
+        ```
+    """
+
+    __slots__ = (
+        "_rules",
+        "_intervals",
+        "_dirty",
+        "_unbounded",
+        "_below_ends",
+        "_below",
+        "_above_starts",
+        "_above",
+        "_root",
+    )
+
+    def __init__(self, rules: Mapping[Hashable, Criteria] | None = None):
+        self._rules: dict[Hashable, Criteria] = {}
+        self._intervals: dict[Hashable, list[Interval]] = {}
+        self._dirty = True
+        # Filled in by ``_build``.
+        self._unbounded: list[Hashable] = []
+        self._below_ends: list[Any] = []
+        self._below: list[Hashable] = []
+        self._above_starts: list[Any] = []
+        self._above: list[Hashable] = []
+        self._root: Optional[_Node] = None
+        for name, criteria in (rules or {}).items():
+            self.add(name, criteria)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, name) -> bool:
+        return name in self._rules
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._rules)
+
+    def __getitem__(self, name) -> Criteria:
+        return self._rules[name]
+
+    def add(self, name: Hashable, criteria: Criteria) -> None:
+        """
+        Add a rule to the index, replacing any existing rule with the same name.
+
+        Args:
+            name: Identifier returned by ``matching`` when the rule matches.
+            criteria: Range criteria for the rule.
+
+        Raises:
+            TypeError: If the criteria is not a range criteria.
+        """
+        intervals = to_intervals(criteria)
+        if intervals is None:
+            raise TypeError(
+                f"{criteria.__class__.__name__} is not a range criteria, "
+                "use is_between, is_gt, is_gte, is_lt or is_lte"
+            )
+        self._rules[name] = criteria
+        self._intervals[name] = intervals
+        self._dirty = True
+
+    def remove(self, name: Hashable) -> None:
+        """
+        Remove a rule from the index.
+
+        Raises:
+            KeyError: If no rule with that name exists.
+        """
+        del self._rules[name]
+        del self._intervals[name]
+        self._dirty = True
+
+    def _build(self) -> None:
+        bounded = []
+        unbounded = []
+        below = []
+        above = []
+        for name, intervals in self._intervals.items():
+            for interval in intervals:
+                if interval.is_empty():
+                    continue
+                start, end = _bounds(interval)
+                if start is None and end is None:
+                    unbounded.append(name)
+                elif start is None:
+                    below.append((end, name))
+                elif end is None:
+                    above.append((start, name))
+                else:
+                    bounded.append((start, end, name))
+
+        key = itemgetter(0)
+        self._unbounded = unbounded
+        below.sort(key=key)
+        self._below_ends = [end for end, _ in below]
+        self._below = [name for _, name in below]
+        above.sort(key=key)
+        self._above_starts = [start for start, _ in above]
+        self._above = [name for _, name in above]
+        bounded.sort(key=key)
+        self._root = _Node(bounded) if bounded else None
+        self._dirty = False
+
+    def matching(self, value) -> set[Hashable]:
+        """
+        Return the names of all rules whose range contains ``value``.
+
+        Args:
+            value: Value to look up. Must be comparable with the rule bounds.
+
+        Returns:
+            set: Names of the matching rules.
+        """
+        if self._dirty:
+            self._build()
+
+        point = (value, 0)
+        names = set(self._unbounded)
+        names.update(self._below[bisect.bisect_left(self._below_ends, point) :])
+        names.update(self._above[: bisect.bisect_right(self._above_starts, point)])
+
+        node = self._root
+        while node is not None:
+            if point < node.center:
+                count = bisect.bisect_right(node.starts, point)
+                names.update(itertools.islice(node.by_start, count))
+                node = node.left
+            elif point > node.center:
+                for end, name in zip(node.ends, node.by_end):
+                    if end < point:
+                        break
+                    names.add(name)
+                node = node.right
+            else:
+                names.update(node.by_start)
+                break
+        return names
@@ -0,0 +1,174 @@
+import collections
+import contextlib
+import contextvars
+import json
+import sys
+import threading
+from typing import Any, Optional
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("cached JSON values are read-only")
+
+
+class _FrozenDict(dict):
+    """
+    A ``dict`` that cannot be modified, equal to the ``dict`` it was built from.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class _FrozenList(list):
+    """
+    A ``list`` that cannot be modified, equal to the ``list`` it was built from.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_freeze(v) for v in value)
+    return value
+
+
+class JsonCache:
+    """
+    A bounded least recently used cache of parsed JSON documents.
+
+    When the same payload is tested by many ``as_json_matches`` criteria,
+    each of them parses it again. While a cache is active (see
+    ``use_json_cache``) they all share a single parse instead.
+
+    Entries are weighed by the size of the payload in bytes, and the least
+    recently used entries are evicted once the total exceeds ``max_bytes``.
+    Payloads larger than ``max_bytes`` are parsed but not cached, and so are
+    ``bytearray`` and ``memoryview`` payloads, which can change after being
+    parsed.
+
+    Cached values are shared between every criteria that reads them. With
+    ``frozen=True`` they are read-only ``dict`` and ``list`` subclasses, so a
+    criteria cannot change what the others see.
+
+    Args:
+        max_bytes: Maximum total size of the cached payloads.
+        frozen: Return read-only values.
+
+    Attributes:
+        hits: Number of parses answered from the cache.
+        misses: Number of parses of payloads that were not in the cache.
+        size: Total size of the cached payloads in bytes.
+
+    Raises:
+        ValueError: If ``max_bytes`` is negative.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, frozen: bool = False):
+        if max_bytes < 0:
+            raise ValueError("max_bytes cannot be negative")
+        self.max_bytes = max_bytes
+        self.frozen = frozen
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._entries: collections.OrderedDict[Any, tuple[Any, int]] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def parse(self, payload: str | bytes | bytearray | memoryview) -> Any:
+        """
+        Return ``json.loads(payload)``, parsing each payload only once.
+
+        Raises:
+            json.JSONDecodeError: If the payload is not valid JSON.
+        """
+        cacheable = isinstance(payload, (str, bytes))
+        if cacheable:
+            with self._lock:
+                entry = self._entries.get(payload)
+                if entry is not None:
+                    self._entries.move_to_end(payload)
+                    self.hits += 1
+                    return entry[0]
+                self.misses += 1
+
+        if isinstance(payload, memoryview):
+            payload = payload.tobytes()
+        parsed = json.loads(payload)
+        if self.frozen:
+            parsed = _freeze(parsed)
+
+        size = sys.getsizeof(payload)
+        if cacheable and size <= self.max_bytes:
+            with self._lock:
+                if payload not in self._entries:
+                    self._entries[payload] = (parsed, size)
+                    self.size += size
+                while self.size > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self.size -= evicted
+        return parsed
+
+    def clear(self) -> None:
+        """
+        Remove every entry. The hit and miss counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+_CACHE: contextvars.ContextVar[Optional[JsonCache]] = contextvars.ContextVar(
+    "json_cache", default=None
+)
+
+
+@contextlib.contextmanager
+def use_json_cache(cache: JsonCache):
+    """
+    Share parsed JSON documents between ``as_json_matches`` criteria.
+
+    Every ``as_json_matches`` evaluated in this context parses its subject
+    through ``cache``, so K criteria testing the same payload parse it once.
+    Documents are then parsed in full, even by criteria created with
+    ``partial=True``.
+
+    The same cache can be used in many contexts, for example across the
+    batches of a pipeline.
+
+    Args:
+        cache: Cache to use.
+
+    Example:
+        ```python
+        cache = JsonCache(max_bytes=16 * 2**20, frozen=True)
+        with use_json_cache(cache):
+            matched = [name for name, rule in rules.items() if rule.run_match(body)]
+
+        print(cache.hits, cache.misses)
+        ```
+    """
+    token = _CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _CACHE.reset(token)
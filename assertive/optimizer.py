@@ -0,0 +1,303 @@
+import copy
+from typing import Any, Callable, Iterator, NamedTuple
+
+from assertive.core import (
+    AndCriteria,
+    Criteria,
+    InvertedCriteria,
+    OrCriteria,
+    XorCriteria,
+    _slot_names,
+    all_of,
+    any_of,
+)
+from assertive.criteria.utils import AnyCriteria, WrappedCriteria
+from assertive.intervals import fold_and, fold_or
+
+# How the result of a node is consumed by its parent. ``run_match`` and
+# ``run_negated_match`` can disagree (``~ANY`` matches everything), so a node
+# may only be swapped for one that agrees on the results actually used.
+MATCH = "match"
+NEGATED = "negated"
+BOTH = "both"
+
+
+class OptimizeResult(NamedTuple):
+    """
+    Result of ``optimize``.
+
+    Attributes:
+        criteria: The optimized, equivalent criteria tree.
+        removed: Number of nodes removed from the original tree.
+    """
+
+    criteria: Criteria
+    removed: int
+
+
+def _fields(criteria: Criteria) -> Iterator[tuple[str, Any]]:
+    for name in _slot_names(type(criteria)):
+        if hasattr(criteria, name):
+            yield name, getattr(criteria, name)
+    yield from getattr(criteria, "__dict__", {}).items()
+
+
+def _map_value(value, function: Callable[[Criteria], Criteria]):
+    if isinstance(value, Criteria):
+        return function(value)
+    if isinstance(value, list):
+        return [_map_value(v, function) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_map_value(v, function) for v in value)
+    if isinstance(value, dict):
+        return {k: _map_value(v, function) for k, v in value.items()}
+    return value
+
+
+def _children(value) -> Iterator[Criteria]:
+    if isinstance(value, Criteria):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _children(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _children(item)
+
+
+def count_nodes(criteria: Criteria) -> int:
+    """
+    Count the criteria nodes in a tree.
+    """
+    return 1 + sum(
+        count_nodes(child)
+        for _, value in _fields(criteria)
+        for child in _children(value)
+    )
+
+
+def _structural_key(value):
+    """
+    Hashable key that is equal for structurally identical criteria trees.
+
+    Values that cannot be hashed are compared by identity, so two trees are
+    only considered identical when that is certain.
+    """
+    if isinstance(value, Criteria):
+        return (
+            type(value),
+            tuple((name, _structural_key(v)) for name, v in _fields(value)),
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_structural_key(v) for v in value))
+    if isinstance(value, dict):
+        return (dict, tuple((k, _structural_key(v)) for k, v in value.items()))
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return (type(value), value)
+
+
+def _same_behaviour(subclass: type, cls: type) -> bool:
+    return all(
+        getattr(subclass, name) is getattr(cls, name)
+        for name in ("_before_run", "_match", "_negated_match")
+    )
+
+
+def _is_plain(criteria: Criteria, cls: type) -> bool:
+    return isinstance(criteria, cls) and _same_behaviour(type(criteria), cls)
+
+
+def _has_standard_negation(criteria: Criteria) -> bool:
+    """
+    Whether ``run_negated_match`` is always ``not run_match`` for this node.
+    """
+    if _is_plain(criteria, InvertedCriteria):
+        return _has_standard_negation(criteria.value)
+    if _is_plain(criteria, WrappedCriteria):
+        return _has_standard_negation(criteria.inner_criteria)
+    return type(criteria)._negated_match is Criteria._negated_match
+
+
+def _dedupe(items: list[Criteria]) -> list[Criteria]:
+    seen = set()
+    unique = []
+    for item in items:
+        key = _structural_key(item)
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+def _single(node: Criteria, items: list[Criteria], mode: str) -> Criteria:
+    # ``all_of(x)`` and ``x`` agree on ``run_match``; they only agree on
+    # ``run_negated_match`` when ``x`` negates in the standard way.
+    if len(items) == 1 and (mode == MATCH or _has_standard_negation(items[0])):
+        return items[0]
+    return node
+
+
+def _invert(criteria: Criteria) -> Criteria:
+    if _is_plain(criteria, InvertedCriteria):
+        return criteria.value
+    return InvertedCriteria(criteria)
+
+
+def _rebuild(original, node):
+    # Keep the original node when nothing changed, so untouched subtrees are
+    # shared rather than copied.
+    if len(node.items) == len(original.items) and all(
+        a is b for a, b in zip(node.items, original.items)
+    ):
+        return original
+    return node
+
+
+def _optimize_and(criteria: AndCriteria, mode: str) -> Criteria:
+    items = [_optimize(item, MATCH) for item in criteria.items]
+    items = [item for item in items if not _is_plain(item, AnyCriteria)]
+    items = fold_and(all_of(*items).items)
+    node = _rebuild(criteria, all_of(*_dedupe(items)))
+    return _single(node, node.items, mode)
+
+
+def _optimize_or(criteria: OrCriteria, mode: str) -> Criteria:
+    items = []
+    for item in criteria.items:
+        item = _optimize(item, MATCH)
+        items.append(item)
+        if _is_plain(item, AnyCriteria):
+            # Later operands are never evaluated.
+            break
+    items = fold_or(any_of(*items).items)
+    node = _rebuild(criteria, any_of(*_dedupe(items)))
+    return _single(node, node.items, mode)
+
+
+def _de_morgan(criteria: InvertedCriteria, mode: str) -> Criteria | None:
+    """
+    Push a negation into an And/Or when that removes inversions.
+    """
+    inner = criteria.value
+    if _is_plain(inner, AndCriteria):
+        combine = any_of
+    elif _is_plain(inner, OrCriteria):
+        combine = all_of
+    else:
+        return None
+
+    items = inner.items
+    if not items or not all(_has_standard_negation(item) for item in items):
+        return None
+
+    inverted = sum(1 for item in items if _is_plain(item, InvertedCriteria))
+    if len(items) - inverted >= inverted + 1:
+        return None
+
+    return _optimize(combine(*(_invert(item) for item in items)), mode)
+
+
+def _optimize_inverted(criteria: InvertedCriteria, mode: str) -> Criteria:
+    value = criteria.value
+    if _is_plain(value, InvertedCriteria):
+        return _optimize(value.value, mode)
+    if _is_plain(value, AnyCriteria):
+        return value
+
+    rewritten = _de_morgan(criteria, mode)
+    if rewritten is not None:
+        return rewritten
+
+    inner_mode = {MATCH: NEGATED, NEGATED: MATCH, BOTH: BOTH}[mode]
+    optimized = _optimize(value, inner_mode)
+    if _is_plain(optimized, InvertedCriteria) or _is_plain(optimized, AnyCriteria):
+        return _optimize_inverted(InvertedCriteria(optimized), mode)
+    if optimized is value:
+        return criteria
+    return InvertedCriteria(optimized)
+
+
+def _optimize_xor(criteria: XorCriteria, mode: str) -> Criteria:
+    left = _optimize(criteria.left, MATCH)
+    right = _optimize(criteria.right, MATCH)
+    if left is criteria.left and right is criteria.right:
+        return criteria
+    return XorCriteria(left, right)
+
+
+def _optimize_children(criteria: Criteria) -> Criteria:
+    # Generic criteria evaluate their nested criteria through ``run_match``.
+    changed = {}
+    for name, value in _fields(criteria):
+        if not any(True for _ in _children(value)):
+            continue
+        new_value = _map_value(value, lambda child: _optimize(child, MATCH))
+        if any(a is not b for a, b in zip(_children(new_value), _children(value))):
+            changed[name] = new_value
+
+    if not changed:
+        return criteria
+
+    clone = copy.copy(criteria)
+    for name, value in changed.items():
+        setattr(clone, name, value)
+    return clone
+
+
+def _optimize(criteria: Criteria, mode: str) -> Criteria:
+    if _is_plain(criteria, AndCriteria):
+        return _optimize_and(criteria, mode)
+    if _is_plain(criteria, OrCriteria):
+        return _optimize_or(criteria, mode)
+    if _is_plain(criteria, InvertedCriteria):
+        return _optimize_inverted(criteria, mode)
+    if _is_plain(criteria, XorCriteria):
+        return _optimize_xor(criteria, mode)
+    if _is_plain(criteria, WrappedCriteria):
+        return _optimize(criteria.inner_criteria, mode)
+    return _optimize_children(criteria)
+
+
+def optimize(criteria: Criteria) -> OptimizeResult:
+    """
+    Rewrite a criteria tree into a smaller equivalent tree.
+
+    The following semantics-preserving rewrites are applied:
+
+    - double negation is removed (``~~a`` becomes ``a``)
+    - ``ANY`` is absorbed (``a & ANY`` becomes ``a``, operands after ``ANY``
+      in an ``|`` are dropped)
+    - negation is pushed inward with De Morgan's laws when that removes
+      inversions (``~(~a & ~b)`` becomes ``a | b``)
+    - identical operands of ``&`` and ``|`` are removed
+    - ``WrappedCriteria`` such as ``class_match`` or ``was_called_once`` are
+      replaced by the criteria they wrap
+    - nested ``&``/``|`` are flattened and single operand ``&``/``|`` unwrapped
+    - neighbouring range criteria (``is_gt``, ``is_lte``, ``is_between``,
+      ``is_positive``, ...) are folded into a single interval for
+      ``&`` and a sorted set of disjoint intervals for ``|``, see
+      ``assertive.intervals``. A range that can never match or matches every
+      value is not folded, so non-comparable subjects are still rejected the
+      same way, and a ``RangeWarning`` is issued instead.
+
+    The original tree is not modified.
+
+    Args:
+        criteria: Criteria tree to optimize.
+
+    Returns:
+        OptimizeResult: The optimized tree and the number of nodes removed.
+
+    Example:
+        ```python
+        result = optimize(~~is_gt(1) & ANY & is_gt(1))
+
+        result.criteria # is_gt(1)
+        result.removed  # 5
+        ```
+    """
+    optimized = _optimize(criteria, BOTH)
+    return OptimizeResult(optimized, count_nodes(criteria) - count_nodes(optimized))
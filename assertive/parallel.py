@@ -0,0 +1,123 @@
+import collections
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Iterable, Iterator, Optional
+
+from assertive.compiler import compile
+from assertive.core import Criteria
+from assertive.serialize import deserialize, serialize
+
+_function = None
+
+
+def _contains_criteria(value) -> bool:
+    if isinstance(value, Criteria):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_criteria(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_contains_criteria(v) for v in value)
+    return False
+
+
+def _payload(criteria: Criteria) -> tuple[bool, Any]:
+    # Prefer the serialized form: it is plain data, cheap to pickle and does
+    # not depend on the criteria classes being picklable. Trees with custom
+    # criteria that have no serialized form are pickled as-is.
+    serialized = serialize(criteria)
+    if _contains_criteria(serialized):
+        return False, criteria
+    return True, serialized
+
+
+def _initialize_worker(is_serialized: bool, payload: Any) -> None:
+    global _function
+    criteria = deserialize(payload) if is_serialized else payload
+    _function = compile(criteria)
+
+
+def _evaluate_chunk(chunk: list) -> list[bool]:
+    function = _function
+    return [bool(function(item)) for item in chunk]
+
+
+def _chunks(iterable: Iterable, chunksize: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, chunksize)):
+        yield chunk
+
+
+def evaluate(
+    criteria: Criteria,
+    iterable: Iterable,
+    workers: Optional[int] = None,
+    chunksize: int = 1000,
+    ordered: bool = True,
+) -> Iterator[tuple[Any, bool]]:
+    """
+    Evaluate a criteria over a large iterable using a pool of processes.
+
+    The criteria is sent to each worker once, in its serialized form when
+    possible, and compiled there. The input is consumed lazily in chunks and
+    only a bounded number of chunks are in flight at any time, so arbitrarily
+    large inputs can be streamed.
+
+    Args:
+        criteria: Criteria to evaluate. Custom criteria without a serialized
+            form must be picklable.
+        iterable: Items to evaluate. Items must be picklable.
+        workers: Number of worker processes, defaults to the CPU count.
+        chunksize: Number of items sent to a worker at a time.
+        ordered: Yield results in input order. When ``False`` results are
+            yielded chunk by chunk as soon as they are ready.
+
+    Yields:
+        tuple: ``(item, matched)`` pairs.
+
+    Example:
+        ```python
+        criteria = has_key_values({"status": is_between(200, 299)})
+
+        matched = [
+            record
+            for record, ok in evaluate(criteria, records, workers=8)
+            if ok
+        ]
+        ```
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=_payload(criteria),
+    ) as executor:
+        max_in_flight = workers * 2
+        chunks = _chunks(iterable, chunksize)
+        pending: collections.deque[tuple[list, Future]] = collections.deque()
+
+        def submit_next() -> bool:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            pending.append((chunk, executor.submit(_evaluate_chunk, chunk)))
+            return True
+
+        while len(pending) < max_in_flight and submit_next():
+            pass
+
+        while pending:
+            if ordered:
+                chunk, future = pending.popleft()
+            else:
+                done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                index = next(i for i, (_, f) in enumerate(pending) if f in done)
+                chunk, future = pending[index]
+                del pending[index]
+
+            results = future.result()
+            submit_next()
+            yield from zip(chunk, results)
@@ -0,0 +1,171 @@
+from collections.abc import Hashable, Iterator, Mapping
+
+from assertive.core import Criteria
+from assertive.criteria.string import ends_with, starts_with
+
+
+class _TrieNode:
+    __slots__ = ("children", "names")
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.names: set[Hashable] = set()
+
+
+def _insert(root: _TrieNode, key: str, name: Hashable) -> None:
+    node = root
+    for char in key:
+        node = node.children.setdefault(char, _TrieNode())
+    node.names.add(name)
+
+
+def _discard(root: _TrieNode, key: str, name: Hashable) -> None:
+    path = [root]
+    for char in key:
+        path.append(path[-1].children[char])
+    path[-1].names.discard(name)
+    # Prune the branch back up to the nearest node that is still in use.
+    for depth in range(len(key), 0, -1):
+        node = path[depth]
+        if node.names or node.children:
+            break
+        del path[depth - 1].children[key[depth - 1]]
+
+
+def _walk(root: _TrieNode, chars: Iterator[str]) -> Iterator[_TrieNode]:
+    # Yield every node on the path spelled by ``chars``, root included.
+    node = root
+    yield node
+    for char in chars:
+        node = node.children.get(char)
+        if node is None:
+            return
+        yield node
+
+
+class PrefixIndex:
+    """
+    A named collection of ``starts_with`` and ``ends_with`` rules.
+
+    Prefixes are kept in a trie and suffixes in a trie of reversed strings,
+    so ``matching`` finds every matching rule with a single walk over the
+    subject's characters, whatever the number of rules, instead of calling
+    ``str.startswith`` once per rule.
+
+    An ``|`` of many ``starts_with``/``ends_with`` criteria is compiled into
+    a ``PrefixIndex`` automatically by ``assertive.compile``.
+
+    Args:
+        rules: Optional mapping of rule names to ``starts_with`` or
+            ``ends_with`` criteria.
+
+    Example:
+        ```python
+        index = PrefixIndex(
+            {
+                "error": starts_with("ERROR"),
+                "warning": starts_with("WARN"),
+                "timeout": ends_with("timed out"),
+            }
+        )
+
+        assert index.matching("ERROR: request timed out") == {"error", "timeout"}
+        assert index.any_match("INFO: ok") is False
+        ```
+    """
+
+    def __init__(self, rules: Mapping[Hashable, Criteria] | None = None):
+        self._rules: dict[Hashable, Criteria] = {}
+        self._prefixes = _TrieNode()
+        self._suffixes = _TrieNode()
+        for name, criteria in (rules or {}).items():
+            self.add(name, criteria)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, name) -> bool:
+        return name in self._rules
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._rules)
+
+    def __getitem__(self, name) -> Criteria:
+        return self._rules[name]
+
+    def _trie_key(self, criteria: Criteria) -> tuple[_TrieNode, str]:
+        kind = type(criteria)
+        if kind is starts_with and isinstance(criteria.prefix, str):
+            return self._prefixes, criteria.prefix
+        if kind is ends_with and isinstance(criteria.suffix, str):
+            return self._suffixes, criteria.suffix[::-1]
+        raise TypeError(
+            f"{kind.__name__} cannot be indexed, use starts_with or ends_with "
+            "with a string"
+        )
+
+    def add(self, name: Hashable, criteria: Criteria) -> None:
+        """
+        Add a rule to the index, replacing any existing rule with the same name.
+
+        Args:
+            name: Identifier returned by ``matching`` when the rule matches.
+            criteria: ``starts_with`` or ``ends_with`` criteria for the rule.
+
+        Raises:
+            TypeError: If the criteria is not ``starts_with`` or ``ends_with``.
+        """
+        root, key = self._trie_key(criteria)
+        if name in self._rules:
+            self.remove(name)
+        _insert(root, key, name)
+        self._rules[name] = criteria
+
+    def remove(self, name: Hashable) -> None:
+        """
+        Remove a rule from the index.
+
+        Raises:
+            KeyError: If no rule with that name exists.
+        """
+        root, key = self._trie_key(self._rules.pop(name))
+        _discard(root, key, name)
+
+    def matching(self, subject: str) -> set[Hashable]:
+        """
+        Return the names of all rules that match ``subject``.
+
+        Args:
+            subject: String to test against the rules.
+
+        Returns:
+            set: Names of the matching rules.
+
+        Raises:
+            TypeError: If the subject is not a string.
+        """
+        if not isinstance(subject, str):
+            raise TypeError(f"{subject} needs to be a string")
+        names = set()
+        for node in _walk(self._prefixes, iter(subject)):
+            names.update(node.names)
+        for node in _walk(self._suffixes, reversed(subject)):
+            names.update(node.names)
+        return names
+
+    def any_match(self, subject: str) -> bool:
+        """
+        Return whether any rule matches ``subject``, stopping at the first match.
+
+        Raises:
+            TypeError: If the subject is not a string.
+        """
+        if not isinstance(subject, str):
+            raise TypeError(f"{subject} needs to be a string")
+        for node in _walk(self._prefixes, iter(subject)):
+            if node.names:
+                return True
+        for node in _walk(self._suffixes, reversed(subject)):
+            if node.names:
+                return True
+        return False
@@ -0,0 +1,392 @@
+import contextlib
+import contextvars
+import re
+import string
+import time
+import warnings
+from typing import Iterator, Literal, NamedTuple, Optional
+
+try:
+    from re import _constants as constants
+    from re import _parser as parser
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_constants as constants
+    import sre_parse as parser
+
+_REPEATS = (constants.MAX_REPEAT, constants.MIN_REPEAT)
+# Python 3.11+ only; possessive repeats and atomic groups never backtrack.
+_POSSESSIVE_REPEAT = getattr(constants, "POSSESSIVE_REPEAT", None)
+_ATOMIC_GROUP = getattr(constants, "ATOMIC_GROUP", None)
+
+_ALPHABET = string.printable + " é٣一"
+_CATEGORIES = {
+    constants.CATEGORY_DIGIT: r"\d",
+    constants.CATEGORY_NOT_DIGIT: r"\D",
+    constants.CATEGORY_SPACE: r"\s",
+    constants.CATEGORY_NOT_SPACE: r"\S",
+    constants.CATEGORY_WORD: r"\w",
+    constants.CATEGORY_NOT_WORD: r"\W",
+}
+
+
+_NESTED_QUANTIFIER = (
+    "nested quantifier: a repetition can repeat an inner quantifier, or split "
+    "text between overlapping inner quantifiers, as in (a+)+ or (x+x+)+"
+)
+_AMBIGUOUS_ALTERNATION = (
+    "ambiguous alternation: alternatives in a repetition can match the same "
+    "text, as in (a|a)*"
+)
+
+
+class UnsafeRegexError(ValueError):
+    """
+    Raised for a ``regex`` pattern that can backtrack catastrophically.
+
+    Attributes:
+        pattern: The offending pattern.
+        reasons: Why the pattern is considered unsafe.
+    """
+
+    def __init__(self, pattern: str, reasons: list[str]):
+        super().__init__(f"unsafe regex {pattern!r}: {'; '.join(reasons)}")
+        self.pattern = pattern
+        self.reasons = reasons
+
+
+class UnsafeRegexWarning(UserWarning):
+    """
+    Issued for a ``regex`` pattern that can backtrack catastrophically.
+    """
+
+
+class _Policy(NamedTuple):
+    action: str
+    probe: bool
+    budget: float
+
+
+_POLICY: contextvars.ContextVar[Optional[_Policy]] = contextvars.ContextVar(
+    "regex_safety_policy", default=None
+)
+
+
+def _char_set(item, flags: int) -> set[str]:
+    """
+    Characters from a sample alphabet that a single-character item accepts.
+    """
+    op, av = item
+    if op is constants.LITERAL:
+        chars = {chr(av)}
+    elif op is constants.NOT_LITERAL:
+        chars = set(_ALPHABET) - {chr(av)}
+    elif op is constants.ANY:
+        chars = set(_ALPHABET) if flags & re.DOTALL else set(_ALPHABET) - {"\n"}
+    elif op is constants.IN:
+        chars = set()
+        negate = False
+        for member_op, member in av:
+            if member_op is constants.NEGATE:
+                negate = True
+            elif member_op is constants.RANGE:
+                low, high = member
+                chars.update(c for c in _ALPHABET if low <= ord(c) <= high)
+            else:
+                chars |= _char_set((member_op, member), flags)
+        if negate:
+            chars = set(_ALPHABET) - chars
+    elif op is constants.CATEGORY and av in _CATEGORIES:
+        expression = re.compile(_CATEGORIES[av])
+        chars = {c for c in _ALPHABET if expression.match(c)}
+    else:
+        # Anything else is assumed to be able to match any character.
+        chars = set(_ALPHABET)
+
+    if flags & re.IGNORECASE:
+        chars |= {c.swapcase() for c in chars}
+    return chars
+
+
+def _nullable(sequence, flags: int) -> bool:
+    return all(_item_nullable(item, flags) for item in sequence)
+
+
+def _item_nullable(item, flags: int) -> bool:
+    op, av = item
+    if op in _REPEATS or op is _POSSESSIVE_REPEAT:
+        return av[0] == 0 or _nullable(av[2], flags)
+    if op is constants.SUBPATTERN:
+        return _nullable(av[-1], flags)
+    if op is _ATOMIC_GROUP:
+        return _nullable(av, flags)
+    if op is constants.BRANCH:
+        return any(_nullable(branch, flags) for branch in av[1])
+    if op in (constants.AT, constants.ASSERT, constants.ASSERT_NOT):
+        return True
+    if op is constants.GROUPREF_EXISTS:
+        return True
+    return op is constants.GROUPREF
+
+
+def _first(sequence, flags: int) -> set[str]:
+    """
+    Characters a sequence can start with.
+    """
+    chars = set()
+    for item in sequence:
+        op, av = item
+        if op in _REPEATS or op is _POSSESSIVE_REPEAT:
+            chars |= _first(av[2], flags)
+        elif op is constants.SUBPATTERN:
+            chars |= _first(av[-1], _subpattern_flags(av, flags))
+        elif op is _ATOMIC_GROUP:
+            chars |= _first(av, flags)
+        elif op is constants.BRANCH:
+            for branch in av[1]:
+                chars |= _first(branch, flags)
+        elif op not in (constants.AT, constants.ASSERT, constants.ASSERT_NOT):
+            chars |= _char_set(item, flags)
+        if not _item_nullable(item, flags):
+            break
+    return chars
+
+
+def _subpattern_flags(av, flags: int) -> int:
+    _, add_flags, del_flags, _ = av
+    return (flags | add_flags) & ~del_flags
+
+
+def _inner_repeat(sequence, flags: int) -> bool:
+    """
+    Whether one match of ``sequence`` can be nothing but a variable length
+    repetition, possibly wrapped in groups or alternatives.
+    """
+    items = list(sequence)
+    for index, item in enumerate(items):
+        rest = items[:index] + items[index + 1 :]
+        if not _nullable(rest, flags):
+            continue
+        op, av = item
+        if op in _REPEATS and av[1] > 1 and av[0] != av[1]:
+            return True
+        if op is constants.SUBPATTERN and _inner_repeat(
+            av[-1], _subpattern_flags(av, flags)
+        ):
+            return True
+        if op is constants.BRANCH and any(
+            _inner_repeat(branch, flags) for branch in av[1]
+        ):
+            return True
+    return False
+
+
+def _overlapping_repeat(sequence, flags: int, follow: set[str]) -> bool:
+    """
+    Whether ``sequence`` holds a variable length repetition that can match
+    the next character after it, given the characters that can ``follow``,
+    so that text can be split between the two in many ways.
+    """
+    items = list(sequence)
+    for index, (op, av) in enumerate(items):
+        after = items[index + 1 :]
+        after_first = _first(after, flags)
+        if _nullable(after, flags):
+            after_first |= follow
+
+        if op in _REPEATS and av[0] != av[1]:
+            if _first(av[2], flags) & after_first:
+                return True
+        elif op is constants.SUBPATTERN:
+            if _overlapping_repeat(av[-1], _subpattern_flags(av, flags), after_first):
+                return True
+        elif op is constants.BRANCH:
+            if any(_overlapping_repeat(branch, flags, after_first) for branch in av[1]):
+                return True
+    return False
+
+
+def _overlapping_branches(sequence, flags: int, follow: set[str]) -> bool:
+    """
+    Whether ``sequence`` holds an alternation with two branches that can
+    match the same next character, given the characters that can ``follow``.
+    """
+    items = list(sequence)
+    for index, (op, av) in enumerate(items):
+        after = items[index + 1 :]
+        after_first = _first(after, flags)
+        if _nullable(after, flags):
+            after_first |= follow
+
+        if op is constants.SUBPATTERN:
+            if _overlapping_branches(av[-1], _subpattern_flags(av, flags), after_first):
+                return True
+        elif op is constants.BRANCH:
+            seen: set[str] = set()
+            seen_empty = False
+            for branch in av[1]:
+                first = _first(branch, flags)
+                empty = _nullable(branch, flags)
+                if empty:
+                    first |= after_first
+                    if seen_empty:
+                        return True
+                    seen_empty = True
+                if seen & first:
+                    return True
+                seen |= first
+    return False
+
+
+def _walk(sequence, flags: int) -> Iterator[tuple[object, int]]:
+    # Every repetition in the pattern, with the flags in effect for it.
+    for item in sequence:
+        op, av = item
+        if op in _REPEATS or op is _POSSESSIVE_REPEAT:
+            if op in _REPEATS:
+                yield item, flags
+            yield from _walk(av[2], flags)
+        elif op is constants.SUBPATTERN:
+            yield from _walk(av[-1], _subpattern_flags(av, flags))
+        elif op is _ATOMIC_GROUP:
+            yield from _walk(av, flags)
+        elif op is constants.BRANCH:
+            for branch in av[1]:
+                yield from _walk(branch, flags)
+        elif op in (constants.ASSERT, constants.ASSERT_NOT):
+            yield from _walk(av[1], flags)
+
+
+def _probe(pattern: str, flags: int, tree, budget: float) -> Optional[str]:
+    """
+    Time the pattern against inputs built to make it backtrack.
+
+    Inputs repeat a character the pattern can repeat, followed by a character
+    that makes the match fail. Lengths grow one character at a time, so a
+    pattern whose running time explodes is caught soon after it exceeds the
+    budget.
+    """
+    compiled = re.compile(pattern, flags)
+    pumps: set[str] = set()
+    for (_, av), item_flags in _walk(tree, flags):
+        pumps |= set(sorted(_first(av[2], item_flags))[:3])
+    for pump in sorted(pumps)[:8]:
+        for tail in ("!", "\x00", "\n"):
+            for length in range(8, 64):
+                subject = pump * length + tail
+                start = time.perf_counter()
+                compiled.search(subject)
+                if time.perf_counter() - start > budget:
+                    return (
+                        f"matching {pump!r} * {length} + {tail!r} took longer "
+                        f"than {budget}s"
+                    )
+    return None
+
+
+def check_regex(
+    pattern: str, flags: int = 0, probe: bool = False, budget: float = 0.05
+) -> list[str]:
+    """
+    Look for constructs in a regular expression that backtrack catastrophically.
+
+    The analysis is static and conservative: it reports
+
+    - nested quantifiers, where a repeated group can match by repeating an
+      inner quantifier instead (``(a+)+``, ``(\\w+\\s?)*``), or by splitting
+      text between an inner quantifier and what follows it (``(x+x+)+``,
+      ``(.*a){12}``), bounded repetitions included
+    - ambiguous alternations, where alternatives inside a repetition can
+      match the same next character (``(a|a)*``, ``(ab|a.)*``, ``(a|a?)+``)
+
+    With ``probe=True`` the pattern is also run against adversarial inputs of
+    growing length, and reported if a single match takes longer than
+    ``budget`` seconds.
+
+    Args:
+        pattern: Regular expression pattern.
+        flags: ``re`` flags the pattern is compiled with.
+        probe: Also time the pattern against adversarial inputs.
+        budget: Time limit in seconds for a single probe match.
+
+    Returns:
+        list: Reasons the pattern is unsafe, empty if none were found.
+
+    Example:
+        ```python
+        check_regex(r"^[a-z]+@[a-z]+$")  # []
+        check_regex(r"(a+)+$")           # ["nested quantifier: ..."]
+        ```
+    """
+    if not isinstance(pattern, str):
+        return []
+    tree = parser.parse(pattern, flags)
+    flags |= tree.state.flags
+
+    reasons = []
+    for (_, av), item_flags in _walk(tree, flags):
+        body = av[2]
+        if av[1] > 1:
+            # After an iteration the body can start again.
+            follow = _first(body, item_flags)
+            if _inner_repeat(body, item_flags) or _overlapping_repeat(
+                body, item_flags, follow
+            ):
+                reasons.append(_NESTED_QUANTIFIER)
+            if _overlapping_branches(body, item_flags, follow):
+                reasons.append(_AMBIGUOUS_ALTERNATION)
+    reasons = list(dict.fromkeys(reasons))
+
+    if probe and not reasons:
+        reason = _probe(pattern, flags, tree, budget)
+        if reason is not None:
+            reasons.append(reason)
+    return reasons
+
+
+@contextlib.contextmanager
+def enforce_regex_safety(
+    action: Literal["raise", "warn"] = "raise",
+    probe: bool = False,
+    budget: float = 0.05,
+):
+    """
+    Check every ``regex`` criteria created in this context with ``check_regex``.
+
+    Criteria created by ``deserialize`` are checked too, which makes this the
+    place to load rules from untrusted sources.
+
+    Args:
+        action: ``"raise"`` to raise ``UnsafeRegexError``, ``"warn"`` to issue
+            an ``UnsafeRegexWarning`` instead.
+        probe: Also time patterns against adversarial inputs.
+        budget: Time limit in seconds for a single probe match.
+
+    Example:
+        ```python
+        with enforce_regex_safety():
+            rules = deserialize(json.load(rule_file))  # raises on (a+)+$
+        ```
+    """
+    if action not in ("raise", "warn"):
+        raise ValueError(f"{action!r} is not an action, use 'raise' or 'warn'")
+    token = _POLICY.set(_Policy(action, probe, budget))
+    try:
+        yield
+    finally:
+        _POLICY.reset(token)
+
+
+def _check_construction(pattern, flags: int) -> None:
+    policy = _POLICY.get()
+    if policy is None:
+        return
+    reasons = check_regex(pattern, flags, policy.probe, policy.budget)
+    if not reasons:
+        return
+    if policy.action == "raise":
+        raise UnsafeRegexError(pattern, reasons)
+    warnings.warn(
+        f"unsafe regex {pattern!r}: {'; '.join(reasons)}",
+        UnsafeRegexWarning,
+        stacklevel=3,
+    )
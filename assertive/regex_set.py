@@ -0,0 +1,247 @@
+import re
+from collections.abc import Hashable, Iterator, Mapping
+from typing import Optional
+
+from assertive.core import Criteria
+from assertive.criteria.string import regex
+
+try:
+    from re import _constants as constants
+    from re import _parser as parser
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_constants as constants
+    import sre_parse as parser
+
+# Flags that can be scoped to part of a combined pattern with ``(?flags:...)``.
+_SCOPED_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+
+# Backreferences and conditionals such as ``(?(1)a|b)`` are resolved by group
+# number or name, which change once a pattern is embedded in a larger one.
+_GROUP_REFERENCES = (constants.GROUPREF, constants.GROUPREF_EXISTS)
+
+
+def _subpatterns(value) -> Iterator[parser.SubPattern]:
+    if isinstance(value, parser.SubPattern):
+        yield value
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            yield from _subpatterns(item)
+
+
+def _refers_to_groups(pattern: parser.SubPattern) -> bool:
+    return any(
+        op in _GROUP_REFERENCES or any(map(_refers_to_groups, _subpatterns(av)))
+        for op, av in pattern
+    )
+
+
+def _scoped(criteria: regex) -> Optional[str]:
+    """
+    Return the pattern as a self-contained group, or ``None`` if it cannot be
+    embedded in a combined pattern.
+    """
+    if not isinstance(criteria.pattern, str):
+        return None
+    flags = criteria.flags & ~re.UNICODE
+    letters = ""
+    for flag, letter in _SCOPED_FLAGS.items():
+        if flags & flag:
+            letters += letter
+            flags &= ~flag
+    if flags or criteria.compiled.groupindex:
+        return None
+    if _refers_to_groups(parser.parse(criteria.pattern, criteria.flags)):
+        return None
+
+    # A trailing comment in a verbose pattern would swallow the closing paren.
+    newline = "\n" if "x" in letters else ""
+    scoped = f"(?{letters}:{criteria.pattern}{newline})"
+    try:
+        # Inline global flags such as ``(?i)`` are only valid at the start of
+        # a pattern.
+        re.compile(scoped)
+    except re.error:
+        return None
+    return scoped
+
+
+def _lookahead(scoped: str, mode: str, group: str) -> str:
+    # Zero-width test of one pattern at the start of the subject that records
+    # whether it matched in ``group``. It never fails, so every pattern of the
+    # batch is tried in a single ``match`` call.
+    if mode == "search":
+        body = f"(?s:.*?)(?P<{group}>{scoped})"
+    elif mode == "fullmatch":
+        body = f"(?P<{group}>{scoped}\\Z)"
+    else:
+        body = f"(?P<{group}>{scoped})"
+    return f"(?:(?={body})|)"
+
+
+class _Batch:
+    __slots__ = ("all", "any", "names")
+
+    def __init__(self, mode: str, patterns: list[tuple[str, list[Hashable]]]):
+        self.names = {f"_{i}": names for i, (_, names) in enumerate(patterns)}
+        self.all = re.compile(
+            "".join(
+                _lookahead(scoped, mode, f"_{i}")
+                for i, (scoped, _) in enumerate(patterns)
+            )
+        ).match
+        self.any = getattr(re.compile("|".join(scoped for scoped, _ in patterns)), mode)
+
+    def matching(self, subject: str) -> Iterator[Hashable]:
+        for group, value in self.all(subject).groupdict().items():
+            if value is not None:
+                yield from self.names[group]
+
+
+class RegexSet:
+    """
+    A named collection of ``regex`` rules matched with a few combined patterns.
+
+    Patterns with the same mode are merged, in batches of ``batch_size``, into
+    a single pattern made of one zero-width named group per original pattern.
+    One ``re`` call per batch then reports every pattern that matched, instead
+    of one call per rule. ``any_match`` uses a plain alternation of the
+    patterns instead, which stops at the first match.
+
+    Patterns that cannot be embedded in a larger pattern, because they use
+    backreferences, named groups, global inline flags such as ``(?i)`` or
+    flags like ``re.ASCII``, are matched individually.
+
+    An ``|`` of many ``regex`` criteria is compiled into a ``RegexSet``
+    automatically by ``assertive.compile``, and ``CriteriaSet`` matches its
+    ``regex`` rules through one.
+
+    Args:
+        rules: Optional mapping of rule names to ``regex`` criteria.
+        batch_size: Maximum number of patterns merged into one pattern.
+
+    Example:
+        ```python
+        index = RegexSet(
+            {
+                "ip": regex(r"\\d+\\.\\d+\\.\\d+\\.\\d+"),
+                "error": regex(r"error", mode="search", flags=re.IGNORECASE),
+                "quoted": regex(r"(\\w)\\w*\\1"),  # backreference, matched alone
+            }
+        )
+
+        assert index.matching("10.0.0.1 ERROR") == {"ip", "error"}
+        ```
+    """
+
+    def __init__(
+        self, rules: Mapping[Hashable, Criteria] | None = None, batch_size: int = 100
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._rules: dict[Hashable, regex] = {}
+        self._batches: list[_Batch] = []
+        self._individual: list[tuple[regex, Hashable]] = []
+        self._dirty = True
+        self.batch_size = batch_size
+        for name, criteria in (rules or {}).items():
+            self.add(name, criteria)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, name) -> bool:
+        return name in self._rules
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._rules)
+
+    def __getitem__(self, name) -> Criteria:
+        return self._rules[name]
+
+    def add(self, name: Hashable, criteria: Criteria) -> None:
+        """
+        Add a rule to the set, replacing any existing rule with the same name.
+
+        Args:
+            name: Identifier returned by ``matching`` when the rule matches.
+            criteria: ``regex`` criteria for the rule.
+
+        Raises:
+            TypeError: If the criteria is not ``regex``.
+        """
+        if type(criteria) is not regex:
+            raise TypeError(
+                f"{criteria.__class__.__name__} cannot be indexed, use regex"
+            )
+        self._rules[name] = criteria
+        self._dirty = True
+
+    def remove(self, name: Hashable) -> None:
+        """
+        Remove a rule from the set.
+
+        Raises:
+            KeyError: If no rule with that name exists.
+        """
+        del self._rules[name]
+        self._dirty = True
+
+    def _build(self) -> None:
+        by_mode: dict[str, dict[str, list[Hashable]]] = {}
+        self._individual = []
+        for name, criteria in self._rules.items():
+            scoped = _scoped(criteria)
+            if scoped is None:
+                self._individual.append((criteria, name))
+            else:
+                # Identical patterns share a group.
+                patterns = by_mode.setdefault(criteria.mode, {})
+                patterns.setdefault(scoped, []).append(name)
+
+        self._batches = []
+        for mode, patterns in by_mode.items():
+            items = list(patterns.items())
+            for start in range(0, len(items), self.batch_size):
+                batch = items[start : start + self.batch_size]
+                self._batches.append(_Batch(mode, batch))
+        self._dirty = False
+
+    def _prepare(self, subject) -> None:
+        if not isinstance(subject, str):
+            raise TypeError(f"{subject} needs to be a string")
+        if self._dirty:
+            self._build()
+
+    def matching(self, subject: str) -> set[Hashable]:
+        """
+        Return the names of all rules that match ``subject``.
+
+        Args:
+            subject: String to test against the rules.
+
+        Returns:
+            set: Names of the matching rules.
+
+        Raises:
+            TypeError: If the subject is not a string.
+        """
+        self._prepare(subject)
+        names = set()
+        for batch in self._batches:
+            names.update(batch.matching(subject))
+        for criteria, name in self._individual:
+            if criteria.run_match(subject):
+                names.add(name)
+        return names
+
+    def any_match(self, subject: str) -> bool:
+        """
+        Return whether any rule matches ``subject``, stopping at the first match.
+
+        Raises:
+            TypeError: If the subject is not a string.
+        """
+        self._prepare(subject)
+        return any(batch.any(subject) is not None for batch in self._batches) or any(
+            criteria.run_match(subject) for criteria, _ in self._individual
+        )
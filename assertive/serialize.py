@@ -21,9 +21,15 @@ from .criteria.basic import (
 from .criteria.string import as_json_matches, ignore_case, regex
 
 from .criteria.list import (
+    any_gap,
     contains,
     contains_exactly,
+    contains_in_any_order,
     has_length,
+    many,
+    matches_sequence,
+    one,
+    optional,
 )
 
 from bidict import bidict
@@ -45,6 +51,12 @@ SERIALIZABLE_CRITERIA = bidict(
         "$json": as_json_matches,
         "$contains": contains,
         "$contains_exactly": contains_exactly,
+        "$contains_in_any_order": contains_in_any_order,
+        "$sequence": matches_sequence,
+        "$one": one,
+        "$many": many,
+        "$optional": optional,
+        "$any_gap": any_gap,
         "$regex": regex,
         "$length": has_length,
         "$key_values": has_key_values,
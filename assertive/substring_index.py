@@ -0,0 +1,226 @@
+import collections
+from collections.abc import Hashable, Iterator, Mapping
+from typing import Optional
+
+from assertive.core import Criteria
+from assertive.criteria.string import contains_substring
+
+
+class _Automaton:
+    """
+    Aho-Corasick automaton counting occurrences of many patterns in one scan.
+
+    Occurrences are counted the way ``str.count`` counts them: left to right
+    and without overlapping other occurrences of the same pattern.
+    """
+
+    __slots__ = ("transitions", "outputs", "lengths")
+
+    def __init__(self, patterns: list[str]):
+        self.lengths = [len(pattern) for pattern in patterns]
+        goto: list[dict[str, int]] = [{}]
+        own: list[list[int]] = [[]]
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                following = goto[state].get(char)
+                if following is None:
+                    following = len(goto)
+                    goto[state][char] = following
+                    goto.append({})
+                    own.append([])
+                state = following
+            own[state].append(index)
+
+        # Breadth first, so a state's failure state is always complete before
+        # the state itself. Every state gets the full transition table of its
+        # failure state, which turns the automaton into a DFA: scanning a
+        # character is a single dictionary lookup, missing characters lead
+        # back to the root.
+        self.transitions: list[dict[str, int]] = [dict(goto[0])]
+        self.transitions.extend({} for _ in range(len(goto) - 1))
+        outputs: list[tuple[int, ...]] = [tuple(own[0])] * len(goto)
+        failure = [0] * len(goto)
+        queue = collections.deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            fallback = failure[state]
+            transitions = dict(self.transitions[fallback])
+            for char, following in goto[state].items():
+                transitions[char] = following
+                failure[following] = (
+                    self.transitions[fallback].get(char, 0) if state else 0
+                )
+                queue.append(following)
+            self.transitions[state] = transitions
+            outputs[state] = tuple(own[state]) + outputs[fallback]
+        self.outputs = outputs
+
+    def counts(self, subject: str) -> list[int]:
+        lengths = self.lengths
+        counts = [0] * len(lengths)
+        # Position after the last counted occurrence of each pattern.
+        free = [0] * len(lengths)
+        transitions = self.transitions
+        outputs = self.outputs
+        state = 0
+        for end, char in enumerate(subject, 1):
+            state = transitions[state].get(char, 0)
+            hits = outputs[state]
+            if hits:
+                for index in hits:
+                    if end - lengths[index] >= free[index]:
+                        counts[index] += 1
+                        free[index] = end
+        return counts
+
+
+class SubstringIndex:
+    """
+    A named collection of ``contains_substring`` rules evaluated in one scan.
+
+    Every ``contains_substring`` criteria calls ``str.count`` on the subject,
+    so evaluating ``n`` of them scans the subject ``n`` times. A
+    ``SubstringIndex`` builds an Aho-Corasick automaton over all the
+    substrings and counts every one of them in a single pass over the
+    subject, then checks each rule's ``times_criteria`` against its count.
+
+    For small rule sets repeated ``str.count`` calls are faster than a single
+    scan in Python, so the automaton is only used from
+    ``automaton_threshold`` distinct substrings upwards.
+
+    Args:
+        rules: Optional mapping of rule names to ``contains_substring`` criteria.
+        automaton_threshold: Minimum number of distinct substrings for which
+            the automaton is used.
+
+    Example:
+        ```python
+        index = SubstringIndex(
+            {
+                "timeout": contains_substring("timed out"),
+                "retried": contains_substring("retry").at_least_times(3),
+                "clean": contains_substring("ERROR").never(),
+            }
+        )
+
+        assert index.counts("retry retry retry") == {
+            "timed out": 0,
+            "retry": 3,
+            "ERROR": 0,
+        }
+        assert index.matching("retry retry retry") == {"retried", "clean"}
+        ```
+    """
+
+    def __init__(
+        self,
+        rules: Mapping[Hashable, Criteria] | None = None,
+        automaton_threshold: int = 128,
+    ):
+        self._rules: dict[Hashable, contains_substring] = {}
+        self._automaton: Optional[_Automaton] = None
+        self._patterns: list[str] = []
+        self._scanned: list[str] = []
+        self._dirty = True
+        self.automaton_threshold = automaton_threshold
+        for name, criteria in (rules or {}).items():
+            self.add(name, criteria)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, name) -> bool:
+        return name in self._rules
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._rules)
+
+    def __getitem__(self, name) -> Criteria:
+        return self._rules[name]
+
+    def add(self, name: Hashable, criteria: Criteria) -> None:
+        """
+        Add a rule to the index, replacing any existing rule with the same name.
+
+        Args:
+            name: Identifier returned by ``matching`` when the rule matches.
+            criteria: ``contains_substring`` criteria for the rule.
+
+        Raises:
+            TypeError: If the criteria is not ``contains_substring``.
+        """
+        if type(criteria) is not contains_substring or not isinstance(
+            criteria.substring, str
+        ):
+            raise TypeError(
+                f"{criteria.__class__.__name__} cannot be indexed, "
+                "use contains_substring with a string"
+            )
+        self._rules[name] = criteria
+        self._dirty = True
+
+    def remove(self, name: Hashable) -> None:
+        """
+        Remove a rule from the index.
+
+        Raises:
+            KeyError: If no rule with that name exists.
+        """
+        del self._rules[name]
+        self._dirty = True
+
+    def _build(self) -> None:
+        self._patterns = list(
+            dict.fromkeys(criteria.substring for criteria in self._rules.values())
+        )
+        # ``str.count`` counts the empty string once per position, which no
+        # automaton state can express; it is always counted directly.
+        scanned = [pattern for pattern in self._patterns if pattern]
+        self._automaton = None
+        if len(scanned) >= self.automaton_threshold:
+            self._automaton = _Automaton(scanned)
+        self._scanned = scanned
+        self._dirty = False
+
+    def counts(self, subject: str) -> dict[str, int]:
+        """
+        Count the occurrences of every indexed substring in ``subject``.
+
+        Counts are the same as ``subject.count(substring)``.
+
+        Raises:
+            TypeError: If the subject is not a string.
+        """
+        if not isinstance(subject, str):
+            raise TypeError(f"{subject} needs to be a string")
+        if self._dirty:
+            self._build()
+
+        if self._automaton is None:
+            return {pattern: subject.count(pattern) for pattern in self._patterns}
+
+        counts = dict(zip(self._scanned, self._automaton.counts(subject)))
+        if "" in self._patterns:
+            counts[""] = len(subject) + 1
+        return counts
+
+    def matching(self, subject: str) -> set[Hashable]:
+        """
+        Return the names of all rules that match ``subject``.
+
+        Args:
+            subject: String to test against the rules.
+
+        Returns:
+            set: Names of the matching rules.
+
+        Raises:
+            TypeError: If the subject is not a string.
+        """
+        counts = self.counts(subject)
+        return {
+            name
+            for name, criteria in self._rules.items()
+            if criteria.times_criteria.run_match(counts[criteria.substring])
+        }
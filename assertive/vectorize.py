@@ -0,0 +1,306 @@
+import numbers
+from typing import Any, Callable
+
+from assertive.compiler import _lookup, compile
+from assertive.core import (
+    AndCriteria,
+    Criteria,
+    InvertedCriteria,
+    OrCriteria,
+    XorCriteria,
+    is_eq,
+)
+from assertive.criteria.basic import (
+    is_between,
+    is_gt,
+    is_gte,
+    is_lt,
+    is_lte,
+    is_neq,
+)
+from assertive.criteria.numeric import (
+    approximately_zero,
+    is_approximately_equal,
+    is_even,
+    is_negative,
+    is_non_negative,
+    is_non_positive,
+    is_odd,
+    is_positive,
+    zero,
+)
+from assertive.criteria.utils import AnyCriteria, WrappedCriteria
+from assertive.intervals import Interval, IntervalCriteria, IntervalSetCriteria
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is missing
+    np = None
+
+Vectorizer = Callable[[Any, Any], Any]
+
+# Boolean, integer and floating point arrays. Every operand of ``&`` and ``|``
+# is evaluated on the whole array, which is only safe when no element can
+# make a comparison raise, as ``None`` in an object array does.
+_NUMERIC_KINDS = "biuf"
+
+_VECTORIZERS: dict[type, Vectorizer] = {}
+_NEGATED_VECTORIZERS: dict[type, Vectorizer] = {}
+
+
+def _vectorizer(*classes: type, negated: bool = False):
+    registry = _NEGATED_VECTORIZERS if negated else _VECTORIZERS
+
+    def decorator(function: Vectorizer) -> Vectorizer:
+        for cls in classes:
+            registry[cls] = function
+        return function
+
+    return decorator
+
+
+def _is_scalar(value) -> bool:
+    return isinstance(value, (numbers.Number, str, bytes)) or (
+        np is not None and isinstance(value, np.generic)
+    )
+
+
+def _fallback(criteria: Criteria, values):
+    # Evaluate element by element, using the compiled form of the criteria to
+    # keep the per-element overhead down.
+    function = compile(criteria)
+    flat = values.ravel()
+    mask = np.fromiter(
+        (bool(function(value)) for value in flat.tolist()),
+        dtype=bool,
+        count=flat.size,
+    )
+    return mask.reshape(values.shape)
+
+
+def _mask(criteria: Criteria, values):
+    vectorizer = _lookup(_VECTORIZERS, criteria)
+    if vectorizer is not None:
+        mask = vectorizer(criteria, values)
+        if mask is not None:
+            return np.asarray(mask, dtype=bool)
+    return _fallback(criteria, values)
+
+
+def _negated_mask(criteria: Criteria, values):
+    vectorizer = _lookup(_NEGATED_VECTORIZERS, criteria)
+    if vectorizer is not None:
+        return np.asarray(vectorizer(criteria, values), dtype=bool)
+    if _lookup(_VECTORIZERS, criteria) is None:
+        return _fallback(InvertedCriteria(criteria), values)
+    return ~_mask(criteria, values)
+
+
+# core
+
+
+@_vectorizer(AndCriteria)
+def _vectorize_and(criteria: AndCriteria, values):
+    mask = np.ones(values.shape, dtype=bool)
+    for item in criteria.items:
+        mask &= _mask(item, values)
+    return mask
+
+
+@_vectorizer(OrCriteria)
+def _vectorize_or(criteria: OrCriteria, values):
+    mask = np.zeros(values.shape, dtype=bool)
+    for item in criteria.items:
+        mask |= _mask(item, values)
+    return mask
+
+
+@_vectorizer(XorCriteria)
+def _vectorize_xor(criteria: XorCriteria, values):
+    return _mask(criteria.left, values) ^ _mask(criteria.right, values)
+
+
+@_vectorizer(InvertedCriteria)
+def _vectorize_inverted(criteria: InvertedCriteria, values):
+    return _negated_mask(criteria.value, values)
+
+
+@_vectorizer(InvertedCriteria, negated=True)
+def _vectorize_inverted_negated(criteria: InvertedCriteria, values):
+    return _mask(criteria.value, values)
+
+
+def _comparison(operator: Callable[[Any, Any], Any]) -> Vectorizer:
+    def vectorize(criteria, values):
+        if not _is_scalar(criteria.value):
+            return None
+        return operator(values, criteria.value)
+
+    return vectorize
+
+
+_vectorizer(is_eq)(_comparison(lambda values, value: values == value))
+_vectorizer(is_neq)(_comparison(lambda values, value: values != value))
+_vectorizer(is_gt)(_comparison(lambda values, value: values > value))
+_vectorizer(is_gte)(_comparison(lambda values, value: values >= value))
+_vectorizer(is_lt)(_comparison(lambda values, value: values < value))
+_vectorizer(is_lte)(_comparison(lambda values, value: values <= value))
+
+
+@_vectorizer(is_between)
+def _vectorize_between(criteria: is_between, values):
+    if not (_is_scalar(criteria.lower) and _is_scalar(criteria.upper)):
+        return None
+    if criteria.is_inclusive:
+        return (values >= criteria.lower) & (values <= criteria.upper)
+    return (values > criteria.lower) & (values < criteria.upper)
+
+
+def _interval_mask(interval: Interval, values):
+    mask = np.ones(values.shape, dtype=bool)
+    if interval.lower is not None:
+        mask &= (
+            values >= interval.lower
+            if interval.lower_closed
+            else values > interval.lower
+        )
+    if interval.upper is not None:
+        mask &= (
+            values <= interval.upper
+            if interval.upper_closed
+            else values < interval.upper
+        )
+    return mask
+
+
+@_vectorizer(IntervalCriteria)
+def _vectorize_interval(criteria: IntervalCriteria, values):
+    interval = criteria.interval
+    if not all(
+        _is_scalar(b) for b in (interval.lower, interval.upper) if b is not None
+    ):
+        return None
+    return _interval_mask(interval, values)
+
+
+@_vectorizer(IntervalSetCriteria)
+def _vectorize_interval_set(criteria: IntervalSetCriteria, values):
+    bounds = [
+        b
+        for interval in criteria.intervals
+        for b in (interval.lower, interval.upper)
+        if b is not None
+    ]
+    if not all(_is_scalar(b) for b in bounds):
+        return None
+    mask = np.zeros(values.shape, dtype=bool)
+    for interval in criteria.intervals:
+        mask |= _interval_mask(interval, values)
+    return mask
+
+
+# numeric
+
+
+@_vectorizer(is_even)
+def _vectorize_is_even(criteria, values):
+    return values % 2 == 0
+
+
+@_vectorizer(is_odd)
+def _vectorize_is_odd(criteria, values):
+    return values % 2 == 1
+
+
+@_vectorizer(is_positive)
+def _vectorize_is_positive(criteria, values):
+    return values > 0
+
+
+@_vectorizer(is_non_negative)
+def _vectorize_is_non_negative(criteria, values):
+    return values >= 0
+
+
+@_vectorizer(is_negative)
+def _vectorize_is_negative(criteria, values):
+    return values < 0
+
+
+@_vectorizer(is_non_positive)
+def _vectorize_is_non_positive(criteria, values):
+    return values <= 0
+
+
+@_vectorizer(zero)
+def _vectorize_zero(criteria, values):
+    return values == 0
+
+
+@_vectorizer(is_approximately_equal)
+def _vectorize_is_approximately_equal(criteria: is_approximately_equal, values):
+    if not _is_scalar(criteria.value):
+        return None
+    return np.abs(values - criteria.value) < criteria.epsilon
+
+
+@_vectorizer(approximately_zero)
+def _vectorize_approximately_zero(criteria: approximately_zero, values):
+    return np.abs(values) < criteria.epsilon
+
+
+# utils
+
+
+@_vectorizer(AnyCriteria)
+@_vectorizer(AnyCriteria, negated=True)
+def _vectorize_any(criteria, values):
+    return np.ones(values.shape, dtype=bool)
+
+
+@_vectorizer(WrappedCriteria)
+def _vectorize_wrapped(criteria: WrappedCriteria, values):
+    return _mask(criteria.inner_criteria, values)
+
+
+@_vectorizer(WrappedCriteria, negated=True)
+def _vectorize_wrapped_negated(criteria: WrappedCriteria, values):
+    return _negated_mask(criteria.inner_criteria, values)
+
+
+def match_many(criteria: Criteria, values):
+    """
+    Evaluate a criteria against every element of an array at once.
+
+    Numeric comparisons (``is_gt``, ``is_between``, ``is_even``,
+    ``is_approximately_equal``, ...) are evaluated as NumPy ufuncs and
+    ``&``/``|``/``^``/``~`` combine the resulting masks. Criteria without a
+    vectorized form, and arrays that are not boolean, integer or floating
+    point (such as object or string arrays), are evaluated element by
+    element, so ``&`` and ``|`` short-circuit as they do in ``run_match``.
+
+    Requires the optional ``numpy`` dependency (``pip install assertive[numpy]``).
+
+    Args:
+        criteria: Criteria to evaluate.
+        values: Array (or anything ``numpy.asarray`` accepts) of subjects.
+
+    Returns:
+        numpy.ndarray: Boolean mask with the same shape as ``values``.
+
+    Example:
+        ```python
+        readings = numpy.array([-1.0, 0.5, 3.0, 12.0])
+
+        match_many(is_between(0, 10) & ~zero(), readings)
+        # array([False,  True,  True, False])
+        ```
+    """
+    if np is None:
+        raise ImportError(
+            "match_many requires numpy, install it with `pip install assertive[numpy]`"
+        )
+    values = np.asarray(values)
+    if values.dtype.kind not in _NUMERIC_KINDS:
+        return _fallback(criteria, values)
+    return _mask(criteria, values)
@@ -0,0 +1,59 @@
+"""
+``contains`` with many exact values on 10^5-element subjects.
+
+Compares the set lookup of hashable literals with testing every expected
+value against every element, which is what ``contains`` used to do, for
+list, set and dict-keys subjects.
+
+Run with ``python benchmarks/bench_contains.py``.
+"""
+
+import random
+import time
+
+from assertive import contains, is_gt
+
+SIZE = 100_000
+LITERALS = 50
+ROUNDS = 3
+
+
+def element_wise(criteria: contains, subject) -> bool:
+    for item in criteria.items:
+        if not any([item.run_match(s) for s in subject]):
+            return False
+    return True
+
+
+def timed(function, *args) -> tuple[float, bool]:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        result = function(*args)
+    return (time.perf_counter() - start) / ROUNDS, result
+
+
+def main():
+    rng = random.Random(0)
+    values = [f"user-{i}" for i in range(SIZE)]
+    rng.shuffle(values)
+    expected = rng.sample(values, LITERALS)
+    criteria = contains(*expected, is_gt("user-9"))
+
+    subjects = {
+        "list": values,
+        "set": set(values),
+        "dict keys": dict.fromkeys(values).keys(),
+    }
+    for name, subject in subjects.items():
+        old, old_result = timed(element_wise, criteria, subject)
+        new, new_result = timed(criteria.run_match, subject)
+        assert old_result == new_result is True
+        print(
+            f"{name:9} ({SIZE} elements, {LITERALS} literals): "
+            f"element-wise {old * 1e3:8.1f}ms, hashed {new * 1e3:6.2f}ms "
+            f"({old / new:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
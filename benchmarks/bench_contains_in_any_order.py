@@ -0,0 +1,75 @@
+"""
+``contains_in_any_order`` on 1k expectations against 1k-element subjects.
+
+Reconciles two result sets of records in different orders: once with
+exact values, counted with a ``Counter``, and once with criteria, assigned
+with Hopcroft-Karp matching. A backtracking search over assignments is
+timed on a small, adversarial case for comparison; it grows exponentially.
+
+Run with ``python benchmarks/bench_contains_in_any_order.py``.
+"""
+
+import random
+import time
+
+from assertive import contains_in_any_order, has_key_values, is_gt
+
+SIZE = 1_000
+
+
+def backtracking(items, subject) -> bool:
+    used = [False] * len(subject)
+
+    def assign(index: int) -> bool:
+        if index == len(items):
+            return True
+        for position, element in enumerate(subject):
+            if not used[position] and items[index] == element:
+                used[position] = True
+                if assign(index + 1):
+                    return True
+                used[position] = False
+        return False
+
+    return assign(0)
+
+
+def timed(criteria, subject) -> float:
+    start = time.perf_counter()
+    assert criteria.run_match(subject)
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    records = [{"id": i, "amount": rng.randrange(100)} for i in range(SIZE)]
+    subject = [dict(record) for record in records]
+    rng.shuffle(subject)
+
+    literal_rules = contains_in_any_order(*(record["id"] for record in records))
+    literal_time = timed(literal_rules, [record["id"] for record in subject])
+    print(f"{SIZE} literals x {SIZE} elements:  {literal_time * 1e3:8.1f}ms")
+
+    criteria_rules = contains_in_any_order(
+        *(has_key_values({"amount": is_gt(r["amount"] - 1)}) for r in records)
+    )
+    criteria_time = timed(criteria_rules, subject)
+    print(f"{SIZE} criteria x {SIZE} elements:  {criteria_time * 1e3:8.1f}ms")
+
+    # Every item accepts every element but the last needs a particular one,
+    # which backtracking only finds after trying every other assignment.
+    for size in (6, 8, 9):
+        items = [is_gt(0)] * (size - 1) + [is_gt(size - 1)]
+        small = list(range(1, size)) + [0]
+        start = time.perf_counter()
+        assert not backtracking(items, small)
+        slow = time.perf_counter() - start
+        fast = timed(~contains_in_any_order(*items), small)
+        print(
+            f"{size} items, no assignment: backtracking {slow * 1e3:8.1f}ms, "
+            f"matching {fast * 1e3:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
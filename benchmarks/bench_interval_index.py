@@ -0,0 +1,57 @@
+"""
+``IntervalIndex.matching`` against a linear scan of ``is_between`` rules.
+
+Run with ``python benchmarks/bench_interval_index.py``.
+"""
+
+import random
+import time
+
+from assertive import IntervalIndex, is_between
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+QUERIES = 1_000
+SCAN_QUERIES = 20
+
+
+def rules(count, rng):
+    for i in range(count):
+        lower = rng.uniform(0, 1_000_000)
+        criteria = is_between(lower, lower + rng.uniform(0, 1_000))
+        if i % 3 == 0:
+            criteria.exclusive()
+        yield i, criteria
+
+
+def main():
+    rng = random.Random(0)
+    queries = [rng.uniform(0, 1_000_000) for _ in range(QUERIES)]
+
+    for size in SIZES:
+        criteria = dict(rules(size, rng))
+
+        start = time.perf_counter()
+        index = IntervalIndex(criteria)
+        index.matching(0)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in queries:
+            index.matching(value)
+        indexed = (time.perf_counter() - start) / QUERIES
+
+        start = time.perf_counter()
+        for value in queries[:SCAN_QUERIES]:
+            expected = {n for n, c in criteria.items() if c.run_match(value)}
+            assert index.matching(value) == expected
+        scan = (time.perf_counter() - start) / SCAN_QUERIES
+
+        print(
+            f"{size:>9,} rules: build {build:7.2f}s, "
+            f"index {indexed * 1e6:8.1f}us/query, "
+            f"scan {scan * 1e6:12.1f}us/query ({scan / indexed:,.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Testing one JSON payload with many ``as_json_matches`` rules.
+
+Compares every rule parsing the payload again with the rules sharing one
+parse through ``use_json_cache``.
+
+Run with ``python benchmarks/bench_json_cache.py``.
+"""
+
+import json
+import time
+
+from assertive import JsonCache, as_json_matches, has_key_values, is_gt, use_json_cache
+
+RULES = 50
+PAYLOADS = 20
+
+
+def main():
+    payloads = [
+        json.dumps({"id": n, "values": list(range(2_000)), "score": n % 7})
+        for n in range(PAYLOADS)
+    ]
+    # Keys after a large value, so that partial parsing does not help.
+    rules = [
+        as_json_matches(has_key_values({"score": is_gt(n % 7)})) for n in range(RULES)
+    ]
+
+    start = time.perf_counter()
+    uncached = [sum(rule.run_match(p) for rule in rules) for p in payloads]
+    parsing = time.perf_counter() - start
+
+    cache = JsonCache()
+    start = time.perf_counter()
+    with use_json_cache(cache):
+        cached = [sum(rule.run_match(p) for rule in rules) for p in payloads]
+    sharing = time.perf_counter() - start
+
+    assert cached == uncached
+    print(f"{RULES} rules x {PAYLOADS} payloads")
+    print(f"parse per rule:   {parsing * 1e3:8.1f}ms")
+    print(
+        f"shared parse:     {sharing * 1e3:8.1f}ms ({parsing / sharing:.0f}x, "
+        f"{cache.hits} hits, {cache.misses} misses)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Matching a key of a multi-megabyte JSON payload with ``as_json_matches``.
+
+Compares reading only the keys the inner ``has_key_values`` needs with
+parsing the whole payload with ``json.loads``, for a key at the start of the
+payload and one after a large value, on ``str`` and ``bytes`` subjects.
+
+Run with ``python benchmarks/bench_json_partial.py``.
+"""
+
+import json
+import time
+import tracemalloc
+
+from assertive import as_json_matches, has_key_values
+
+ITEMS = 50_000
+ROUNDS = 5
+
+
+def measure(criteria, subject) -> tuple[float, int]:
+    tracemalloc.start()
+    assert criteria.run_match(subject)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        criteria.run_match(subject)
+    return (time.perf_counter() - start) / ROUNDS, peak
+
+
+def main():
+    items = [
+        {"id": i, "name": f"item {i}", "tags": ["a", "b"], "price": i / 7}
+        for i in range(ITEMS)
+    ]
+    payloads = {
+        "key first": {"status": "ok", "items": items},
+        "key last": {"items": items, "status": "ok"},
+    }
+    partial = as_json_matches(has_key_values({"status": "ok"}), partial=True)
+    full = as_json_matches(has_key_values({"status": "ok"}))
+
+    for name, payload in payloads.items():
+        text = json.dumps(payload)
+        for kind, subject in (("str", text), ("bytes", text.encode())):
+            full_time, full_peak = measure(full, subject)
+            partial_time, partial_peak = measure(partial, subject)
+            print(
+                f"{name:9} {kind:5} ({len(text) / 1e6:.1f}MB): "
+                f"json.loads {full_time * 1e3:7.2f}ms {full_peak / 1e6:6.1f}MB, "
+                f"partial {partial_time * 1e3:7.2f}ms {partial_peak / 1e6:6.1f}MB "
+                f"({full_time / partial_time:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
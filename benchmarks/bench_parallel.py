@@ -0,0 +1,44 @@
+"""
+Throughput of ``assertive.parallel.evaluate`` by worker count.
+
+Run with ``python benchmarks/bench_parallel.py``.
+"""
+
+import os
+import time
+
+from assertive import has_key_values, is_between, starts_with
+from assertive.parallel import evaluate
+
+RECORDS = 1_000_000
+
+
+def records():
+    for i in range(RECORDS):
+        yield {"status": 200 + i % 400, "path": f"/api/{i % 7}/items", "id": i}
+
+
+def main():
+    criteria = has_key_values(
+        {"status": is_between(200, 299), "path": starts_with("/api/3")}
+    )
+
+    start = time.perf_counter()
+    baseline = sum(1 for record in records() if criteria.run_match(record))
+    elapsed = time.perf_counter() - start
+    print(f"serial run_match: {RECORDS / elapsed:>12,.0f} records/s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        matched = sum(
+            ok for _, ok in evaluate(criteria, records(), workers, chunksize=5000)
+        )
+        elapsed = time.perf_counter() - start
+        assert matched == baseline
+        print(f"{workers:>3} workers:      {RECORDS / elapsed:>12,.0f} records/s")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
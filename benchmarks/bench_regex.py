@@ -0,0 +1,49 @@
+"""
+Matching against 10k distinct ``regex`` patterns.
+
+Compares the precompiled patterns kept by ``regex`` with calling
+``re.match(pattern, subject)`` on every evaluation, which overflows the
+``re`` module cache and recompiles patterns over and over.
+
+Run with ``python benchmarks/bench_regex.py``.
+"""
+
+import re
+import time
+
+from assertive import regex
+
+PATTERNS = 10_000
+ROUNDS = 5
+
+
+def main():
+    patterns = [rf"user-{i}-[a-z]+\d{{2,4}}$" for i in range(PATTERNS)]
+    subject = "user-5000-abc123"
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        uncached = sum(bool(re.match(p, subject)) for p in patterns)
+    recompiling = (time.perf_counter() - start) / ROUNDS
+
+    criteria = [regex(p) for p in patterns]
+    start = time.perf_counter()
+    matched = sum(c.run_match(subject) for c in criteria)
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        matched = sum(c.run_match(subject) for c in criteria)
+    precompiled = (time.perf_counter() - start) / ROUNDS
+
+    assert matched == uncached == 1
+    print(f"re.match per call:    {recompiling * 1e3:8.1f}ms per round")
+    print(f"regex, first round:   {first * 1e3:8.1f}ms (compiles patterns)")
+    print(
+        f"regex, later rounds:  {precompiled * 1e3:8.1f}ms per round "
+        f"({recompiling / precompiled:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
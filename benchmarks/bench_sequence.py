@@ -0,0 +1,62 @@
+"""
+``matches_sequence`` against a backtracking matcher.
+
+The backtracking matcher tries every way of splitting the subject between
+``many`` slots, like a backtracking regex engine, and is exponential on
+patterns such as ``many(a), many(a), ..., b``. The automaton reads each
+element once.
+
+Run with ``python benchmarks/bench_sequence.py``.
+"""
+
+import time
+
+from assertive import any_gap, many, matches_sequence
+
+SLOTS = 8
+
+
+def backtracking(items, subject, start=0) -> bool:
+    if not items:
+        return start == len(subject)
+    item, rest = items[0], items[1:]
+    if isinstance(item, (many, any_gap)):
+        end = start
+        while True:
+            if backtracking(rest, subject, end):
+                return True
+            if end == len(subject) or not item.run_match(subject[end]):
+                return False
+            end += 1
+    return (
+        start < len(subject)
+        and item.run_match(subject[start])
+        and backtracking(rest, subject, start + 1)
+    )
+
+
+def timed(function, *args) -> tuple[float, bool]:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    criteria = matches_sequence(*[many("a")] * SLOTS, "b")
+    for size in (5, 10, 15):
+        subject = ["a"] * size
+        old, old_result = timed(backtracking, criteria.items, subject)
+        new, new_result = timed(criteria.run_match, subject)
+        assert old_result == new_result is False
+        print(
+            f"{SLOTS} many slots, {size:3} elements: backtracking {old * 1e3:9.1f}ms, "
+            f"automaton {new * 1e3:6.2f}ms"
+        )
+
+    subject = ["a"] * 100_000
+    new, _ = timed(criteria.run_match, subject)
+    print(f"automaton over {len(subject)} elements: {new * 1e3:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+List criteria over a generator of 10^6 rows.
+
+Compares materialising the rows into a list before matching, which was
+required before iterators were accepted, with matching the generator
+directly in a single pass, measuring time and peak memory.
+
+Run with ``python benchmarks/bench_streams.py``.
+"""
+
+import time
+import tracemalloc
+
+from assertive import contains, has_length, is_gt
+
+SIZE = 1_000_000
+
+
+def rows():
+    for i in range(SIZE):
+        yield (i, f"row-{i}")
+
+
+def measured(function) -> tuple[float, int, bool]:
+    # Timed without tracing, which slows every allocation down.
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    criteria = has_length(is_gt(SIZE - 1)) & contains((SIZE - 1, f"row-{SIZE - 1}"))
+
+    cases = {
+        "materialised": lambda: criteria.run_match(list(rows())),
+        "streamed": lambda: criteria.run_match(rows()),
+    }
+    for name, function in cases.items():
+        elapsed, peak, result = measured(function)
+        assert result is True
+        print(f"{name:12} {elapsed * 1e3:8.1f}ms, peak {peak / 2**20:7.2f}MiB")
+
+    limit = has_length(is_gt(10))
+    elapsed, _, result = measured(lambda: (~limit).run_match(rows()))
+    assert result is False
+    print(f"early exit   {elapsed * 1e3:8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
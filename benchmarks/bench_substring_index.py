@@ -0,0 +1,46 @@
+"""
+``SubstringIndex.matching`` against evaluating each ``contains_substring``.
+
+Run with ``python benchmarks/bench_substring_index.py``.
+"""
+
+import random
+import string
+import time
+
+from assertive import SubstringIndex, contains_substring
+
+DOCUMENT_SIZE = 100_000
+RULE_COUNTS = (10, 100, 300, 1_000)
+
+
+def word(rng):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 8)))
+
+
+def main():
+    rng = random.Random(0)
+    alphabet = string.ascii_lowercase + "     "
+    document = "".join(rng.choice(alphabet) for _ in range(DOCUMENT_SIZE))
+
+    for count in RULE_COUNTS:
+        rules = {i: contains_substring(word(rng)) for i in range(count)}
+        index = SubstringIndex(rules)
+        index.matching("")
+
+        start = time.perf_counter()
+        expected = {name for name, c in rules.items() if c.run_match(document)}
+        each = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert index.matching(document) == expected
+        indexed = time.perf_counter() - start
+
+        print(
+            f"{count:>5} rules: each {each * 1e3:7.1f}ms, "
+            f"index {indexed * 1e3:7.1f}ms ({each / indexed:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
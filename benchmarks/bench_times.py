@@ -0,0 +1,68 @@
+"""
+Call and substring counting that stops once ``times_criteria`` is decided.
+
+Compares counting every matching call or occurrence, which is what the
+``TimesMixin`` criteria used to do, with stopping as soon as the count
+settles the result, on a mock with 10^6 calls and a 10^7 character string.
+
+Run with ``python benchmarks/bench_times.py``.
+"""
+
+import time
+from unittest.mock import Mock
+
+from assertive import contains_substring, was_called_with
+
+CALLS = 1_000_000
+
+
+def count_all(criteria, subject) -> bool:
+    if isinstance(criteria, contains_substring):
+        count = subject.count(criteria.substring)
+    else:
+        count = sum(map(criteria._match_single_call, subject.call_args_list))
+    return criteria.times_criteria.run_match(count)
+
+
+def timed(function, *args) -> tuple[float, bool]:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    mock = Mock()
+    for i in range(CALLS):
+        mock(i % 100)
+    text = "lorem ipsum dolor " * 550_000 + "sit amet"
+
+    cases = {
+        f"was_called_with(7).once(), {CALLS} calls": (
+            was_called_with(7).once(),
+            mock,
+        ),
+        f"was_called_with(7).never(), {CALLS} calls": (
+            was_called_with(7).never(),
+            mock,
+        ),
+        f'contains_substring("ipsum").twice(), {len(text)} chars': (
+            contains_substring("ipsum").twice(),
+            text,
+        ),
+        f'contains_substring("dolor"), {len(text)} chars': (
+            contains_substring("dolor"),
+            text,
+        ),
+    }
+    for name, (criteria, subject) in cases.items():
+        old, old_result = timed(count_all, criteria, subject)
+        new, new_result = timed(criteria.run_match, subject)
+        assert old_result == new_result
+        print(
+            f"{name:50} counting all {old * 1e3:8.1f}ms, "
+            f"bounded {new * 1e3:7.3f}ms ({old / new:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import sys
+import threading
+
+from assertive.criteria.exception import (
+    raises_exact_exception,
+    raises_exception,
+)
+from assertive.criteria.string import starts_with
+
+
+class SpecificError(ValueError):
+    pass
+
+
+def raise_specific():
+    raise SpecificError("Something went wrong")
+
+
+def return_normally():
+    return None
+
+
+# raises_exception
+def test_raises_exception_matches_pass():
+    assert raise_specific == raises_exception(ValueError)
+    assert raise_specific == raises_exception(SpecificError, "Something went wrong")
+    assert SpecificError("boom") == raises_exception(ValueError, starts_with("bo"))
+
+
+def test_raises_exception_does_not_match_pass():
+    assert raise_specific != raises_exception(KeyError)
+    assert raise_specific != raises_exception(ValueError, "Something else")
+    assert return_normally != raises_exception(ValueError)
+
+
+def test_raises_exception_context_manager():
+    with raises_exception(SpecificError, "Something went wrong"):
+        raise_specific()
+
+
+# raises_exact_exception
+def test_raises_exact_exception_matches_pass():
+    assert raise_specific == raises_exact_exception(SpecificError)
+    assert raise_specific != raises_exact_exception(ValueError)
+
+
+def test_criteria_does_not_keep_the_exception():
+    criteria = raises_exception(SpecificError)
+
+    assert raise_specific == criteria
+    assert not hasattr(criteria, "exception")
+
+
+def test_shared_instance_across_threads():
+    criteria = raises_exception(ValueError, starts_with("even"))
+    errors = []
+    barrier = threading.Barrier(16)
+
+    def worker(index):
+        barrier.wait()
+        for i in range(2000):
+            message = "even" if (index + i) % 2 == 0 else "odd"
+
+            def fail():
+                raise ValueError(message)
+
+            try:
+                if message == "even":
+                    assert fail == criteria
+                    with criteria:
+                        fail()
+                else:
+                    assert fail != criteria
+            except AssertionError as ex:
+                errors.append(ex)
+
+    # Switch threads as often as possible to provoke interleavings.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
@@ -1,10 +1,27 @@
-from assertive.criteria.basic import is_gt
+import itertools
+import random
+import re
+from unittest.mock import ANY, Mock, call
+
+import pytest
+
+from assertive.core import Consumer, is_eq
+from assertive.criteria.basic import is_gt, is_gte, is_lt
 from assertive.criteria.exception import raises_exception
+from assertive.criteria.numeric import is_odd
+from assertive.criteria.object import is_type
 from assertive.criteria.list import (
+    _maximum_matching,
+    any_gap,
     contains,
     contains_exactly,
+    contains_in_any_order,
     has_length,
     is_empty,
+    many,
+    matches_sequence,
+    one,
+    optional,
 )
 
 
@@ -53,6 +70,63 @@ def test_contains_does_not_match_pass():
     assert [1, 2, 3] != contains(1, 2, is_gt(3))
 
 
+def test_contains_many_literals():
+    subject = list(range(100))
+
+    assert subject == contains(*range(0, 100, 7))
+    assert tuple(subject) == contains(*range(0, 100, 7), is_gt(98))
+    assert subject != contains(*range(0, 101, 10))
+    assert "hello" == contains("h", "e", "l", "o", "l")
+    assert "hello" != contains("he")
+
+
+def test_contains_native_membership():
+    assert {1, 2, 3} == contains(1, 3)
+    assert frozenset({1, 2, 3}) != contains(1, 4)
+    assert {"a": 1, "b": 2} == contains("a", "b")
+    assert {"a": 1, "b": 2}.keys() == contains("b", is_gt("a"))
+    assert {"a": 1}.keys() != contains(1)
+
+
+def test_contains_unhashable_elements():
+    subject = [[1], {"a": 1}, 2, 3, 4, 5, 6]
+
+    assert subject == contains([1], {"a": 1}, 2, 3, 4, 5, 6)
+    assert subject != contains(2, 3, 4, 5, 6, 7)
+    # Elements with their own equality are compared, not hashed.
+    assert [[1], is_gt(1), 0] == contains(0, 2, 3, 4, 5)
+    assert [[1], is_gt(1), 0] != contains(0, 1, 3, 4, 5)
+
+
+class Anything:
+    def __eq__(self, other):
+        return True
+
+    def __hash__(self):
+        return 0
+
+
+def test_contains_elements_with_custom_equality():
+    for subject in ([ANY, 7, 8, 9, 10], {Anything(), 7}, (Anything(), 7, 8, 9, 10)):
+        assert subject == contains(1, 7)
+        assert Stream(subject) == contains(1, 7)
+        assert subject == contains_in_any_order(1, 7)
+        assert subject != contains_in_any_order(1, 2, 7)
+
+    assert [1, 2] == contains(ANY, Anything())
+    assert [1, 2] == contains_in_any_order(ANY, Anything())
+    assert [1] != contains_in_any_order(ANY, Anything())
+
+
+def test_contains_literals_compare_equal():
+    # ``1``, ``1.0`` and ``True`` are equal and hash the same.
+    assert [1.0, True] == contains(1, 1.0, True)
+    assert [float("nan")] != contains(float("nan"))
+    nan = float("nan")
+    assert [nan] != contains(nan)
+    assert [nan] != contains(is_eq(nan))
+
+
 # contains_exactly
 def test_contains_exactly_matches_pass():
     assert [1, 2, 3] == contains_exactly(1, 2, 3)
@@ -64,3 +138,273 @@ def test_contains_exactly_does_not_match_pass():
     assert [1, 2, 3] != contains_exactly(3, 2, 1)
     assert [1, 2, 3] != contains_exactly(1, 3, 2)
     assert [1, 2, 3] != contains_exactly(1, 2, 3, 4)
+
+
+# contains_in_any_order
+def test_contains_in_any_order_matches_pass():
+    assert [3, 1, 2] == contains_in_any_order(1, 2, 3)
+    assert [1, 1, 2] == contains_in_any_order(1, 1)
+    assert [1, 2] == contains_in_any_order(is_gt(0), 2)
+    assert [2, 1] == contains_in_any_order(is_gt(1), is_gt(0))
+    assert [1, 2, 3, 4] == contains_in_any_order(2, is_gt(3))
+    assert [] == contains_in_any_order()
+
+
+def test_contains_in_any_order_does_not_match_pass():
+    assert [1, 2] != contains_in_any_order(1, 1)
+    assert [2, 9] != contains_in_any_order(is_gt(0), 2, 9)
+    assert [1, 2] != contains_in_any_order(is_gt(1), 2)
+    assert [1, 2] != contains_in_any_order(is_gt(1), is_gt(1))
+    assert [1] != contains_in_any_order(1, is_gt(0))
+
+
+def test_contains_in_any_order_literals_shared_with_criteria():
+    # Equal elements can still differ for a criteria, e.g. by type.
+    assert [1, 1.0] == contains_in_any_order(1, is_type(int))
+    assert [1.0, 1] == contains_in_any_order(1.0, is_type(int))
+    assert [1.0, 1.0] != contains_in_any_order(1, is_type(int))
+    assert [[1], [1], 2] == contains_in_any_order([1], [1], 2)
+    assert [[1], 2] != contains_in_any_order([1], [1])
+
+
+def test_contains_in_any_order_same_as_permutation_search():
+    rng = random.Random(0)
+    pool = [0, 1, 2, is_gt(0), is_gt(1), is_odd(), is_type(float), 1.0]
+    for _ in range(2000):
+        items = rng.sample(pool, rng.randrange(5))
+        subject = [rng.choice([0, 1, 2, 3, 1.0, 2.5]) for _ in range(rng.randrange(6))]
+        expected = any(
+            all(item == element for item, element in zip(items, chosen))
+            for chosen in itertools.permutations(subject, len(items))
+        )
+        assert contains_in_any_order(*items).run_match(subject) is expected
+
+
+def test_maximum_matching():
+    assert _maximum_matching([], 0) == 0
+    assert _maximum_matching([[0, 1], [0]], 2) == 2
+    assert _maximum_matching([[0], [0], [1, 2]], 3) == 2
+    # The last vertex is only matched through an augmenting path through
+    # every other vertex.
+    chain = [[i, i + 1] for i in range(1999)] + [[0]]
+    assert _maximum_matching(chain, 2000) == 2000
+
+
+def test_maximum_matching_same_as_brute_force():
+    rng = random.Random(0)
+    for _ in range(500):
+        left, right = rng.randrange(6), rng.randrange(6)
+        adjacency = [
+            [v for v in range(right) if rng.random() < 0.4] for _ in range(left)
+        ]
+        best = max(
+            sum(1 for u, v in enumerate(chosen) if v is not None and v in adjacency[u])
+            for chosen in itertools.product([None, *range(right)], repeat=left)
+            if len([v for v in chosen if v is not None])
+            == len({v for v in chosen if v is not None})
+        )
+        assert _maximum_matching(adjacency, right) == best
+
+
+def test_contains_in_any_order_large():
+    subject = list(range(1000))
+    random.Random(1).shuffle(subject)
+    items = [is_gt(i - 1) for i in range(1000)]
+
+    assert subject == contains_in_any_order(*items)
+    assert subject != contains_in_any_order(*items[1:], is_gt(998))
+
+
+# streams
+class Stream:
+    """
+    A one-shot iterator over ``elements`` that records how many were read.
+    """
+
+    def __init__(self, elements):
+        self.elements = iter(elements)
+        self.read = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        element = next(self.elements)
+        self.read += 1
+        return element
+
+
+def test_list_criteria_accept_iterators():
+    assert (i for i in range(3)) == has_length(3)
+    assert (i for i in range(3)) != has_length(is_gt(3))
+    assert iter([]) == is_empty()
+    assert iter([1]) != is_empty()
+    assert iter([1, [2], 3]) == contains(3, [2], is_odd())
+    assert iter([1, 2, 3]) != contains(1, 4)
+    assert iter([1, 2, 3]) == contains_exactly(1, is_gt(1), 3)
+    assert iter([1, 2, 3]) != contains_exactly(1, 2)
+    assert iter([1, 2]) != contains_exactly(1, 2, 3)
+    assert iter([3, 1, 2]) == contains_in_any_order(1, 2, is_gt(2))
+
+
+def test_list_criteria_stop_reading_iterators():
+    stream = Stream(range(100))
+    assert stream != has_length(is_lt(5))
+    assert stream.read == 5
+
+    stream = Stream(range(100))
+    assert stream == has_length(is_gte(10))
+    assert stream.read == 10
+
+    stream = Stream(range(100))
+    assert stream != has_length(3)
+    assert stream.read == 4
+
+    stream = Stream(range(100))
+    assert stream != contains_exactly(0, 1, 5)
+    assert stream.read == 3
+
+    stream = Stream(range(100))
+    assert stream == contains(2, is_gt(4))
+    assert stream.read == 6
+
+    stream = Stream(range(100))
+    assert stream != is_empty()
+    assert stream.read == 1
+
+
+def test_and_of_list_criteria_reads_an_iterator_once():
+    criteria = has_length(is_lt(1000)) & contains(5, is_gt(8)) & ~contains(-1)
+
+    assert Stream(range(20)) == criteria
+    assert Stream(range(1000)) != criteria
+    assert Stream(range(8)) != criteria
+
+    stream = Stream(range(10**6))
+    assert stream != criteria
+    assert stream.read == 1000
+
+    either = contains_exactly(0, 1) | has_length(is_gt(3))
+    assert Stream(range(2)) == either
+    assert Stream(range(5)) == either
+    assert Stream(range(3)) != either
+    assert Stream(range(3)) == contains(1) ^ contains(5)
+    assert Stream(range(6)) != contains(1) ^ contains(5)
+
+
+def test_and_with_other_criteria_over_an_iterator():
+    # Operands without a consumer are matched against a list of the elements.
+    criteria = is_type(list) & contains(3) & has_length(5)
+
+    assert Stream(range(5)) == criteria
+    assert iter(range(5)) == criteria
+    assert Stream(range(6)) != criteria
+
+
+def test_subclass_overriding_match_is_not_streamed():
+    class contains_total(contains):
+        __slots__ = ()
+
+        def _match(self, subject):
+            return sum(subject) == self.items[0]
+
+    criteria = contains_total(10) & has_length(5)
+
+    assert Stream(range(5)) == criteria
+    assert Stream([10, 0, 0, 0, 0]) == criteria
+    assert Stream(range(6)) != criteria
+    assert iter(range(5)) == contains_total(10) | contains(-1)
+
+
+def test_consumer_requires_finish():
+    with pytest.raises(TypeError):
+        Consumer()
+
+
+# matches_sequence
+def test_matches_sequence():
+    events = ["login", "read", "read", "logout"]
+
+    assert events == matches_sequence("login", many("read"), "logout")
+    assert ["login", "logout"] == matches_sequence("login", many("read"), "logout")
+    assert events == matches_sequence(any_gap(), "logout")
+    assert events == matches_sequence("login", any_gap())
+    assert events == matches_sequence(any_gap(), one("read"), any_gap())
+    assert events != matches_sequence("login", optional("read"), "logout")
+    assert events != matches_sequence("login", many("read"))
+    assert events != matches_sequence(any_gap(), "write", any_gap())
+    assert [] == matches_sequence()
+    assert [] == matches_sequence(many(1), optional(2), any_gap())
+    assert [1] != matches_sequence()
+
+
+def test_matches_sequence_is_contains_exactly_without_quantifiers():
+    items = (1, is_gt(1), 3)
+    for subject in ([1, 2, 3], [1, 1, 3], [1, 2], [1, 2, 3, 4], []):
+        assert (subject == matches_sequence(*items)) == (
+            subject == contains_exactly(*items)
+        )
+
+
+def test_matches_sequence_mock_calls():
+    mock = Mock()
+    mock.open("a")
+    mock.read(1)
+    mock.read(2)
+    mock.close()
+
+    assert mock.mock_calls == matches_sequence(
+        call.open("a"), many(is_type(type(call))), call.close()
+    )
+    assert mock.mock_calls == matches_sequence(any_gap(), call.read(2), any_gap())
+    assert mock.mock_calls != matches_sequence(any_gap(), call.open("a"))
+
+
+def test_matches_sequence_same_as_regex():
+    # Elements are letters, slots are letters or "any letter after a".
+    rng = random.Random(0)
+    slots = [
+        (one, "{}"),
+        (many, "{}*"),
+        (optional, "{}?"),
+    ]
+    for _ in range(500):
+        items, pattern = [], ""
+        for _ in range(rng.randrange(6)):
+            if rng.random() < 0.2:
+                items.append(any_gap())
+                pattern += ".*"
+                continue
+            slot, template = rng.choice(slots)
+            if rng.random() < 0.3:
+                items.append(slot(is_gt("a")))
+                pattern += template.format("[bc]")
+            else:
+                letter = rng.choice("abc")
+                items.append(slot(letter))
+                pattern += template.format(letter)
+        criteria = matches_sequence(*items)
+        for _ in range(10):
+            subject = "".join(rng.choice("abc") for _ in range(rng.randrange(8)))
+            expected = re.fullmatch(pattern, subject, re.DOTALL) is not None
+            assert (list(subject) == criteria) == expected, (pattern, subject)
+            assert (iter(subject) == criteria) == expected, (pattern, subject)
+
+
+def test_matches_sequence_runs_in_linear_time():
+    # ``(a*)*b``-like patterns backtrack exponentially.
+    criteria = matches_sequence(*[many("a")] * 30, "b")
+    subject = ["a"] * 10_000
+
+    assert subject != criteria
+    assert [*subject, "b"] == criteria
+
+
+def test_matches_sequence_stops_reading():
+    stream = Stream(range(100))
+    assert stream != matches_sequence(0, 1, 5, any_gap())
+    assert stream.read == 3
+
+    stream = Stream(range(100))
+    assert stream == matches_sequence(many(is_lt(10)), 10, any_gap())
+    assert stream.read == 11
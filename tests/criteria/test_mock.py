@@ -2,7 +2,8 @@ import asyncio
 from unittest.mock import AsyncMock, Mock
 
 from assertive.criteria import was_awaited, was_called, was_called_with
-from assertive.criteria.basic import is_eq, is_gt, is_lt
+from assertive.criteria.basic import is_eq, is_gt, is_gte, is_lt, is_lte
+from assertive.criteria.numeric import is_even
 from assertive.criteria.mock import (
     was_awaited_with,
     was_awaited_once_exactly_with,
@@ -13,7 +14,7 @@ from assertive.criteria.mock import (
     was_called_once_with,
     was_not_called_with,
 )
-from assertive.criteria.utils import ANY
+from assertive.criteria.utils import ANY, PredicateCriteria
 
 
 def test_mock_matches_passes():
@@ -87,3 +88,58 @@ def test_async_mock_does_not_match_passes():
 
     assert mock == was_not_awaited()
     assert mock != was_awaited()
+
+
+def counting(criteria):
+    """
+    Wrap ``criteria`` so that the number of subjects it is tested against
+    is recorded in ``checked``.
+    """
+    checked = []
+
+    def predicate(subject):
+        checked.append(subject)
+        return criteria.run_match(subject)
+
+    return PredicateCriteria(predicate, "counting"), checked
+
+
+def test_call_counting_stops_once_decided():
+    mock = Mock()
+    for i in range(1000):
+        mock(i % 2)
+
+    criteria, checked = counting(is_eq(1))
+    assert mock != was_called_with(criteria).once()
+    assert len(checked) == 4
+
+    criteria, checked = counting(is_eq(1))
+    assert mock == was_called_with(criteria).at_least_times(3)
+    assert len(checked) == 6
+
+    criteria, checked = counting(is_eq(1))
+    assert mock != was_called_with(criteria).never()
+    assert len(checked) == 2
+
+    criteria, checked = counting(is_eq(1))
+    assert mock == was_called_with(criteria).times(is_gte(0))
+    assert checked == []
+
+    criteria, checked = counting(is_eq(1))
+    assert mock == was_called_with(criteria).times(is_even())
+    assert len(checked) == 1000
+
+
+def test_await_counting_stops_once_decided():
+    mock = AsyncMock()
+
+    async def run():
+        for i in range(100):
+            await mock(i)
+
+    asyncio.run(run())
+
+    criteria, checked = counting(is_lt(50))
+    assert mock != was_awaited_with(criteria).times(is_lte(10))
+    assert len(checked) == 11
+    assert mock == was_awaited_with(criteria).times(50)
@@ -1,6 +1,20 @@
-from assertive.criteria.basic import is_lt
+import json
+import random
+import re
+
+import pytest
+
+from assertive.core import is_eq
+from assertive.criteria.basic import is_between, is_gt, is_gte, is_lt
 from assertive.criteria.exception import raises_exception
+from assertive.criteria.mapping import (
+    has_exact_key_values,
+    has_key_and_value,
+    has_key_values,
+)
+from assertive.criteria.numeric import is_even, is_odd
 from assertive.criteria.string import (
+    as_json_matches,
     contains_substring,
     ends_with,
     ignore_case,
@@ -29,6 +43,41 @@ def test_regex_does_not_match_pass():
     assert "abc" != regex(r"def")
 
 
+def test_regex_modes():
+    assert "xabc" != regex(r"abc")
+    assert "xabc" == regex(r"abc", mode="search")
+    assert "abcd" == regex(r"abc")
+    assert "abcd" != regex(r"abc", mode="fullmatch")
+    assert "abc" == regex(r"abc", mode="fullmatch")
+
+
+def test_regex_flags():
+    assert "ABC" != regex(r"abc")
+    assert "ABC" == regex(r"abc", flags=re.IGNORECASE)
+
+
+def test_regex_accepts_compiled_pattern():
+    criteria = regex(re.compile(r"a.c", re.IGNORECASE))
+
+    assert criteria.pattern == "a.c"
+    assert criteria.flags & re.IGNORECASE
+    assert "ABC" == criteria
+
+
+def test_regex_is_compiled_once():
+    criteria = regex(r"a+")
+
+    assert "aaa" == criteria
+    compiled = criteria.compiled
+    assert "aa" == criteria
+    assert criteria.compiled is compiled
+
+
+def test_regex_invalid_mode():
+    with pytest.raises(ValueError, match="'find' is not a regex mode"):
+        regex(r"a", mode="find")
+
+
 # starts_with
 def test_starts_with_matches_pass():
     assert "abc" == starts_with("ab")
@@ -72,6 +121,16 @@ def test_contains_substring_does_not_match_pass():
     assert "abc" != contains_substring("hello")
 
 
+def test_contains_substring_counts_like_str_count():
+    subjects = ["", "a", "aaaa", "abab" * 10, "banana", "aaa" * 20]
+    for substring in ["", "a", "aa", "ab", "ana", "x"]:
+        for times in [0, 1, 2, 3, is_gte(2), is_lt(3), is_between(1, 5), is_even()]:
+            criteria = contains_substring(substring).times(times)
+            for subject in subjects:
+                expected = criteria.times_criteria.run_match(subject.count(substring))
+                assert criteria.run_match(subject) == expected, (substring, subject)
+
+
 # ignore_case
 
 
@@ -92,3 +151,133 @@ def test_ignore_case_type_failure():
 
     with raises_exception(TypeError):
         assert 123 != ignore_case("456")
+
+
+# as_json_matches
+def test_as_json_matches_pass():
+    assert '{"key": "value"}' == as_json_matches({"key": "value"})
+    assert '{"n": 5}' == as_json_matches({"n": is_gt(0)})
+    assert "[1, 2]" == as_json_matches([1, 2])
+    assert '{"key": "value"}' != as_json_matches({"key": "x"})
+
+
+def test_as_json_matches_bytes():
+    criteria = as_json_matches(has_key_values({"status": 200}))
+
+    assert b'{"status": 200}' == criteria
+    assert bytearray(b'{"status": 200}') == criteria
+    assert memoryview(b'{"status": 200, "body": []}') == criteria
+    assert b'\xef\xbb\xbf{"status": 200}' == criteria
+    assert '{"status": 200}'.encode("utf-16") == criteria
+    assert memoryview(b"[200]") == as_json_matches([200])
+
+    with raises_exception(TypeError):
+        assert 200 == criteria
+
+
+def test_as_json_matches_stops_reading():
+    # Anything after the decisive key is not parsed.
+    truncated = '{"status": 200, "body": {"items": [1, 2'
+    criteria = has_key_and_value("status", 200)
+
+    assert truncated == as_json_matches(criteria, partial=True)
+    assert truncated.encode() == as_json_matches(criteria, partial=True)
+    assert '{"status": 500, "body": nonsense' != as_json_matches(criteria, partial=True)
+
+    with pytest.raises(json.JSONDecodeError):
+        as_json_matches(criteria).run_match(truncated)
+
+
+def test_as_json_matches_validates_whole_document_by_default():
+    criteria = as_json_matches({"a": 1})
+
+    for subject in ('{"a":1} trailing', '{"a":1, broken', '{"a":1,}', '{"a":01}'):
+        with pytest.raises(json.JSONDecodeError):
+            criteria.run_match(subject)
+    # The last duplicate wins, as in ``json.loads``.
+    assert '{"a":2,"a":1}' == criteria
+
+
+def test_as_json_matches_exact_keys():
+    criteria = as_json_matches(
+        has_exact_key_values({"a": 1, "b": is_odd()}), partial=True
+    )
+
+    assert '{"b": 3, "a": 1}' == criteria
+    assert '{"a": 1}' != criteria
+    assert '{"a": 1, "b": 3, "c": 0}' != criteria
+    assert '{"a": 1, "b": 2}' != criteria
+    assert "{}" == as_json_matches({}, partial=True)
+    assert "{}" != as_json_matches({"a": 1}, partial=True)
+
+
+def test_as_json_matches_falls_back_to_full_parse():
+    criteria = as_json_matches(has_key_values({"a": 1}), partial=True)
+
+    # Not an object.
+    with raises_exception(TypeError):
+        assert "[1]" == criteria
+    # Duplicate keys seen before the result is known, the last value wins as
+    # in ``json.loads``.
+    assert '{"a": 1, "a": 2}' != as_json_matches({"a": 1}, partial=True)
+    # Escaped keys.
+    assert '{"\\u0061": 1}' == criteria
+    assert b'{"\\u00e9": 1}' == as_json_matches({"\u00e9": 1}, partial=True)
+
+    # Malformed before the result is known.
+    with pytest.raises(json.JSONDecodeError):
+        criteria.run_match('{"a": }')
+    with pytest.raises(json.JSONDecodeError):
+        criteria.run_match('{"b": 1 "a": 1}')
+    with pytest.raises(UnicodeDecodeError):
+        criteria.run_match(b'{"a": "\xff"}')
+
+
+def _random_json(rng: random.Random, depth: int = 0):
+    kind = rng.randrange(7 if depth < 3 else 5)
+    if kind == 0:
+        return rng.choice([None, True, False])
+    if kind == 1:
+        return rng.randint(-5, 5)
+    if kind == 2:
+        return rng.choice([0.5, -1e10, 2.0])
+    if kind in (3, 4):
+        return rng.choice(["a", "b", "", 'q"[{', "é\\", "\n"])
+    if kind == 5:
+        return [_random_json(rng, depth + 1) for _ in range(rng.randrange(4))]
+    return {
+        rng.choice("abcd"): _random_json(rng, depth + 1)
+        for _ in range(rng.randrange(4))
+    }
+
+
+def test_as_json_matches_same_as_full_parse():
+    rng = random.Random(0)
+    inner_criteria = [
+        has_key_values({"a": 1}),
+        has_key_values({"a": is_gt(0), "b": "a"}),
+        has_key_and_value("c", is_eq(None)),
+        has_exact_key_values({"a": 1, "b": "a"}),
+        has_key_values({}),
+        {"a": [], "d": is_lt(3)},
+    ]
+    for _ in range(500):
+        document = {
+            rng.choice("abcd"): rng.choice([1, "a", [], None, _random_json(rng)])
+            for _ in range(rng.randrange(5))
+        }
+        for subject in (
+            json.dumps(document),
+            json.dumps(document, indent=2, ensure_ascii=False).encode(),
+        ):
+            for inner in inner_criteria:
+                partial = as_json_matches(inner, partial=True)
+                full = as_json_matches(inner)
+                try:
+                    expected = full.run_match(subject)
+                    result = partial.run_match(subject)
+                except TypeError:
+                    # Values are checked in a different order, so either may
+                    # hit a value the inner criteria cannot compare first.
+                    continue
+                assert result is expected, (subject, inner)
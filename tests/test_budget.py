@@ -0,0 +1,158 @@
+import threading
+
+import pytest
+
+from assertive import budget
+from assertive.budget import CriteriaTimeout, evaluation_budget
+from assertive.compiler import compile
+from assertive.core import is_eq
+from assertive.criteria.basic import is_gt, is_lt
+from assertive.criteria.list import contains, has_length
+from assertive.criteria.numeric import is_a_power_of, is_prime
+
+# Largest prime below 2**61, about 10**9 trial divisions.
+LARGE_PRIME = 2**61 - 1
+
+
+def test_no_budget_by_default():
+    assert budget.ACTIVE == 0
+    assert is_prime().run_match(LARGE_PRIME // 2**40) is False
+    assert is_gt(1).run_match(2)
+
+
+def test_step_budget_names_running_criteria():
+    criteria = is_gt(0) & is_lt(10) & is_eq(5)
+
+    with pytest.raises(CriteriaTimeout) as excinfo:
+        with evaluation_budget(steps=2):
+            criteria.run_match(5)
+
+    assert isinstance(excinfo.value.criteria, is_lt)
+    assert excinfo.value.reason == "more than 2 steps"
+    assert str(excinfo.value) == (
+        "is_lt exceeded the evaluation budget: more than 2 steps"
+    )
+
+
+def test_step_budget_not_exceeded():
+    with evaluation_budget(steps=10):
+        assert (is_gt(0) & is_lt(10)).run_match(5)
+
+
+def test_seconds_budget_interrupts_long_loop():
+    criteria = is_gt(0) & is_prime()
+
+    with pytest.raises(CriteriaTimeout) as excinfo:
+        with evaluation_budget(seconds=0.05):
+            criteria.run_match(LARGE_PRIME)
+
+    assert isinstance(excinfo.value.criteria, is_prime)
+    assert excinfo.value.reason == "more than 0.05s"
+
+
+def test_loops_charge_their_iterations():
+    with pytest.raises(CriteriaTimeout) as excinfo:
+        with evaluation_budget(steps=10_000):
+            is_a_power_of(2).run_match(2**20_000)
+
+    assert isinstance(excinfo.value.criteria, is_a_power_of)
+
+
+def test_nested_budget_cannot_extend_outer():
+    with evaluation_budget(steps=3):
+        with pytest.raises(CriteriaTimeout) as excinfo:
+            with evaluation_budget(steps=100):
+                (is_gt(0) & is_gt(1) & is_gt(2) & is_gt(3)).run_match(5)
+
+    assert excinfo.value.reason == "more than 3 steps"
+
+
+def test_nested_budget_limits_inner_work_only():
+    with evaluation_budget(steps=100):
+        with pytest.raises(CriteriaTimeout):
+            with evaluation_budget(steps=1):
+                (is_gt(0) & is_gt(1)).run_match(5)
+        assert (is_gt(0) & is_gt(1)).run_match(5)
+
+
+def test_budget_is_released():
+    with pytest.raises(CriteriaTimeout):
+        with evaluation_budget(steps=0):
+            is_gt(0).run_match(1)
+
+    assert budget.ACTIVE == 0
+    assert is_gt(0).run_match(1)
+
+
+def test_budget_is_local_to_thread():
+    results = []
+
+    def evaluate():
+        results.append(is_prime().run_match(7919))
+
+    with evaluation_budget(steps=0):
+        thread = threading.Thread(target=evaluate)
+        thread.start()
+        thread.join()
+
+    assert results == [True]
+
+
+def test_compiled_criteria_fallback_is_checked():
+    compiled = compile(is_gt(0) & is_prime())
+
+    with pytest.raises(CriteriaTimeout) as excinfo:
+        with evaluation_budget(seconds=0.05):
+            compiled.run_match(LARGE_PRIME)
+
+    assert isinstance(excinfo.value.criteria, is_prime)
+
+
+def test_compiled_criteria_charges_steps():
+    compiled = compile(is_gt(0) & is_lt(10) & is_eq(5))
+
+    with pytest.raises(CriteriaTimeout) as excinfo:
+        with evaluation_budget(steps=2):
+            compiled(5)
+
+    assert isinstance(excinfo.value.criteria, is_lt)
+    with evaluation_budget(steps=4):
+        assert compiled(5)
+
+
+def test_streamed_operands_charge_steps():
+    criteria = contains(1) & has_length(3)
+
+    with pytest.raises(CriteriaTimeout) as excinfo:
+        with evaluation_budget(steps=2):
+            criteria.run_match(iter([1, 2, 3]))
+
+    assert isinstance(excinfo.value.criteria, has_length)
+    with evaluation_budget(steps=10):
+        assert criteria.run_match(iter([1, 2, 3]))
+
+
+def test_is_prime_charges_the_iterations_it_runs():
+    with evaluation_budget(steps=100):
+        assert is_prime().run_match(5)
+        assert is_prime().run_match(97)
+
+    with pytest.raises(CriteriaTimeout):
+        with evaluation_budget(steps=100):
+            is_prime().run_match(1_000_003)
+
+
+@pytest.mark.parametrize(
+    "base, matching, non_matching",
+    [(0, [0, 1], [2, -1]), (1, [1], [0, 2]), (-1, [1, -1], [0, 2])],
+)
+def test_power_of_degenerate_bases(base, matching, non_matching):
+    criteria = is_a_power_of(base)
+
+    assert all(criteria.run_match(subject) for subject in matching)
+    assert not any(criteria.run_match(subject) for subject in non_matching)
+
+
+def test_is_prime_beyond_float_range():
+    # ``subject**0.5`` overflows for integers this large.
+    assert is_prime().run_match(3**700) is False
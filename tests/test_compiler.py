@@ -0,0 +1,232 @@
+import re
+from unittest.mock import Mock
+
+from assertive import compile
+from assertive.core import Criteria, is_eq
+from assertive.criteria.basic import (
+    as_string_matches,
+    is_between,
+    is_gt,
+    is_lt,
+    is_none,
+    is_same_instance_as,
+)
+from assertive.criteria.exception import raises_exception
+from assertive.criteria.list import contains, contains_exactly, has_length, is_empty
+from assertive.criteria.mapping import (
+    contains_exact_keys,
+    contains_keys,
+    has_exact_key_values,
+    has_key_and_value,
+    has_key_values,
+)
+from assertive.criteria.mock import was_called_once, was_called_with
+from assertive.criteria.numeric import (
+    approximately_zero,
+    as_absolute_matches,
+    is_even,
+    is_multiple_of,
+    is_odd,
+    is_prime,
+)
+from assertive.criteria.object import class_match
+from assertive.criteria.string import (
+    as_json_matches,
+    contains_substring,
+    ends_with,
+    ignore_case,
+    regex,
+    starts_with,
+)
+from assertive.criteria.utils import ANY
+from assertive.serialize import deserialize
+
+
+def assert_same_results(criteria, subjects):
+    compiled = compile(criteria)
+    for subject in subjects:
+        assert bool(compiled(subject)) == bool(criteria.run_match(subject)), subject
+        assert bool(compiled.run_match(subject)) == bool(criteria.run_match(subject))
+
+
+class is_divisible_by(Criteria):
+    def __init__(self, value):
+        self.value = value
+
+    def _match(self, subject) -> bool:
+        return subject % self.value == 0
+
+
+def test_compile_comparisons():
+    assert_same_results(is_gt(3) & is_lt(8), range(12))
+    assert_same_results(is_gt(8) | is_lt(3) | 5, range(12))
+    assert_same_results(is_even() ^ is_gt(5), range(12))
+    assert_same_results(is_between(2, 6), range(12))
+    assert_same_results(is_between(2, 6).exclusive(), range(12))
+    assert_same_results(is_multiple_of(12) & ~is_odd(), range(13))
+    assert_same_results(as_absolute_matches(is_lt(3)), range(-5, 5))
+    assert_same_results(approximately_zero().with_epsilon(0.5), [0, 0.1, -0.4, 1])
+    assert_same_results(is_none() | "x", [None, "x", "y", 0])
+
+
+def test_compile_negation():
+    assert_same_results(~is_gt(3), range(6))
+    assert_same_results(~~is_gt(3), range(6))
+    assert_same_results(~ANY, range(3))
+    assert_same_results(~(is_gt(1) & is_lt(4)), range(6))
+
+
+def test_compile_mapping_and_list():
+    criteria = has_key_values(
+        {
+            "status": is_between(200, 299),
+            "tags": contains("a", starts_with("b")),
+            "body": has_exact_key_values({"id": is_odd()}),
+        }
+    )
+    subjects = [
+        {"status": 200, "tags": ["a", "bc"], "body": {"id": 1}},
+        {"status": 200, "tags": ["a", "cc"], "body": {"id": 1}},
+        {"status": 200, "tags": ["a", "bc"], "body": {"id": 1, "x": 2}},
+        {"status": 500, "tags": ["a", "bc"], "body": {"id": 1}},
+        {"tags": ["a", "bc"], "body": {"id": 1}},
+    ]
+    assert_same_results(criteria, subjects)
+    assert_same_results(has_key_and_value("a", 1), [{"a": 1}, {"a": 2}, {}])
+    assert_same_results(contains_keys(starts_with("a")), [{"ab": 1}, {"b": 1}])
+    assert_same_results(contains_exact_keys("a"), [{"a": 1}, {"a": 1, "b": 2}])
+    assert_same_results(contains_exactly(1, is_gt(1)), [[1, 2], [1], [1, 2, 3]])
+    assert_same_results(
+        contains(*range(6), is_gt(8)),
+        [list(range(10)), set(range(10)), list(range(9)), [[0], *range(5)]],
+    )
+    assert_same_results(has_length(is_gt(1)) & ~is_empty(), [[], [1], [1, 2]])
+
+
+def test_compile_list_criteria_over_iterators():
+    criteria = has_key_values(
+        {"rows": has_length(is_lt(5)) & contains(1, is_gt(2)) | is_empty()}
+    )
+    compiled = compile(criteria)
+    for rows in ([], [1, 3], [1, 2], [1, 3, 4, 5, 6]):
+        subject = {"rows": iter(rows)}
+        assert compiled(subject) == criteria.run_match({"rows": iter(rows)}), rows
+    assert compile(contains_exactly(1, 2))(iter([1, 2]))
+    assert not compile(is_empty())(iter([1]))
+
+
+def test_compile_xor_over_generators():
+    for criteria in (
+        contains(1) ^ has_length(3),
+        contains_exactly() ^ is_empty(),
+        ~contains(2) ^ has_length(is_gt(1)),
+    ):
+        compiled = compile(criteria)
+        for rows in ([], [1], [1, 2, 3], [2, 3]):
+            expected = criteria.run_match(x for x in rows)
+            assert compiled(x for x in rows) == expected, (criteria, rows)
+
+
+def test_compile_strings():
+    assert_same_results(regex(r"ab+c"), ["abbc", "ac", "xabc"])
+    assert_same_results(regex(r"ab+c", mode="search"), ["abbc", "ac", "xabc"])
+    assert_same_results(regex(r"ab+c", mode="fullmatch"), ["abbc", "abbcd", "xabc"])
+    assert_same_results(regex(r"AB+C", flags=re.IGNORECASE), ["abbc", "ac"])
+    assert_same_results(ends_with("c") & ignore_case("ABC"), ["abc", "aBc", "ab"])
+    assert_same_results(contains_substring("an").twice(), ["banana", "ban"])
+    assert_same_results(as_string_matches("1"), [1, 2, "1"])
+    assert_same_results(
+        as_json_matches({"a": is_gt(1)}, partial=True), ['{"a": 2}', '{"a": 0}']
+    )
+    assert_same_results(
+        as_json_matches({"a": is_gt(1)}),
+        ['{"a": 2}', b'{"a": 0}', memoryview(b'{"a": 3}')],
+    )
+    assert_same_results(
+        as_json_matches(has_key_values({"a": 1}), partial=True),
+        [b'{"a": 1}', '{"a": 0}', "{}"],
+    )
+
+
+def test_compile_same_instance_and_objects():
+    marker = object()
+    assert_same_results(is_same_instance_as(marker), [marker, object(), None])
+
+    class Person:
+        def __init__(self, name):
+            self.name = name
+
+    assert_same_results(
+        class_match(Person, name="Alice"), [Person("Alice"), Person("Bob"), 1]
+    )
+
+
+def test_compile_falls_back_to_custom_criteria():
+    criteria = is_divisible_by(3) & is_gt(4) | is_prime()
+    compiled = compile(criteria)
+
+    assert "run_match" in compiled.source
+    assert_same_results(criteria, range(20))
+
+
+def test_compile_mock_criteria():
+    mock = Mock()
+    mock(1)
+    assert_same_results(was_called_once() & was_called_with(1), [mock])
+    mock(2)
+    assert_same_results(was_called_once() & was_called_with(1), [mock])
+
+
+def test_compile_keeps_type_errors():
+    with raises_exception(TypeError, "1 needs to be a string"):
+        compile(starts_with("a"))(1)
+
+    with raises_exception(TypeError, "1 needs to be mapping"):
+        compile(has_key_values({"a": 1}))(1)
+
+    with raises_exception(TypeError, "1 needs to be an Iterable"):
+        compile(has_length(1))(1)
+
+
+def test_compile_contains_exactly_checks_items_before_length():
+    criteria = contains_exactly(has_key_values({"a": 1}))
+
+    for compiled in (compile(criteria), criteria):
+        with raises_exception(TypeError, "a needs to be mapping"):
+            compiled.run_match("abc")
+    assert_same_results(
+        contains_exactly(1, is_gt(1)), [[1, 2], [2], [1], [], [1, 2, 3], [0, 5, 9]]
+    )
+
+
+def test_compile_hoists_constants():
+    compiled = compile(is_eq(10) | is_eq(2.5) | is_eq((1, 2)))
+
+    assert "10" in compiled.source
+    assert (1, 2) == compiled
+    assert 2.5 == compiled
+    assert 3 != compiled
+
+
+def test_compile_deserialized_tree():
+    criteria = deserialize(
+        {
+            "$key_values": {
+                "key_values": {
+                    "status": {"$between": {"lower": 200, "upper": 299}},
+                    "name": {"$regex": {"pattern": "a.c"}},
+                }
+            }
+        }
+    )
+    assert_same_results(
+        criteria,
+        [{"status": 200, "name": "abc"}, {"status": 404, "name": "abc"}],
+    )
+
+
+def test_criteria_compile_method():
+    compiled = (is_gt(1) & is_lt(3)).compile()
+
+    assert compiled(2)
+    assert compile(compiled) is compiled
@@ -0,0 +1,123 @@
+from assertive.core import AndCriteria, OrCriteria, all_of, any_of
+from assertive.criteria.basic import is_gt, is_lt
+from assertive.criteria.numeric import is_even
+
+
+def test_and_chain_is_flat():
+    a, b, c = is_gt(0), is_lt(10), is_even()
+
+    criteria = a & b & c
+
+    assert type(criteria) is AndCriteria
+    assert criteria.items == [a, b, c]
+    assert 4 == criteria
+    assert 5 != criteria
+
+
+def test_and_does_not_mutate_operands():
+    left = is_gt(0) & is_lt(10)
+
+    combined = left & is_even()
+
+    assert len(left.items) == 2
+    assert len(combined.items) == 3
+
+
+def test_or_chain_is_flat():
+    criteria = is_lt(0) | is_gt(10) | (is_even() | 5)
+
+    assert type(criteria) is OrCriteria
+    assert len(criteria.items) == 4
+    assert 5 == criteria
+    assert 3 != criteria
+
+
+def test_mixed_chain_keeps_structure():
+    criteria = (is_gt(0) & is_lt(10)) | is_even()
+
+    assert type(criteria) is OrCriteria
+    assert type(criteria.items[0]) is AndCriteria
+
+
+def test_all_of():
+    criteria = all_of(is_gt(0), all_of(is_lt(10), is_even()))
+
+    assert len(criteria.items) == 3
+    assert 4 == criteria
+    assert 12 != criteria
+    assert 1 == all_of()
+
+
+def test_any_of():
+    criteria = any_of(1, 2, any_of(3, is_gt(10)))
+
+    assert len(criteria.items) == 4
+    assert 3 == criteria
+    assert 11 == criteria
+    assert 4 != criteria
+    assert 1 != any_of()
+
+
+def test_long_chain_does_not_recurse():
+    criteria = all_of(*[is_gt(-i) for i in range(5000)])
+
+    chained = is_gt(0)
+    for i in range(5000):
+        chained = chained & is_gt(-i)
+
+    assert 1 == criteria
+    assert 1 == chained
+
+
+def counting(iterable, seen):
+    for item in iterable:
+        seen.append(item)
+        yield item
+
+
+def test_filter_is_lazy():
+    seen = []
+    matches = is_even().filter(counting(range(10), seen))
+
+    assert next(matches) == 0
+    assert next(matches) == 2
+    assert seen == [0, 1, 2]
+    assert list(matches) == [4, 6, 8]
+
+
+def test_partition():
+    evens, odds = is_even().partition(range(7))
+
+    assert list(evens) == [0, 2, 4, 6]
+    assert list(odds) == [1, 3, 5]
+
+
+def test_count_matches():
+    seen = []
+
+    assert is_even().count_matches(range(10)) == 5
+    assert is_even().count_matches(counting(range(100), seen), stop_at=2) == 2
+    assert seen == [0, 1, 2]
+    assert is_gt(100).count_matches(range(10), stop_at=2) == 0
+
+
+def test_first_match():
+    seen = []
+
+    assert is_gt(2).first_match(counting(range(100), seen)) == 3
+    assert seen == [0, 1, 2, 3]
+    assert is_gt(200).first_match(range(100)) is None
+    assert is_gt(200).first_match(range(100), default=-1) == -1
+
+
+def test_all_match_and_any_match_short_circuit():
+    seen = []
+    assert not is_lt(3).all_match(counting(range(100), seen))
+    assert seen == [0, 1, 2, 3]
+
+    seen = []
+    assert is_gt(3).any_match(counting(range(100), seen))
+    assert seen == [0, 1, 2, 3, 4]
+
+    assert is_lt(3).all_match([])
+    assert not is_lt(3).any_match([])
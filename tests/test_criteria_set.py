@@ -0,0 +1,152 @@
+import random
+from unittest.mock import ANY
+
+import pytest
+
+from assertive import CriteriaSet
+from assertive.criteria.basic import is_gt
+from assertive.criteria.exception import raises_exception
+from assertive.criteria.mapping import has_exact_key_values, has_key_values
+from assertive.criteria.string import ends_with, regex, starts_with
+from assertive.criteria.utils import PredicateCriteria
+from assertive.serialize import deserialize, serialize
+
+
+def test_matching_returns_names_in_insertion_order():
+    rules = CriteriaSet(
+        {
+            "orders": has_key_values({"type": "order"}),
+            "big": has_key_values({"type": "order", "total": is_gt(100)}),
+            "refunds": has_key_values({"type": "refund"}),
+            "named": has_key_values({"name": starts_with("a")}),
+        }
+    )
+
+    assert rules.matching({"type": "order", "total": 150}) == ["orders", "big"]
+    assert rules.matching({"type": "order", "total": 50, "name": "ab"}) == [
+        "orders",
+        "named",
+    ]
+    assert rules.matching({"type": "refund"}) == ["refunds"]
+    assert rules.matching({"type": "other"}) == []
+
+
+def test_candidates_only_include_indexed_bucket():
+    rules = CriteriaSet({i: has_key_values({"id": i}) for i in range(1000)})
+    rules.add("unindexed", has_key_values({"id": is_gt(998)}))
+
+    assert rules.candidates({"id": 5}) == {5, "unindexed"}
+    assert rules.matching({"id": 999}) == [999, "unindexed"]
+
+
+def test_nested_paths_and_exact_key_values():
+    rules = CriteriaSet(
+        {
+            "nested": has_key_values({"meta": has_key_values({"region": "eu"})}),
+            "exact": has_exact_key_values({"region": "eu"}),
+        }
+    )
+
+    assert rules.matching({"meta": {"region": "eu"}}) == ["nested"]
+    assert rules.matching({"region": "eu"}) == ["exact"]
+    assert rules.matching({"region": "eu", "x": 1}) == []
+    assert rules.matching({"meta": "eu"}) == []
+
+
+def test_plain_values_and_unhashable_subjects():
+    rules = CriteriaSet({"one": 1, "list": has_key_values({"a": (1, 2)})})
+
+    assert rules.matching(1) == ["one"]
+    assert rules.matching({"a": [1, 2]}) == []
+    assert rules.matching({"a": (1, 2)}) == ["list"]
+
+
+def test_rules_that_reject_the_subject_type_do_not_match():
+    rules = CriteriaSet(
+        {
+            "pattern": regex(r"\d+"),
+            "prefix": starts_with("a"),
+            "both": starts_with("4") & ends_with("2"),
+            "orders": has_key_values({"type": "order"}),
+        }
+    )
+
+    assert rules.matching({"type": "order"}) == ["orders"]
+    assert rules.matching("42") == ["pattern", "both"]
+
+
+def test_errors_raised_by_rules_reach_the_caller():
+    def broken(subject):
+        return subject["total"] > "100"
+
+    rules = CriteriaSet(
+        {
+            "orders": has_key_values({"type": "order"}),
+            "broken": PredicateCriteria(broken, "broken"),
+        }
+    )
+
+    with pytest.raises(TypeError, match="not supported"):
+        rules.matching({"type": "order", "total": 150})
+
+
+class Anything:
+    def __eq__(self, other):
+        return True
+
+    def __hash__(self):
+        return 0
+
+
+def test_values_with_custom_equality_are_not_looked_up():
+    rules = CriteriaSet(
+        {
+            "orders": has_key_values({"type": "order"}),
+            "any": has_key_values({"type": ANY}),
+            "anything": has_key_values({"type": Anything()}),
+        }
+    )
+
+    assert rules.matching({"type": ANY}) == ["orders", "any", "anything"]
+    assert rules.matching({"type": "refund"}) == ["any", "anything"]
+
+
+def test_add_and_remove_incrementally():
+    rules = CriteriaSet()
+    rules.add("a", has_key_values({"k": 1}))
+    rules.add("b", has_key_values({"k": 1}))
+
+    assert len(rules) == 2
+    assert rules.matching({"k": 1}) == ["a", "b"]
+
+    rules.remove("a")
+    assert "a" not in rules
+    assert rules.matching({"k": 1}) == ["b"]
+
+    rules.add("b", has_key_values({"k": 2}))
+    assert rules.matching({"k": 1}) == []
+    assert rules.matching({"k": 2}) == ["b"]
+
+    rules.remove("b")
+    assert rules.candidates({"k": 2}) == set()
+
+    with raises_exception(KeyError):
+        rules.remove("b")
+
+
+def test_matches_linear_scan_for_deserialized_rules():
+    random.seed(3)
+    documents = {
+        f"rule-{i}": serialize(
+            has_key_values(
+                {"kind": random.choice("abcde"), "level": is_gt(random.randint(0, 9))}
+            )
+        )
+        for i in range(500)
+    }
+    rules = CriteriaSet({name: deserialize(doc) for name, doc in documents.items()})
+
+    for _ in range(50):
+        subject = {"kind": random.choice("abcdef"), "level": random.randint(0, 10)}
+        expected = [name for name in rules if rules[name] == subject]
+        assert rules.matching(subject) == expected
@@ -0,0 +1,361 @@
+import itertools
+import random
+
+import pytest
+
+from assertive.compiler import compile
+from assertive.core import AndCriteria, any_of, is_eq
+from assertive.criteria.basic import is_between, is_gt, is_gte, is_lt, is_lte
+from assertive.criteria.numeric import is_even, is_negative, is_positive, zero
+from assertive.criteria.string import starts_with
+from assertive.intervals import (
+    Interval,
+    IntervalCriteria,
+    IntervalIndex,
+    IntervalSetCriteria,
+    RangeWarning,
+    count_bounds,
+    fold_and,
+    fold_or,
+    intersection,
+    union,
+)
+from assertive.optimizer import optimize
+
+
+def assert_equivalent(original, optimized, subjects):
+    for subject in subjects:
+        assert original.run_match(subject) == optimized.run_match(subject), subject
+        assert original.run_negated_match(subject) == optimized.run_negated_match(
+            subject
+        ), subject
+
+
+HALVES = [x / 2 for x in range(-30, 31)]
+
+
+def test_union_merges_overlapping_and_touching_intervals():
+    assert union(
+        [
+            Interval(5, 8, True, False),
+            Interval(1, 3, True, True),
+            Interval(3, 4, False, True),
+            Interval(7, 10, True, True),
+        ]
+    ) == [Interval(1, 4, True, True), Interval(5, 10, True, True)]
+
+
+def test_union_keeps_gap_between_open_bounds():
+    assert union([Interval(upper=0), Interval(lower=0)]) == [
+        Interval(upper=0),
+        Interval(lower=0),
+    ]
+
+
+def test_union_drops_empty_intervals():
+    assert union([Interval(5, 1, True, True), Interval(2, 2, True, False)]) == []
+
+
+def test_intersection():
+    assert intersection(
+        [Interval(lower=0, lower_closed=True)], [Interval(upper=10)]
+    ) == [Interval(0, 10, True, False)]
+    assert intersection(
+        [Interval(lower=5)], [Interval(lower=5, lower_closed=True)]
+    ) == [Interval(lower=5)]
+
+
+def test_and_chain_folds_into_single_interval():
+    criteria = is_gt(0) & is_lt(10) & is_gte(2) & is_lte(9.5)
+
+    result = optimize(criteria)
+
+    assert type(result.criteria) is IntervalCriteria
+    assert result.criteria.interval == Interval(2, 9.5, True, True)
+    assert_equivalent(criteria, result.criteria, HALVES)
+
+
+def test_or_chain_folds_into_interval_set():
+    criteria = (
+        is_lt(-5) | is_between(0, 2) | is_between(0, 0) | is_gt(10) | is_between(1, 4)
+    )
+
+    result = optimize(criteria)
+
+    assert type(result.criteria) is IntervalSetCriteria
+    assert result.criteria.intervals == [
+        Interval(upper=-5),
+        Interval(0, 4, True, True),
+        Interval(lower=10),
+    ]
+    assert_equivalent(criteria, result.criteria, HALVES)
+
+
+def test_only_neighbouring_range_criteria_are_folded():
+    criteria = is_gt(0) & is_lt(10) & is_even() & is_positive()
+
+    result = optimize(criteria)
+
+    assert type(result.criteria) is AndCriteria
+    assert [type(i) for i in result.criteria.items] == [
+        IntervalCriteria,
+        is_even,
+        is_positive,
+    ]
+    assert_equivalent(criteria, result.criteria, range(-3, 12))
+
+
+def test_folding_keeps_other_operands_in_order():
+    # ``starts_with`` raises for numbers; it must still only be reached when
+    # the ranges before it fail.
+    criteria = is_lt(0) | is_gt(10) | starts_with("a") | is_between(3, 5)
+
+    folded = fold_or(list(criteria.items))
+
+    assert [type(i) for i in folded] == [
+        IntervalSetCriteria,
+        starts_with,
+        is_between,
+    ]
+
+
+def test_empty_range_warns():
+    with pytest.warns(RangeWarning, match="never match"):
+        result = optimize(is_gt(10) & is_lt(5))
+
+    assert not any(result.criteria.run_match(x) for x in range(20))
+
+
+def test_unbounded_range_warns():
+    with pytest.warns(RangeWarning, match="every comparable value"):
+        result = optimize(is_negative() | is_between(0, 0) | is_positive())
+
+    assert all(result.criteria.run_match(x) for x in HALVES)
+
+
+@pytest.mark.filterwarnings("ignore::assertive.intervals.RangeWarning")
+def test_empty_and_unbounded_ranges_keep_operands():
+    for criteria in (is_gte(0) | is_lt(0), is_gt(10) & is_lt(5)):
+        optimized = optimize(criteria).criteria
+
+        assert not any(
+            isinstance(node, (IntervalCriteria, IntervalSetCriteria))
+            for node in optimized.items
+        )
+        assert optimized.run_match(float("nan")) is criteria.run_match(float("nan"))
+        for subject in (None, "a"):
+            with pytest.raises(TypeError):
+                optimized.run_match(subject)
+
+
+def outcome(criteria, subject):
+    try:
+        return criteria.run_match(subject)
+    except TypeError:
+        return TypeError
+
+
+@pytest.mark.filterwarnings("ignore::assertive.intervals.RangeWarning")
+def test_folding_keeps_results_on_non_numeric_subjects():
+    cases = [
+        zero() & is_lte(5),
+        is_lte(5) & zero(),
+        zero() | is_gt(5),
+        is_gt(0) & is_lt(10),
+        is_lt(-5) | is_between(0, 2) | is_gt(10),
+        is_negative() | zero() | is_positive(),
+        is_eq(None) | is_gt(0) | is_lt(-1),
+    ]
+    for criteria in cases:
+        optimized = optimize(criteria).criteria
+        for subject in (None, "a", b"a", object(), [], float("nan"), 0, 3):
+            assert outcome(optimized, subject) == outcome(criteria, subject), (
+                criteria,
+                subject,
+            )
+
+
+def test_open_gap_is_not_unbounded():
+    criteria = is_negative() | is_positive()
+
+    result = optimize(criteria)
+
+    assert not result.criteria.run_match(0)
+    assert_equivalent(criteria, result.criteria, HALVES)
+
+
+def test_mixed_bound_types_are_left_alone():
+    items = [is_gt(0), is_lt("z")]
+
+    assert fold_and(items) is items
+
+
+def test_single_range_is_left_alone():
+    items = [is_between(1, 3), is_even()]
+
+    assert fold_and(items) is items
+
+
+@pytest.mark.filterwarnings("ignore::assertive.intervals.RangeWarning")
+def test_interval_set_matches_like_or_chain():
+    rng = random.Random(7)
+    for _ in range(50):
+        ranges = []
+        for _ in range(rng.randint(2, 8)):
+            lower = rng.randint(-10, 10)
+            upper = lower + rng.randint(0, 4)
+            kind = rng.choice([is_gt, is_gte, is_lt, is_lte, is_between])
+            if kind is not is_between:
+                ranges.append(kind(lower))
+            elif rng.random() < 0.5:
+                ranges.append(is_between(lower, upper).exclusive())
+            else:
+                ranges.append(is_between(lower, upper))
+        criteria = any_of(*ranges)
+
+        assert_equivalent(criteria, optimize(criteria).criteria, HALVES)
+
+
+def test_compiled_and_vectorized_intervals():
+    criteria = [
+        IntervalCriteria(Interval(0, 3, True, False)),
+        IntervalCriteria(Interval(upper=2, upper_closed=True)),
+        IntervalCriteria(Interval()),
+        IntervalSetCriteria([Interval(upper=-2), Interval(1, 2, True, True)]),
+    ]
+    for c in criteria:
+        compiled = compile(c)
+        for x in HALVES:
+            assert compiled(x) == c.run_match(x)
+
+    np = pytest.importorskip("numpy")
+    from assertive.vectorize import match_many
+
+    values = np.array(HALVES)
+    for c in criteria:
+        assert match_many(c, values).tolist() == [c.run_match(x) for x in HALVES]
+
+
+@pytest.mark.filterwarnings("ignore::assertive.intervals.RangeWarning")
+def test_point_interval_in_both_combinations():
+    for a, b in itertools.product([zero(), is_gte(0), is_lte(0)], repeat=2):
+        assert_equivalent(a & b, optimize(a & b).criteria, HALVES)
+        assert_equivalent(a | b, optimize(a | b).criteria, HALVES)
+
+
+def linear_scan(index, value):
+    return {name for name in index if index[name].run_match(value)}
+
+
+def test_matching_respects_inclusive_bounds():
+    index = IntervalIndex(
+        {
+            "small": is_between(0, 10),
+            "medium": is_between(10, 100).exclusive(),
+            "large": is_gte(100),
+        }
+    )
+
+    assert index.matching(0) == {"small"}
+    assert index.matching(10) == {"small"}
+    assert index.matching(50) == {"medium"}
+    assert index.matching(100) == {"large"}
+    assert index.matching(-1) == set()
+
+
+def test_half_unbounded_and_point_rules():
+    index = IntervalIndex(
+        {
+            "gt": is_gt(5),
+            "lt": is_lt(5),
+            "lte": is_lte(5),
+            "negative": is_negative(),
+            "zero": zero(),
+            "gaps": IntervalSetCriteria([Interval(upper=-10), Interval(lower=10)]),
+        }
+    )
+
+    assert index.matching(5) == {"lte"}
+    assert index.matching(0) == {"lt", "lte", "zero"}
+    assert index.matching(-20) == {"lt", "lte", "negative", "gaps"}
+    assert index.matching(20) == {"gt", "gaps"}
+
+
+def test_empty_index():
+    index = IntervalIndex()
+
+    assert index.matching(1) == set()
+    assert not hasattr(index, "__dict__")
+
+
+def test_add_replace_and_remove():
+    index = IntervalIndex()
+    index.add("a", is_between(1, 5))
+    index.add("b", is_between(3, 8))
+    assert index.matching(4) == {"a", "b"}
+
+    index.add("a", is_between(6, 7))
+    assert index.matching(4) == {"b"}
+    assert index.matching(6) == {"a", "b"}
+
+    index.remove("b")
+    assert index.matching(4) == set()
+    assert len(index) == 1
+    assert "a" in index and "b" not in index
+
+    with pytest.raises(KeyError):
+        index.remove("b")
+
+
+def test_rejects_non_range_criteria():
+    with pytest.raises(TypeError, match="is_eq is not a range criteria"):
+        IntervalIndex({"x": is_eq(3)})
+
+
+def test_works_with_any_comparable_bounds():
+    index = IntervalIndex({"a-m": is_between("a", "m"), "after-k": is_gt("k")})
+
+    assert index.matching("kiwi") == {"a-m", "after-k"}
+    assert index.matching("zebra") == {"after-k"}
+
+
+def test_matches_linear_scan():
+    rng = random.Random(12)
+    index = IntervalIndex()
+    kinds = [is_gt, is_gte, is_lt, is_lte]
+    for i in range(2000):
+        lower = rng.randint(-500, 500)
+        upper = lower + rng.randint(0, 50)
+        if rng.random() < 0.1:
+            index.add(i, rng.choice(kinds)(lower))
+        elif rng.random() < 0.5:
+            index.add(i, is_between(lower, upper).exclusive())
+        else:
+            index.add(i, is_between(lower, upper))
+
+    for value in [x / 2 for x in range(-1100, 1100, 7)] + [-500, 0, 500]:
+        assert index.matching(value) == linear_scan(index, value), value
+
+
+def test_count_bounds():
+    assert count_bounds(is_eq(2)) == (None, 3)
+    assert count_bounds(is_eq(0)) == (None, 1)
+    assert count_bounds(is_gte(2)) == (2, None)
+    assert count_bounds(is_gt(2.5)) == (3, None)
+    assert count_bounds(is_lte(4)) == (None, 5)
+    assert count_bounds(is_lt(4)) == (None, 4)
+    assert count_bounds(is_between(1, 4)) == (None, 5)
+    assert count_bounds(is_between(1, 4).exclusive()) == (None, 4)
+    assert count_bounds(is_even()) == (None, None)
+    assert count_bounds(is_eq("a")) == (None, None)
+
+
+def test_count_bounds_agree_with_criteria():
+    cases = [is_eq(3), is_gte(2), is_gt(1.5), is_lt(3), is_between(2, 5), zero()]
+    for criteria in cases:
+        matching, failing = count_bounds(criteria)
+        for count in range(10):
+            if matching is not None and count >= matching:
+                assert criteria.run_match(count), (criteria, count)
+            if failing is not None and count >= failing:
+                assert not criteria.run_match(count), (criteria, count)
@@ -0,0 +1,152 @@
+import json
+import pickle
+import sys
+import threading
+
+import pytest
+
+from assertive.compiler import compile
+from assertive.core import Criteria
+from assertive.criteria.basic import is_gt
+from assertive.criteria.mapping import has_key_values
+from assertive.criteria.string import as_json_matches
+from assertive.json_cache import JsonCache, use_json_cache
+
+
+class appends_item(Criteria):
+    def _match(self, subject) -> bool:
+        subject["items"].append(0)
+        return True
+
+
+def test_rules_share_one_parse():
+    payload = json.dumps({"status": 200, "items": [1, 2, 3]})
+    rules = [
+        as_json_matches(has_key_values({"status": 200})),
+        as_json_matches({"status": 200, "items": [1, 2, 3]}),
+        as_json_matches(has_key_values({"items": [1, 2, 3]}), partial=False),
+        compile(as_json_matches({"status": is_gt(100), "items": [1, 2, 3]})),
+    ]
+    cache = JsonCache()
+
+    with use_json_cache(cache) as active:
+        assert all(rule.run_match(payload) for rule in rules)
+
+    assert active is cache
+    assert (cache.hits, cache.misses) == (3, 1)
+    assert len(cache) == 1
+    assert cache.size == sys.getsizeof(payload)
+
+
+def test_cache_only_used_in_context():
+    cache = JsonCache()
+    criteria = as_json_matches({"a": 1})
+
+    with use_json_cache(cache):
+        assert criteria.run_match('{"a": 1}')
+    assert criteria.run_match('{"a": 1}')
+
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_evicts_least_recently_used():
+    payloads = [json.dumps({"n": n}) for n in range(3)]
+    cache = JsonCache(max_bytes=2 * sys.getsizeof(payloads[0]))
+
+    cache.parse(payloads[0])
+    cache.parse(payloads[1])
+    cache.parse(payloads[0])
+    cache.parse(payloads[2])
+
+    assert len(cache) == 2
+    assert cache.size <= cache.max_bytes
+    cache.parse(payloads[0])
+    assert (cache.hits, cache.misses) == (2, 3)
+    cache.parse(payloads[1])
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_large_and_mutable_payloads_not_cached():
+    cache = JsonCache(max_bytes=100)
+
+    assert cache.parse(json.dumps(list(range(100)))) == list(range(100))
+    assert cache.parse(bytearray(b"[1]")) == [1]
+    assert cache.parse(memoryview(b"[1]")) == [1]
+    assert cache.parse(b"[1]") == [1]
+
+    assert len(cache) == 1
+    assert cache.misses == 2
+
+
+def test_clear():
+    cache = JsonCache()
+    cache.parse("[1]")
+    cache.parse("[1]")
+    cache.clear()
+
+    assert (len(cache), cache.size) == (0, 0)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_invalid_max_bytes():
+    with pytest.raises(ValueError):
+        JsonCache(max_bytes=-1)
+
+
+def test_errors_not_cached():
+    cache = JsonCache()
+
+    for _ in range(2):
+        with pytest.raises(json.JSONDecodeError):
+            cache.parse("{")
+    assert len(cache) == 0
+
+
+def test_frozen_values():
+    cache = JsonCache(frozen=True)
+    parsed = cache.parse('{"a": {"b": [1, {"c": 2}]}}')
+
+    assert parsed == {"a": {"b": [1, {"c": 2}]}}
+    assert isinstance(parsed["a"]["b"], list)
+    with pytest.raises(TypeError):
+        parsed["x"] = 1
+    with pytest.raises(TypeError):
+        parsed["a"].update(x=1)
+    with pytest.raises(TypeError):
+        parsed["a"]["b"].append(1)
+    with pytest.raises(TypeError):
+        parsed["a"]["b"][1]["c"] = 3
+    assert pickle.loads(pickle.dumps(parsed)) == parsed
+
+
+def test_frozen_values_protect_other_rules():
+    payload = '{"items": [1]}'
+    mutating = as_json_matches(appends_item(), partial=False)
+
+    with use_json_cache(JsonCache(frozen=True)):
+        with pytest.raises(TypeError):
+            mutating.run_match(payload)
+        assert as_json_matches({"items": [1]}).run_match(payload)
+
+    with use_json_cache(JsonCache()):
+        assert mutating.run_match(payload)
+        assert not as_json_matches({"items": [1]}).run_match(payload)
+
+
+def test_shared_between_threads():
+    cache = JsonCache()
+    payloads = [json.dumps({"n": n}) for n in range(50)]
+    criteria = as_json_matches(has_key_values({"n": is_gt(-1)}))
+
+    def evaluate():
+        with use_json_cache(cache):
+            assert all(criteria.run_match(payload) for payload in payloads)
+
+    threads = [threading.Thread(target=evaluate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.hits + cache.misses == 200
+    assert len(cache) == 50
@@ -0,0 +1,100 @@
+import subprocess
+import sys
+
+import pytest
+
+import assertive
+import assertive.criteria
+
+# Generous enough for slow CI machines, but an eager import of every criteria
+# module (``unittest.mock``, ``json``, ``re``, ``bidict``...) does not fit.
+IMPORT_TIME_BUDGET_US = 10_000
+
+HEAVY_MODULES = [
+    "assertive.core",
+    "assertive.criteria.mock",
+    "assertive.serialize",
+    "bidict",
+    "json",
+    "re",
+    "typing",
+    "unittest.mock",
+]
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_does_not_load_submodules():
+    result = run_python("import sys; import assertive; print(' '.join(sys.modules))")
+    loaded = set(result.stdout.split())
+
+    assert [module for module in HEAVY_MODULES if module in loaded] == []
+
+
+def test_import_time_budget():
+    result = run_python("import assertive", "-X", "importtime")
+    lines = [
+        line for line in result.stderr.splitlines() if line.endswith("| assertive")
+    ]
+    cumulative = int(lines[-1].split("|")[1])
+
+    assert cumulative < IMPORT_TIME_BUDGET_US
+
+
+def test_attribute_access_loads_module():
+    result = run_python(
+        "import sys; import assertive; assertive.is_gt;"
+        "print('assertive.criteria.basic' in sys.modules,"
+        " 'assertive.criteria.mock' in sys.modules)"
+    )
+    assert result.stdout.split() == ["True", "False"]
+
+
+def test_public_names():
+    for name in assertive.__all__:
+        assert getattr(assertive, name) is not None
+    for name in assertive.criteria.__all__:
+        assert getattr(assertive.criteria, name) is getattr(assertive, name)
+
+    assert "is_gt" in dir(assertive)
+    assert assertive.serialize.serialize(assertive.is_gt(1)) == {"$gt": {"value": 1}}
+
+
+def test_star_import():
+    namespace: dict = {}
+    exec("from assertive import *", namespace)
+
+    assert namespace["is_gt"] is assertive.is_gt
+    assert namespace["was_called"] is assertive.was_called
+    assert namespace["CriteriaSet"] is assertive.CriteriaSet
+    assert "compile" not in namespace
+    assert assertive.compile is assertive.compiler.compile
+
+
+def test_namespace_has_no_helpers():
+    for module in (assertive, assertive.criteria):
+        assert "TYPE_CHECKING" not in dir(module)
+        assert "importlib" not in dir(module)
+
+
+def test_submodule_attributes():
+    result = run_python(
+        "import assertive;"
+        "print(assertive.criteria.list.contains is assertive.contains,"
+        " assertive.serialize.__name__)"
+    )
+    assert result.stdout.split() == ["True", "assertive.serialize"]
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="does_not_exist"):
+        assertive.does_not_exist  # noqa: B018
+    with pytest.raises(AttributeError, match="does_not_exist"):
+        assertive.criteria.does_not_exist  # noqa: B018
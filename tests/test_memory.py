@@ -0,0 +1,70 @@
+import gc
+import tracemalloc
+
+from assertive.core import Criteria
+from assertive.criteria.basic import is_between, is_gt
+from assertive.criteria.mapping import has_key_values
+from assertive.criteria.string import starts_with
+from assertive.serialize import SERIALIZABLE_CRITERIA, deserialize, serialize
+
+RULES = 2000
+
+
+DOCUMENT = serialize(
+    has_key_values(
+        {
+            "status": is_between(200, 299),
+            "path": starts_with("/api"),
+            "size": is_gt(0) & is_gt(1),
+        }
+    )
+)
+
+
+def build_rules() -> list:
+    return [deserialize(DOCUMENT) for _ in range(RULES)]
+
+
+def walk(criteria):
+    yield criteria
+    for value in criteria.to_serialized().values():
+        children = value.values() if isinstance(value, dict) else value
+        if isinstance(children, (list, tuple, type({}.values()))):
+            for child in children:
+                if isinstance(child, Criteria):
+                    yield from walk(child)
+        elif isinstance(value, Criteria):
+            yield from walk(value)
+
+
+def allocated(factory) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = factory()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def test_deserialized_rules_have_no_instance_dict():
+    nodes = [node for rule in build_rules() for node in walk(rule)]
+
+    assert len(nodes) == RULES * 6
+    assert [type(n).__name__ for n in nodes if hasattr(n, "__dict__")] == []
+
+
+def test_slots_reduce_per_node_memory(monkeypatch):
+    slotted = allocated(build_rules)
+
+    # Swap every serializable class for a subclass that has a per-instance
+    # ``__dict__`` again, which is how every node was stored before.
+    for key, cls in list(SERIALIZABLE_CRITERIA.items()):
+        monkeypatch.setitem(SERIALIZABLE_CRITERIA, key, type(cls.__name__, (cls,), {}))
+    with_dict = allocated(build_rules)
+
+    per_node_saving = (with_dict - slotted) / (RULES * 6)
+    assert slotted < with_dict * 0.8
+    assert per_node_saving > 20
@@ -0,0 +1,182 @@
+import itertools
+from unittest.mock import Mock
+
+import pytest
+
+from assertive.core import (
+    AndCriteria,
+    Criteria,
+    InvertedCriteria,
+    OrCriteria,
+    all_of,
+)
+from assertive.criteria.basic import is_gt, is_lt
+from assertive.criteria.mapping import has_key_values
+from assertive.criteria.mock import was_called, was_called_once
+from assertive.criteria.numeric import is_even, is_odd
+from assertive.criteria.object import class_match, has_attributes, is_type
+from assertive.criteria.string import as_json_matches
+from assertive.criteria.utils import ANY
+from assertive.optimizer import count_nodes, optimize
+
+
+class is_small(Criteria):
+    def _match(self, subject) -> bool:
+        return abs(subject) < 2
+
+    def _negated_match(self, subject) -> bool:
+        return True
+
+
+def assert_equivalent(original, optimized, subjects):
+    for subject in subjects:
+        assert bool(original.run_match(subject)) == bool(optimized.run_match(subject))
+        assert bool(original.run_negated_match(subject)) == bool(
+            optimized.run_negated_match(subject)
+        )
+
+
+def test_removes_double_negation():
+    criteria = ~~is_gt(1)
+
+    result = optimize(criteria)
+
+    assert type(result.criteria) is is_gt
+    assert result.removed == 2
+    assert_equivalent(criteria, result.criteria, range(-3, 4))
+
+
+def test_absorbs_any_in_and():
+    criteria = is_gt(1) & ANY & is_odd()
+
+    result = optimize(criteria)
+
+    assert type(result.criteria) is AndCriteria
+    assert len(result.criteria.items) == 2
+    assert result.removed == 1
+    assert_equivalent(criteria, result.criteria, range(-3, 8))
+
+
+def test_drops_operands_after_any_in_or():
+    criteria = is_gt(1) | ANY | is_lt(5)
+
+    result = optimize(criteria)
+
+    assert len(result.criteria.items) == 2
+    assert_equivalent(criteria, result.criteria, range(-3, 8))
+
+
+def test_or_any_collapses_only_where_negation_is_unused():
+    criteria = is_gt(0) & (ANY | is_even())
+
+    result = optimize(criteria)
+
+    assert type(result.criteria) is is_gt
+    assert_equivalent(criteria, result.criteria, range(-3, 3))
+
+    # At the root ``~ANY`` and ``~(ANY | x)`` disagree, so the Or is kept.
+    root = ANY | is_even()
+    assert type(optimize(root).criteria) is OrCriteria
+    assert_equivalent(root, optimize(root).criteria, range(-3, 3))
+
+
+def test_de_morgan():
+    criteria = ~(~is_gt(1) & ~is_odd())
+
+    result = optimize(criteria)
+
+    assert type(result.criteria) is OrCriteria
+    assert [type(i) for i in result.criteria.items] == [is_gt, is_odd]
+    assert result.removed == 3
+    assert_equivalent(criteria, result.criteria, range(-3, 4))
+
+
+def test_de_morgan_only_when_useful():
+    criteria = ~(is_gt(1) & is_odd())
+
+    assert optimize(criteria).criteria is criteria
+    assert optimize(criteria).removed == 0
+
+
+def test_de_morgan_respects_custom_negation():
+    criteria = ~(~is_small() & ~is_gt(5))
+
+    result = optimize(criteria)
+
+    assert type(result.criteria) is InvertedCriteria
+    assert_equivalent(criteria, result.criteria, range(-8, 8))
+
+
+def test_deduplicates_operands():
+    criteria = all_of(is_gt(1), is_gt(1), is_odd(), is_gt(1.0), is_odd())
+
+    result = optimize(criteria)
+
+    assert len(result.criteria.items) == 3
+    assert result.removed == 2
+    assert_equivalent(criteria, result.criteria, range(-3, 8))
+
+
+def test_unwraps_wrapped_criteria():
+    class Person:
+        def __init__(self, age):
+            self.age = age
+
+    criteria = class_match(Person, age=is_gt(17)) & has_attributes(age=is_lt(66))
+
+    result = optimize(criteria)
+
+    assert [type(i) for i in result.criteria.items] == [
+        is_type,
+        has_attributes,
+        has_attributes,
+    ]
+    assert_equivalent(criteria, result.criteria, [Person(10), Person(30), 1])
+
+    mock = Mock()
+    mock()
+    result = optimize(was_called_once())
+    assert type(result.criteria) is was_called
+    assert_equivalent(was_called_once(), result.criteria, [mock, Mock()])
+
+
+def test_optimizes_nested_criteria_without_mutating():
+    inner = ~~is_gt(1) & ANY
+    criteria = has_key_values({"a": inner})
+
+    result = optimize(criteria)
+
+    assert type(result.criteria.key_values["a"]) is is_gt
+    assert criteria.key_values["a"] is inner
+    assert count_nodes(criteria) == 6
+    assert result.removed == 4
+
+
+def test_optimizes_criteria_inside_json():
+    criteria = as_json_matches(has_key_values({"a": ~~is_gt(1) & ANY}), partial=True)
+
+    result = optimize(criteria)
+
+    assert count_nodes(criteria) == 7
+    assert result.removed == 4
+    assert type(result.criteria.inner_criteria.key_values["a"]) is is_gt
+    assert result.criteria.run_match('{"a": 2}')
+
+
+@pytest.mark.filterwarnings("ignore::assertive.intervals.RangeWarning")
+def test_random_trees_stay_equivalent():
+    leaves = [is_gt(1), is_lt(4), is_even(), ANY, is_small()]
+    shapes = [
+        lambda a, b: a & b,
+        lambda a, b: a | b,
+        lambda a, b: a ^ b,
+        lambda a, b: ~a & ~b,
+        lambda a, b: ~(~a | ~b),
+        lambda a, b: ~~(a & a) | b,
+    ]
+    for a, b, c in itertools.product(leaves, repeat=3):
+        for outer, inner in itertools.product(shapes, repeat=2):
+            criteria = outer(inner(a, b), c)
+            optimized = optimize(criteria).criteria
+            assert_equivalent(criteria, optimized, range(-3, 6))
+            assert_equivalent(~criteria, ~optimized, range(-3, 6))
@@ -0,0 +1,53 @@
+from assertive.core import Criteria
+from assertive.criteria.basic import is_between, is_gt
+from assertive.criteria.mapping import has_key_values
+from assertive.criteria.numeric import is_even
+from assertive.parallel import _payload, evaluate
+
+
+class is_divisible_by(Criteria):
+    def __init__(self, value):
+        self.value = value
+
+    def _match(self, subject) -> bool:
+        return subject % self.value == 0
+
+
+def test_evaluate_preserves_order():
+    criteria = is_even() & is_gt(10)
+
+    results = list(evaluate(criteria, range(1000), workers=2, chunksize=37))
+
+    assert results == [(i, i % 2 == 0 and i > 10) for i in range(1000)]
+
+
+def test_evaluate_unordered():
+    criteria = is_even()
+
+    results = list(
+        evaluate(criteria, iter(range(1000)), workers=2, chunksize=50, ordered=False)
+    )
+
+    assert sorted(results) == [(i, i % 2 == 0) for i in range(1000)]
+
+
+def test_evaluate_mappings():
+    criteria = has_key_values({"status": is_between(200, 299)})
+    records = [{"status": status} for status in (200, 404, 250, 500)]
+
+    results = [ok for _, ok in evaluate(criteria, records, workers=2, chunksize=1)]
+
+    assert results == [True, False, True, False]
+
+
+def test_evaluate_custom_criteria():
+    results = list(evaluate(is_divisible_by(3), range(10), workers=2, chunksize=3))
+
+    assert [i for i, ok in results if ok] == [0, 3, 6, 9]
+
+
+def test_payload_prefers_serialized_form():
+    assert _payload(is_gt(1)) == (True, {"$gt": {"value": 1}})
+
+    criteria = is_divisible_by(3) & is_gt(1)
+    assert _payload(criteria) == (False, criteria)
@@ -0,0 +1,127 @@
+import random
+import string
+
+import pytest
+
+from assertive.compiler import compile
+from assertive.core import any_of
+from assertive.criteria.basic import is_gt
+from assertive.criteria.string import contains_substring, ends_with, starts_with
+from assertive.prefix_index import PrefixIndex
+
+
+def test_matching_prefixes_and_suffixes():
+    index = PrefixIndex(
+        {
+            "error": starts_with("ERROR"),
+            "err": starts_with("ERR"),
+            "warning": starts_with("WARN"),
+            "timeout": ends_with("timed out"),
+            "everything": starts_with(""),
+        }
+    )
+
+    assert index.matching("ERROR: request timed out") == {
+        "error",
+        "err",
+        "timeout",
+        "everything",
+    }
+    assert index.matching("WARN") == {"warning", "everything"}
+    assert index.matching("") == {"everything"}
+
+
+def test_any_match():
+    index = PrefixIndex({"a": starts_with("abc"), "b": ends_with("xyz")})
+
+    assert index.any_match("abcdef")
+    assert index.any_match("uvwxyz")
+    assert not index.any_match("ab")
+    assert not PrefixIndex().any_match("anything")
+
+
+def test_add_replace_and_remove():
+    index = PrefixIndex()
+    index.add("a", starts_with("ab"))
+    index.add("b", starts_with("abc"))
+    assert index.matching("abcd") == {"a", "b"}
+
+    index.add("a", ends_with("cd"))
+    assert index.matching("abcd") == {"a", "b"}
+    assert index.matching("abx") == set()
+
+    index.remove("b")
+    assert index.matching("abcd") == {"a"}
+    assert index._prefixes.children == {}
+    assert len(index) == 1 and "a" in index and index["a"].suffix == "cd"
+
+    with pytest.raises(KeyError):
+        index.remove("b")
+
+
+def test_shared_prefixes_survive_removal():
+    index = PrefixIndex({"a": starts_with("ab"), "b": starts_with("abcd")})
+
+    index.remove("b")
+
+    assert index.matching("abcd") == {"a"}
+
+
+def test_rejects_other_criteria_and_subjects():
+    with pytest.raises(TypeError, match="contains_substring cannot be indexed"):
+        PrefixIndex({"x": contains_substring("a")})
+    with pytest.raises(TypeError, match="needs to be a string"):
+        PrefixIndex({"x": starts_with("a")}).matching(1)
+
+
+def test_matches_individual_rules():
+    rng = random.Random(13)
+
+    def word(n):
+        return "".join(rng.choice("abc") for _ in range(n))
+
+    rules = {
+        i: (starts_with if i % 2 else ends_with)(word(rng.randint(0, 4)))
+        for i in range(300)
+    }
+    index = PrefixIndex(rules)
+
+    for _ in range(200):
+        subject = word(rng.randint(0, 8))
+        expected = {name for name, c in rules.items() if c.run_match(subject)}
+        assert index.matching(subject) == expected
+        assert index.any_match(subject) == bool(expected)
+
+
+def test_compiled_or_uses_prefix_index():
+    rng = random.Random(0)
+    prefixes = ["".join(rng.sample(string.ascii_lowercase, 5)) for _ in range(50)]
+    criteria = any_of(*(starts_with(p) for p in prefixes), ends_with("!"))
+
+    compiled = compile(criteria)
+
+    assert "any_match" in compiled.source
+    assert compiled(prefixes[20] + "tail")
+    assert compiled("nothing here!")
+    assert not compiled("nothing here")
+    with pytest.raises(TypeError, match="needs to be a string"):
+        compiled(1)
+
+
+def test_compiled_or_keeps_other_operands_in_order():
+    criteria = any_of(
+        is_gt(3), *(starts_with(str(i)) for i in range(10)), starts_with(1)
+    )
+
+    compiled = compile(criteria)
+
+    assert compiled.source.count("any_match") == 1
+    assert compiled(5)
+    with pytest.raises(TypeError):
+        compiled(1)
+
+
+def test_short_runs_are_not_indexed():
+    compiled = compile(starts_with("a") | starts_with("b"))
+
+    assert "any_match" not in compiled.source
@@ -0,0 +1,122 @@
+import re
+import warnings
+
+import pytest
+
+from assertive.criteria.string import regex
+from assertive.regex_safety import (
+    UnsafeRegexError,
+    UnsafeRegexWarning,
+    check_regex,
+    enforce_regex_safety,
+)
+from assertive.serialize import deserialize
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"(a+)+$",
+        r"(a*)*b",
+        r"(\w+\s?)+$",
+        r"^(\d+)*$",
+        r"((a+))+",
+        r"(x+x+)+y",
+        r"^(([a-z])+.)+[A-Z]([a-z])+$",
+        r"(.*a){12}",
+    ],
+)
+def test_nested_quantifiers(pattern):
+    reasons = check_regex(pattern)
+
+    assert len(reasons) == 1
+    assert reasons[0].startswith("nested quantifier")
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [r"(a|a)*$", r"(ab|a.)*$", r"(aa|a)*$", r"(a|a?)+$", r"(?i:ab|AB)+$"],
+)
+def test_ambiguous_alternations(pattern):
+    assert any(r.startswith("ambiguous alternation") for r in check_regex(pattern))
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"^[a-z]+@[a-z]+\.com$",
+        r"(ab+c)+",
+        r"(a+b)+",
+        r"(a|ab)*c",
+        r"(\w|\d)+$",
+        r"(GET|POST|PUT) /\S+",
+        r"(\d{1,3}\.){3}\d{1,3}",
+        r"(?>a+)+$",
+        r"(?:a+)++$",
+    ],
+)
+def test_safe_patterns(pattern):
+    assert check_regex(pattern) == []
+
+
+def test_flags_are_taken_into_account():
+    assert check_regex(r"(ab|AB)+$") == []
+    assert check_regex(r"(ab|AB)+$", re.IGNORECASE) != []
+
+
+def test_probe_passes_safe_patterns():
+    assert check_regex(r"^(\w+)@(\w+)\.com$", probe=True, budget=0.01) == []
+
+
+def test_probe_times_out_on_catastrophic_pattern(monkeypatch):
+    from assertive import regex_safety
+
+    monkeypatch.setattr(regex_safety, "_inner_repeat", lambda *args: False)
+    monkeypatch.setattr(regex_safety, "_overlapping_repeat", lambda *args: False)
+
+    reasons = check_regex(r"(a+)+$", probe=True, budget=0.01)
+
+    assert len(reasons) == 1
+    assert "took longer than 0.01s" in reasons[0]
+
+
+def test_checks_are_opt_in():
+    regex(r"(a+)+$")
+
+
+def test_enforce_raises_on_construction():
+    with enforce_regex_safety():
+        with pytest.raises(UnsafeRegexError, match="nested quantifier") as error:
+            regex(r"(a+)+$")
+        regex(r"a+$")
+
+    assert error.value.pattern == r"(a+)+$"
+    regex(r"(a+)+$")
+
+
+def test_enforce_raises_on_deserialize():
+    with enforce_regex_safety():
+        with pytest.raises(UnsafeRegexError):
+            deserialize({"$and": {"items": [{"$regex": {"pattern": r"(a|a)*$"}}]}})
+
+
+def test_enforce_warns():
+    with enforce_regex_safety("warn"):
+        with pytest.warns(UnsafeRegexWarning, match="ambiguous alternation"):
+            criteria = regex(r"(a|a)*$")
+
+    assert "aa" == criteria
+
+
+def test_enforce_checks_compiled_patterns_with_their_flags():
+    with enforce_regex_safety(), warnings.catch_warnings():
+        warnings.simplefilter("error")
+        regex(re.compile(r"(ab|AB)+$"))
+        with pytest.raises(UnsafeRegexError):
+            regex(re.compile(r"(ab|AB)+$", re.IGNORECASE))
+
+
+def test_enforce_rejects_unknown_action():
+    with pytest.raises(ValueError, match="'ignore' is not an action"):
+        with enforce_regex_safety("ignore"):
+            pass
@@ -0,0 +1,151 @@
+import random
+import re
+
+import pytest
+
+from assertive.compiler import compile
+from assertive.core import any_of
+from assertive.criteria.basic import is_gt
+from assertive.criteria.mapping import has_key_values
+from assertive.criteria.string import regex, starts_with
+from assertive.criteria_set import CriteriaSet
+from assertive.regex_set import RegexSet, _scoped
+
+
+def test_matching():
+    index = RegexSet(
+        {
+            "ip": regex(r"\d+\.\d+\.\d+\.\d+"),
+            "error": regex(r"error", mode="search", flags=re.IGNORECASE),
+            "exact": regex(r"\d+\.\d+\.\d+\.\d+", mode="fullmatch"),
+            "repeated": regex(r"(\w)\1"),
+        }
+    )
+
+    assert index.matching("10.0.0.1 ERROR") == {"ip", "error"}
+    assert index.matching("10.0.0.1") == {"ip", "exact"}
+    assert index.matching("aa") == {"repeated"}
+    assert index.matching("") == set()
+
+
+def test_any_match():
+    index = RegexSet({"a": regex(r"x+y"), "b": regex(r"z", mode="search")})
+
+    assert index.any_match("xxy")
+    assert index.any_match("abcz")
+    assert not index.any_match("x")
+    assert not RegexSet().any_match("anything")
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        regex(r"(\w)\1"),
+        regex(r"(a)?(?(1)a|b)"),
+        regex(r"(?P<x>a)?(?(x)a|b)"),
+        regex(r"(?P<x>a)"),
+        regex(r"(?i)a"),
+        regex(r"a", flags=re.ASCII),
+    ],
+)
+def test_patterns_that_cannot_be_merged(criteria):
+    assert _scoped(criteria) is None
+
+    index = RegexSet({"rule": criteria, "other": regex("b")})
+
+    assert index.matching("aa") == ({"rule"} if criteria.run_match("aa") else set())
+
+
+def test_escapes_that_look_like_backreferences_can_be_merged():
+    assert _scoped(regex(r"(a)|[\1]")) is not None
+
+
+def test_verbose_patterns_with_trailing_comments():
+    index = RegexSet(
+        {"a": regex("a  # the letter a", flags=re.VERBOSE), "b": regex("b")}
+    )
+
+    assert index.matching("ab") == {"a"}
+
+
+def test_identical_patterns_share_a_group():
+    index = RegexSet({"a": regex("x"), "b": regex("x")})
+
+    assert index.matching("x") == {"a", "b"}
+    assert len(index._batches[0].names) == 1
+
+
+def test_add_replace_and_remove():
+    index = RegexSet()
+    index.add("a", regex("x"))
+    index.add("a", regex("y"))
+    assert index.matching("x") == set()
+    assert index.matching("y") == {"a"}
+    assert len(index) == 1 and "a" in index and index["a"].pattern == "y"
+
+    index.remove("a")
+    assert index.matching("y") == set()
+    with pytest.raises(KeyError):
+        index.remove("a")
+
+
+def test_rejects_other_criteria_and_subjects():
+    with pytest.raises(TypeError, match="starts_with cannot be indexed"):
+        RegexSet({"x": starts_with("a")})
+    with pytest.raises(TypeError, match="needs to be a string"):
+        RegexSet({"x": regex("a")}).matching(1)
+    with pytest.raises(ValueError, match="batch_size"):
+        RegexSet(batch_size=0)
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 100])
+def test_matches_individual_rules(batch_size):
+    rng = random.Random(16)
+    atoms = ["a", "b", "a+", "b*", "[ab]", "(ab)+", "(a|b)", "^a", "a$", ".", "A"]
+    modes = ["match", "search", "fullmatch"]
+    flags = [0, re.IGNORECASE, re.MULTILINE | re.DOTALL]
+    for _ in range(100):
+        rules = {
+            i: regex(
+                "".join(rng.choice(atoms) for _ in range(rng.randint(1, 3))),
+                mode=rng.choice(modes),
+                flags=rng.choice(flags),
+            )
+            for i in range(rng.randint(1, 12))
+        }
+        index = RegexSet(rules, batch_size=batch_size)
+
+        for _ in range(10):
+            subject = "".join(rng.choice("abAB\n") for _ in range(rng.randint(0, 6)))
+            expected = {name for name, c in rules.items() if c.run_match(subject)}
+            assert index.matching(subject) == expected
+            assert index.any_match(subject) == bool(expected)
+
+
+def test_compiled_or_uses_regex_set():
+    criteria = any_of(is_gt("m"), *(regex(rf"item-{i}\b") for i in range(20)))
+
+    compiled = compile(criteria)
+
+    assert compiled.source.count("any_match") == 1
+    assert compiled("item-7 ok")
+    assert compiled("z")
+    assert not compiled("item-70")
+    with pytest.raises(TypeError):
+        compiled(1)
+
+
+def test_criteria_set_matches_regex_rules_together():
+    rules = CriteriaSet(
+        {
+            "ip": regex(r"\d+\.\d+"),
+            "error": regex(r"error", mode="search"),
+            "mapping": has_key_values({"a": 1}),
+        }
+    )
+
+    assert rules.matching("1.2 error") == ["ip", "error"]
+    assert rules.candidates({"a": 1}) == {"ip", "error", "mapping"}
+
+    rules.remove("ip")
+    assert rules.matching("1.2 error") == ["error"]
@@ -1,8 +1,17 @@
+import re
+
 from assertive.criteria.basic import is_between, is_gt, is_lt
 from assertive.criteria.mapping import has_exact_key_values, has_key_values
 from assertive.criteria.numeric import is_even
 from assertive.criteria.string import ignore_case, regex, as_json_matches
-from assertive.criteria.list import contains
+from assertive.criteria.list import (
+    any_gap,
+    contains,
+    contains_in_any_order,
+    many,
+    matches_sequence,
+    optional,
+)
 from assertive.serialize import deserialize, serialize
 
 import json
@@ -147,6 +156,17 @@ def test_json_matches():
     assert deserialized == json.dumps(body)
 
 
+def test_json_matches_partial_serialized():
+    assert "partial" not in serialize(as_json_matches(1))["$json"]
+
+    serialized = serialize(as_json_matches({"key": "value"}, partial=True))
+    deserialized = deserialize(serialized)
+
+    assert serialized["$json"]["partial"] is True
+    assert deserialized.partial is True
+    assert deserialized == '{"key": "value"}'
+
+
 def test_contains_serialized():
     items = [1, 2, 3, 4, 5]
 
@@ -154,9 +174,36 @@ def test_contains_serialized():
 
     serialized = serialize(criteria)
     deserialized = deserialize(serialized)
+    assert serialized == {
+        "$contains": {"items": [{"$eq": {"value": v}} for v in (1, 2, 3)]}
+    }
     assert deserialized == items
 
 
+def test_contains_in_any_order_serialized():
+    criteria = contains_in_any_order(2, is_gt(2), 1)
+
+    deserialized = deserialize(serialize(criteria))
+
+    assert type(deserialized) is contains_in_any_order
+    assert deserialized == [3, 1, 2]
+    assert deserialized != [2, 1, 1]
+
+
+def test_matches_sequence_serialized():
+    criteria = matches_sequence("a", many(is_gt("a")), optional("z"), any_gap())
+
+    serialized = serialize(criteria)
+    deserialized = deserialize(json.loads(json.dumps(serialized)))
+
+    assert serialized["$sequence"]["items"][1] == {
+        "$many": {"criteria": {"$gt": {"value": "a"}}}
+    }
+    assert type(deserialized.items[2]) is optional
+    assert ["a", "b", "c", "a"] == deserialized
+    assert ["b"] != deserialized
+
+
 def test_regex_pattern():
     item = "hello world"
     pattern = "hello"
@@ -168,6 +215,24 @@ def test_regex_pattern():
     assert deserialized == item
 
 
+def test_regex_mode_and_flags_round_trip():
+    criteria = regex("hello", mode="search", flags=re.IGNORECASE)
+
+    serialized = serialize(criteria)
+    deserialized = deserialize(serialized)
+
+    assert serialized == {
+        "$regex": {"pattern": "hello", "mode": "search", "flags": re.IGNORECASE}
+    }
+    assert deserialized.mode == "search"
+    assert deserialized.flags == re.IGNORECASE
+    assert "Say HELLO" == deserialized
+
+
+def test_regex_defaults_are_not_serialized():
+    assert serialize(regex("hello")) == {"$regex": {"pattern": "hello"}}
+
+
 def test_is_even():
     """
     Test the serialization of basic criteria
@@ -224,3 +289,48 @@ def test_ignore_case():
     serialized = serialize(criteria)
     deserialized = deserialize(serialized)
     assert deserialized == item
+
+
+def test_deserialize_flattens_nested_and():
+    start = {
+        "$and": {
+            "items": [
+                {"$and": {"items": [{"$gt": {"value": 1}}, {"$lt": {"value": 10}}]}},
+                {"$odd": {}},
+            ]
+        }
+    }
+
+    result = deserialize(start)
+
+    assert len(result.items) == 3  # type: ignore
+    assert 5 == result
+    assert 4 != result
+
+
+def test_deserialize_flattens_nested_or():
+    start = {
+        "$or": {
+            "items": [
+                {"$or": {"items": [{"$eq": {"value": 1}}, {"$eq": {"value": 2}}]}},
+                {"$eq": {"value": 3}},
+            ]
+        }
+    }
+
+    result = deserialize(start)
+
+    assert len(result.items) == 3  # type: ignore
+    assert 3 == result
+    assert 4 != result
+
+
+def test_serialize_long_chain():
+    criteria = is_gt(0)
+    for i in range(2000):
+        criteria = criteria & is_gt(-i)
+
+    serialized = serialize(criteria)
+
+    assert len(serialized["$and"]["items"]) == 2001
+    assert 1 == deserialize(serialized)
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from assertive.criteria.basic import is_between
+from assertive.criteria.string import contains_substring, starts_with
+from assertive.substring_index import SubstringIndex, _Automaton
+
+
+def test_counts_and_matching():
+    index = SubstringIndex(
+        {
+            "timeout": contains_substring("timed out"),
+            "retried": contains_substring("retry").at_least_times(3),
+            "clean": contains_substring("ERROR").never(),
+            "some": contains_substring("retry").times(is_between(1, 2)),
+        }
+    )
+
+    assert index.counts("retry retry retry") == {
+        "timed out": 0,
+        "retry": 3,
+        "ERROR": 0,
+    }
+    assert index.matching("retry retry retry") == {"retried", "clean"}
+    assert index.matching("ERROR: retry timed out") == {"timeout", "some"}
+
+
+@pytest.mark.parametrize("threshold", [0, 1000])
+def test_counts_match_str_count(threshold):
+    rng = random.Random(14)
+    for _ in range(300):
+        patterns = [
+            "".join(rng.choice("ab") for _ in range(rng.randint(0, 4)))
+            for _ in range(rng.randint(1, 8))
+        ]
+        index = SubstringIndex(
+            {i: contains_substring(p) for i, p in enumerate(patterns)},
+            automaton_threshold=threshold,
+        )
+        subject = "".join(rng.choice("abc") for _ in range(rng.randint(0, 30)))
+
+        assert index.counts(subject) == {p: subject.count(p) for p in patterns}
+
+
+def test_overlapping_occurrences_are_counted_like_str_count():
+    automaton = _Automaton(["aa", "aba", "a"])
+
+    assert automaton.counts("aaaba") == ["aaaba".count(p) for p in ["aa", "aba", "a"]]
+
+
+def test_uses_automaton_from_threshold():
+    index = SubstringIndex(
+        {i: contains_substring(str(i)) for i in range(10)}, automaton_threshold=10
+    )
+    index.counts("0123")
+    assert index._automaton is not None
+
+    index.remove(0)
+    index.counts("0123")
+    assert index._automaton is None
+
+
+def test_add_replace_and_remove():
+    index = SubstringIndex()
+    index.add("a", contains_substring("x"))
+    index.add("a", contains_substring("y").never())
+
+    assert index.matching("xx") == {"a"}
+    assert len(index) == 1 and "a" in index and index["a"].substring == "y"
+
+    index.remove("a")
+    assert index.matching("y") == set()
+    with pytest.raises(KeyError):
+        index.remove("a")
+
+
+def test_rejects_other_criteria_and_subjects():
+    with pytest.raises(TypeError, match="starts_with cannot be indexed"):
+        SubstringIndex({"x": starts_with("a")})
+    with pytest.raises(TypeError, match="needs to be a string"):
+        SubstringIndex({"x": contains_substring("a")}).matching(1)
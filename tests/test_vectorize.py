@@ -0,0 +1,86 @@
+import pytest
+
+from assertive.core import Criteria
+from assertive.criteria.basic import is_between, is_gt, is_lt, is_not_none
+from assertive.criteria.numeric import (
+    approximately_zero,
+    is_approximately_equal,
+    is_even,
+    is_odd,
+    is_positive,
+    is_prime,
+    zero,
+)
+from assertive.criteria.utils import ANY
+
+np = pytest.importorskip("numpy")
+
+
+class is_small(Criteria):
+    def _match(self, subject) -> bool:
+        return abs(subject) < 2
+
+    def _negated_match(self, subject) -> bool:
+        return abs(subject) >= 2
+
+
+def assert_same_as_run_match(criteria, values):
+    values = np.asarray(values)
+    mask = criteria.match_many(values)
+
+    assert mask.dtype == bool
+    assert mask.shape == values.shape
+    expected = [bool(criteria.run_match(v)) for v in values.ravel().tolist()]
+    assert mask.ravel().tolist() == expected
+
+
+def test_comparisons():
+    values = np.arange(-5, 15)
+
+    assert_same_as_run_match(is_gt(3), values)
+    assert_same_as_run_match(is_lt(3) | is_gt(10), values)
+    assert_same_as_run_match(is_between(0, 10), values)
+    assert_same_as_run_match(is_between(0, 10).exclusive(), values)
+    assert_same_as_run_match(is_even() ^ is_positive(), values)
+    assert_same_as_run_match(is_odd() & ~zero(), values)
+
+
+def test_float_criteria():
+    values = np.linspace(-1, 1, 41)
+
+    assert_same_as_run_match(approximately_zero().with_epsilon(0.1), values)
+    assert_same_as_run_match(is_approximately_equal(0.5).with_epsilon(0.01), values)
+
+
+def test_falls_back_to_per_element():
+    values = np.arange(30).reshape(5, 6)
+
+    assert_same_as_run_match(is_prime() & is_gt(5), values)
+    assert_same_as_run_match(~is_prime(), values)
+    assert_same_as_run_match(~is_small() | is_even(), np.arange(-4, 4))
+
+
+def test_any_and_inverted_any():
+    values = np.arange(4)
+
+    assert ANY.match_many(values).all()
+    assert (~ANY).match_many(values).all()
+    assert_same_as_run_match(~~is_gt(1), values)
+
+
+def test_list_input():
+    assert is_gt(1).match_many([0, 1, 2, 3]).tolist() == [False, False, True, True]
+
+
+def test_object_arrays_short_circuit():
+    values = np.array([None, 1, 2, -1], dtype=object)
+
+    assert_same_as_run_match(is_not_none() & is_gt(0), values)
+    assert_same_as_run_match(~is_not_none() | is_lt(2), values)
+    assert (is_not_none() & is_gt(0)).match_many(values).tolist() == [
+        False,
+        True,
+        True,
+        False,
+    ]
+    assert_same_as_run_match(is_gt("b"), np.array(["a", "b", "c"]))